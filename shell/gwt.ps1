@@ -19,10 +19,14 @@ function gwt {
         return
     }
 
-    # Temp file for CD communication
-    $tmpCdFile = [System.IO.Path]::GetTempFileName()
-    
-    # Set Env Var
+    # CD communication: an anonymous pipe whose inheritable write handle is
+    # passed in GWT_CD_FD (no temp file). GWT_CD_FILE is only used as a
+    # fallback when gwt cannot write to the handle.
+    $pipe = New-Object System.IO.Pipes.AnonymousPipeServerStream([System.IO.Pipes.PipeDirection]::In, [System.IO.HandleInheritability]::Inheritable)
+    $tmpCdFile = Join-Path ([System.IO.Path]::GetTempPath()) ("gwt_cd_target_" + $PID)
+
+    # Set Env Vars
+    $env:GWT_CD_FD = $pipe.GetClientHandleAsString()
     $env:GWT_CD_FILE = $tmpCdFile
 
     try {
@@ -31,21 +35,31 @@ function gwt {
         python $pyScript $Args
     }
     finally {
-        # Check for CD request
+        # Clean Env Vars
+        Remove-Item Env:\GWT_CD_FD -ErrorAction SilentlyContinue
+        Remove-Item Env:\GWT_CD_FILE -ErrorAction SilentlyContinue
+
+        # Drop our copy of the write end so ReadToEnd sees EOF once gwt has exited
+        $pipe.DisposeLocalCopyOfClientHandle()
+        $reader = New-Object System.IO.StreamReader($pipe)
+        $lines = @($reader.ReadToEnd() -split "`r?`n" | Where-Object { $_ })
+        $reader.Dispose()
+        $targetDir = if ($lines.Count -gt 0) { $lines[-1] } else { $null }
+
+        # Fallback: temp file
         if (Test-Path $tmpCdFile) {
             $targetDir = Get-Content -Path $tmpCdFile -ErrorAction SilentlyContinue
-            if (-not [string]::IsNullOrWhiteSpace($targetDir)) {
-                # Trim whitespace
-                $targetDir = $targetDir.Trim()
-                if (Test-Path $targetDir) {
-                    Set-Location -Path $targetDir
-                }
-            }
             Remove-Item -Path $tmpCdFile -ErrorAction SilentlyContinue
         }
-        
-        # Clean Env Var
-        Remove-Item Env:\GWT_CD_FILE -ErrorAction SilentlyContinue
+
+        # Check for CD request
+        if (-not [string]::IsNullOrWhiteSpace($targetDir)) {
+            # Trim whitespace
+            $targetDir = $targetDir.Trim()
+            if (Test-Path $targetDir) {
+                Set-Location -Path $targetDir
+            }
+        }
     }
 }
 
@@ -97,6 +111,8 @@ if (Get-Command Register-ArgumentCompleter -ErrorAction SilentlyContinue) {
         try {
             $results = python $pyScript __complete --cmd=$cmd --cur=$wordToComplete --prev=$prev
             foreach ($res in $results) {
+                # ":message" lines are hints, not candidates
+                if ($res.StartsWith(":")) { continue }
                 # Split value:description
                 $parts = $res -split ":", 2
                 $val = $parts[0]
@@ -12,6 +12,31 @@ if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
 
+
+def _start_profiler(argv):
+    """`--cprofile[=FILE]`: profile everything from here on, gwt's own imports included.
+
+    Taken off argv before argparse sees it; completion requests are left alone.
+    Returns (profiler or None, FILE or None).
+    """
+    if len(argv) > 1 and argv[1] == "__complete":
+        return None, None
+    for i, tok in enumerate(argv[1:], 1):
+        if tok == "--":
+            break
+        if tok == "--cprofile" or tok.startswith("--cprofile="):
+            import cProfile
+
+            del argv[i]
+            profiler = cProfile.Profile()
+            profiler.enable()
+            return profiler, tok.partition("=")[2] or None
+    return None, None
+
+
+# Started before the gwtlib imports below so that their cost is profiled too.
+_PROFILE = _start_profiler(sys.argv)
+
 from gwtlib.completion import cmd_completion
 from gwtlib.config import get_effective_config
 from gwtlib.errors import GWTError
@@ -53,6 +78,22 @@ def _init_language(argv):
 
 
 def main():
+    global _PROFILE
+    # Normally started at import; a caller that imported gwt earlier (tests,
+    # embedding) gets it started here. Reported once, by whoever runs main().
+    profiler, path = _PROFILE if _PROFILE[0] else _start_profiler(sys.argv)
+    _PROFILE = (None, None)
+    try:
+        _run()
+    finally:
+        if profiler:
+            from gwtlib.profiling import report
+
+            command = next((a for a in sys.argv[1:] if not a.startswith("-")), None)
+            report(profiler, path, command)
+
+
+def _run():
     _init_language(sys.argv[1:])
 
     if "-h" in sys.argv or "--help" in sys.argv:
@@ -4,6 +4,7 @@
 from gwtlib.config import (
     DEFAULT_CONFIG,
     DEFAULT_MODELS,
+    GWT_CD_FD_ENV,
     GWT_CD_FILE_ENV,
     GWT_CONFIG_DIR,
     GWT_CONFIG_FILE,
@@ -20,6 +21,10 @@ from gwtlib.config import (
 from gwtlib.utils import (
     run_cmd,
     git_output,
+    run_cmd_async,
+    git_output_async,
+    gather_cmds,
+    git_outputs,
     request_cd,
     get_main_worktree,
     is_inside_worktree,
@@ -35,6 +40,7 @@ __all__ = [
     # Config
     'DEFAULT_CONFIG',
     'DEFAULT_MODELS',
+    'GWT_CD_FD_ENV',
     'GWT_CD_FILE_ENV',
     'GWT_CONFIG_DIR',
     'GWT_CONFIG_FILE',
@@ -49,6 +55,10 @@ __all__ = [
     # Utils
     'run_cmd',
     'git_output',
+    'run_cmd_async',
+    'git_output_async',
+    'gather_cmds',
+    'git_outputs',
     'request_cd',
     'get_main_worktree',
     'is_inside_worktree',
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""GWT Artifact Seeding
+
+After `gwt new`, ignored build artifacts (`node_modules`, `.venv`, `target/`,
+...) matching the configured globs are cloned from a source worktree instead
+of being rebuilt:
+
+- reflink (FICLONE on Linux, clonefile on macOS) when the filesystem supports it
+- otherwise hardlink (opt-in) or a plain copy
+- files are cloned on a thread pool
+"""
+import ctypes
+import errno
+import fnmatch
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from gwtlib.i18n import t
+from gwtlib.utils import (
+    format_size,
+    get_main_worktree,
+    git_output,
+    git_outputs,
+    is_pool_worktree,
+    list_worktrees,
+    print_colored,
+)
+
+# ioctl request number for FICLONE (linux/fs.h).
+FICLONE = 0x40049409
+
+_REFLINK_UNSUPPORTED = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS)
+
+
+def get_artifact_settings(config):
+    settings = config.get("artifacts") or {}
+    return {
+        "patterns": [p for p in settings.get("patterns", []) if p],
+        "source": settings.get("source", "auto"),
+        "mode": settings.get("mode", "auto"),
+        "workers": settings.get("workers", 0) or min(32, (os.cpu_count() or 2) * 4),
+    }
+
+
+def match_artifact(rel_path, patterns):
+    """True if an ignored path matches one of the globs (full path or basename)."""
+    rel_path = rel_path.replace("\\", "/").rstrip("/")
+    name = rel_path.rsplit("/", 1)[-1]
+    return any(fnmatch.fnmatch(rel_path, p) or fnmatch.fnmatch(name, p) for p in patterns)
+
+
+def find_artifacts(source, patterns):
+    """Lists ignored paths in `source` that match the artifact globs."""
+    out = git_output(["-C", source, "ls-files", "--others", "--ignored", "--exclude-standard", "--directory"])
+    if not out:
+        return []
+    return [p.rstrip("/") for p in out.splitlines() if p and match_artifact(p, patterns)]
+
+
+def pick_source_worktree(target_path, base, strategy="auto"):
+    """Picks the worktree to seed from.
+
+    `auto` chooses the worktree whose HEAD is closest (ahead + behind) to
+    `base`; ties and failures fall back to the main worktree.
+    """
+    main = get_main_worktree()
+    if strategy == "main" or not base:
+        return main
+    if strategy not in ("auto", "main"):
+        return strategy if os.path.isdir(strategy) else main
+
+    norm_target = os.path.normcase(os.path.normpath(target_path))
+    candidates = [
+        wt for wt in list_worktrees()
+        if wt["head"] and not wt["bare"] and not wt["prunable"]
+        and not is_pool_worktree(wt["path"])
+        and os.path.normcase(os.path.normpath(wt["path"])) != norm_target
+    ]
+    if not candidates:
+        return main
+
+    counts = git_outputs(
+        [["rev-list", "--count", "--left-right", f"{base}...{wt['head']}"] for wt in candidates]
+    )
+    best, best_distance = main, None
+    for wt, out in zip(candidates, counts):
+        if out is None:
+            continue
+        try:
+            distance = sum(int(x) for x in out.split())
+        except ValueError:
+            continue
+        if best_distance is None or distance < best_distance or (
+            distance == best_distance and wt["path"] == main
+        ):
+            best, best_distance = wt["path"], distance
+    return best
+
+
+def _reflink(src, dst):
+    if sys.platform == "darwin":
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        return
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+class _Cloner:
+    """Clones files with the best available method, tracking totals."""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.reflink_ok = mode != "copy" and os.name != "nt"
+        self.lock = threading.Lock()
+        self.files = 0
+        self.bytes = 0
+        self.saved = 0
+
+    def clone(self, src, dst, size):
+        method = self._clone(src, dst)
+        with self.lock:
+            self.files += 1
+            self.bytes += size
+            if method != "copy":
+                self.saved += size
+
+    def _clone(self, src, dst):
+        if self.reflink_ok:
+            try:
+                _reflink(src, dst)
+                return "reflink"
+            except (OSError, AttributeError) as e:
+                if getattr(e, "errno", None) in _REFLINK_UNSUPPORTED or isinstance(e, AttributeError):
+                    with self.lock:
+                        self.reflink_ok = False
+                try:
+                    os.remove(dst)
+                except OSError:
+                    pass
+        if self.mode == "hardlink":
+            try:
+                os.link(src, dst)
+                return "hardlink"
+            except OSError:
+                pass
+        shutil.copy2(src, dst)
+        return "copy"
+
+
+def clone_tree(src, dst, cloner, executor):
+    """Recreates `src` at `dst`; files are submitted to `executor`. Returns futures."""
+    futures = []
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        try:
+            entries = list(os.scandir(src_dir))
+        except OSError:
+            continue
+        for entry in entries:
+            target = os.path.join(dst_dir, entry.name)
+            if os.path.lexists(target):
+                continue
+            try:
+                if entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), target)
+                elif entry.is_dir():
+                    stack.append((entry.path, target))
+                elif entry.is_file():
+                    size = entry.stat(follow_symlinks=False).st_size
+                    futures.append(executor.submit(cloner.clone, entry.path, target, size))
+            except OSError:
+                continue
+    return futures
+
+
+def seed_artifacts(config, target_path, dry_run=False, quiet=False):
+    """Clones matching ignored artifacts into a freshly created worktree.
+
+    `quiet` prints nothing (several worktrees seeding at once).
+    """
+    settings = get_artifact_settings(config)
+    if not settings["patterns"]:
+        return
+
+    base = git_output(["-C", target_path, "rev-parse", "HEAD"])
+    source = pick_source_worktree(target_path, base, settings["source"])
+    if not source:
+        return
+
+    artifacts = find_artifacts(source, settings["patterns"])
+    if not artifacts:
+        if not quiet:
+            print_colored(t("artifacts.none", source=source), "90")
+        return
+
+    if not quiet:
+        print_colored(t("artifacts.seeding", n=len(artifacts), source=source), "36")
+    if dry_run:
+        for rel in artifacts:
+            print_colored(f"   • {rel}", "90")
+        return
+
+    cloner = _Cloner(settings["mode"])
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=settings["workers"]) as executor:
+        futures = []
+        for rel in artifacts:
+            src = os.path.join(source, rel)
+            dst = os.path.join(target_path, rel)
+            if os.path.isdir(src) and not os.path.islink(src):
+                futures.extend(clone_tree(src, dst, cloner, executor))
+            elif not os.path.lexists(dst):
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                futures.append(executor.submit(cloner.clone, src, dst, os.path.getsize(src)))
+
+        last = 0.0
+        for i, future in enumerate(futures, 1):
+            try:
+                future.result()
+            except OSError:
+                pass
+            now = time.monotonic()
+            if not quiet and sys.stdout.isatty() and now - last > 0.2:
+                last = now
+                print(f"\r   {i}/{len(futures)} {format_size(cloner.bytes)}", end="", flush=True)
+        if not quiet and sys.stdout.isatty() and futures:
+            print("\r" + " " * 40 + "\r", end="")
+
+    if quiet:
+        return
+    print_colored(
+        t(
+            "artifacts.done",
+            files=cloner.files,
+            size=format_size(cloner.bytes),
+            saved=format_size(cloner.saved),
+            secs=f"{time.monotonic() - start:.1f}",
+        ),
+        "32",
+    )
@@ -8,9 +8,15 @@ from gwtlib.commands.worktree import (
     cmd_prune,
 )
 from gwtlib.commands.status import cmd_status
+from gwtlib.commands.pool import cmd_pool
 from gwtlib.commands.review import cmd_review
 from gwtlib.commands.merge import cmd_merge, cmd_commit
+from gwtlib.commands.conflicts import cmd_conflicts
+from gwtlib.commands.maintenance import cmd_maintenance
 from gwtlib.commands.setting import cmd_setting
+from gwtlib.commands.sparse import cmd_sparse
+from gwtlib.commands.sync import cmd_sync
+from gwtlib.commands.trash import cmd_trash
 from gwtlib.commands.update import cmd_update
 
 __all__ = [
@@ -20,9 +26,15 @@ __all__ = [
     'cmd_cd',
     'cmd_prune',
     'cmd_status',
+    'cmd_pool',
     'cmd_review',
     'cmd_merge',
     'cmd_commit',
+    'cmd_conflicts',
+    'cmd_maintenance',
     'cmd_setting',
+    'cmd_sparse',
+    'cmd_sync',
+    'cmd_trash',
     'cmd_update',
 ]
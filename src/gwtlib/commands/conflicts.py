@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""GWT Conflicts Command
+
+Predicts merge conflicts before merge day:
+
+- default: every worktree branch against mainBranch
+- --all: every branch `gwt merge` offers (local and origin/*)
+- --pairwise: also every branch against every other
+- --matrix: pairwise results as a grid
+"""
+
+import itertools
+import time
+
+from gwtlib.config import get_effective_config
+from gwtlib.commands.merge import get_all_branches
+from gwtlib.conflicts import pair_key, predict
+from gwtlib.i18n import t
+from gwtlib.utils import (
+    ASYNC_CMD_LIMIT,
+    get_git_common_dir,
+    git_outputs,
+    is_pool_worktree,
+    list_worktrees,
+    print_colored,
+)
+
+# Conflicted paths listed per pair before eliding the rest.
+MAX_PATHS = 8
+
+
+def _resolve(names, jobs):
+    """{name: oid} for names resolving to a commit (local branch first, then origin/)."""
+    queries = []
+    for name in names:
+        queries.append(["rev-parse", "--verify", "--quiet", f"{name}^{{commit}}"])
+        queries.append(["rev-parse", "--verify", "--quiet", f"origin/{name}^{{commit}}"])
+    out = git_outputs(queries, limit=jobs)
+    resolved = {}
+    for i, name in enumerate(names):
+        oid = out[2 * i] or out[2 * i + 1]
+        if oid:
+            resolved[name] = oid
+    return resolved
+
+
+def _print_paths(paths):
+    for path in paths[:MAX_PATHS]:
+        print(f"       • {path}")
+    if len(paths) > MAX_PATHS:
+        print_colored(t("conflicts.more_paths", n=len(paths) - MAX_PATHS), "90")
+
+
+def _print_pair(label, paths):
+    if paths is None:
+        print_colored(f"   ❓ {label:<40} {t('conflicts.error')}", "31")
+    elif paths:
+        print_colored(f"   ⚠️  {label:<40} {t('conflicts.files', n=len(paths))}", "33")
+        _print_paths(paths)
+    else:
+        print_colored(f"   ✅ {label:<40} {t('conflicts.clean')}", "32")
+
+
+def _print_matrix(names, oids, results):
+    print_colored(t("conflicts.matrix_title"), "36", bold=True)
+    for i, name in enumerate(names):
+        print_colored(f"   [{i}] {name}", "90")
+    width = max(4, len(str(len(names) - 1)) + 2)
+    print("     " + "".join(f"{i:>{width}}" for i in range(len(names))))
+    for i, row_name in enumerate(names):
+        cells = []
+        for j, col_name in enumerate(names):
+            if i == j:
+                cells.append(f"{'-':>{width}}")
+                continue
+            paths = results.get(pair_key(oids[row_name], oids[col_name]))
+            cell = "?" if paths is None else (str(len(paths)) if paths else "·")
+            cells.append(f"{cell:>{width}}")
+        print(f"   {i:>2}" + "".join(cells))
+    print_colored(t("conflicts.matrix_legend"), "90")
+
+
+def cmd_conflicts(args):
+    common_dir = get_git_common_dir()
+    if not common_dir:
+        print_colored(t("generic.not_git_repo"), "31")
+        return 1
+
+    config = get_effective_config()
+    main_branch = config.get("mainBranch", "main")
+    jobs = getattr(args, "jobs", None) or ASYNC_CMD_LIMIT
+    matrix = bool(getattr(args, "matrix", False))
+    pairwise = matrix or bool(getattr(args, "pairwise", False))
+
+    if getattr(args, "all", False):
+        names = get_all_branches()
+    else:
+        names = [
+            wt["branch"] for wt in list_worktrees()
+            if wt.get("branch") and not wt["bare"] and not is_pool_worktree(wt["path"])
+        ]
+    names = [name for name in dict.fromkeys(names) if name != main_branch]
+
+    oids = _resolve([main_branch] + names, jobs)
+    if main_branch not in oids:
+        print_colored(t("conflicts.main_missing", branch=main_branch), "31")
+        return 1
+    names = [name for name in names if name in oids]
+    if not names:
+        print_colored(t("conflicts.no_branches"), "33")
+        return
+
+    pairs = [(oids[main_branch], oids[name]) for name in names]
+    if pairwise:
+        pairs.extend((oids[a], oids[b]) for a, b in itertools.combinations(names, 2))
+
+    start = time.monotonic()
+    results, computed = predict(pairs, common_dir, jobs)
+    elapsed = time.monotonic() - start
+
+    print_colored(t("conflicts.title_main", n=len(names), branch=main_branch), "36", bold=True)
+    for name in names:
+        _print_pair(name, results[pair_key(oids[main_branch], oids[name])])
+
+    if matrix:
+        print()
+        _print_matrix([main_branch] + names, oids, results)
+    elif pairwise:
+        print()
+        print_colored(t("conflicts.title_pairwise"), "36", bold=True)
+        clashing = 0
+        for a, b in itertools.combinations(names, 2):
+            paths = results[pair_key(oids[a], oids[b])]
+            if paths or paths is None:
+                clashing += 1
+                _print_pair(f"{a} ↔ {b}", paths)
+        if not clashing:
+            print_colored(t("conflicts.pairwise_clean"), "32")
+
+    conflicting = sum(1 for paths in results.values() if paths)
+    print()
+    print_colored(
+        t(
+            "conflicts.summary",
+            conflicting=conflicting,
+            total=len(results),
+            computed=computed,
+            cached=len(results) - computed,
+            secs=f"{elapsed:.1f}",
+        ),
+        "33" if conflicting else "32",
+    )
@@ -2,7 +2,7 @@
 """Emit shell wrapper snippets (useful for pipx installs).
 
 The wrapper enables:
-- directory switching via GWT_CD_FILE
+- directory switching via an inherited pipe (GWT_CD_FD), GWT_CD_FILE as fallback
 - completion by delegating to `gwt __complete`
 """
 
@@ -27,18 +27,37 @@ def _detect_shell():
 
 def _snippet_zsh():
     return r"""# --- BEGIN GWT (pipx) ---
+_GWT_CD_FD=""
+_gwt_open_cd_fd() {
+  local fifo="${TMPDIR:-/tmp}/gwt_cd_fifo_$$"
+  rm -f "$fifo"
+  mkfifo -m 600 "$fifo" 2>/dev/null || return 1
+  exec {_GWT_CD_FD}<>"$fifo"
+  rm -f "$fifo"
+}
+_gwt_open_cd_fd || _GWT_CD_FD=""
+
+_gwt_read_cd_fd() {
+  _GWT_CD_TARGET=""
+  [ -n "$_GWT_CD_FD" ] || return 0
+  local line
+  while IFS= read -r -t 0 -u "$_GWT_CD_FD" line; do _GWT_CD_TARGET="$line"; done
+}
+
 function gwt() {
   local tmp_cd_file="/tmp/gwt_cd_target_$$"
-  GWT_CD_FILE="$tmp_cd_file" command gwt "$@"
+  _gwt_read_cd_fd
+  GWT_CD_FD="$_GWT_CD_FD" GWT_CD_FILE="$tmp_cd_file" command gwt "$@"
   local ret=$?
+  _gwt_read_cd_fd
+  local target_dir="$_GWT_CD_TARGET"
   if [ -f "$tmp_cd_file" ]; then
-    local target_dir
     target_dir="$(cat "$tmp_cd_file")"
-    if [ -n "$target_dir" ]; then
-      cd "$target_dir"
-    fi
     rm -f "$tmp_cd_file"
   fi
+  if [ -n "$target_dir" ]; then
+    cd "$target_dir"
+  fi
   return $ret
 }
 
@@ -55,8 +74,17 @@ function _gwt_zsh_completions() {
     cmd="${words[2]}"
   fi
 
-  local result=("${(@f)$(command gwt __complete --cmd=\"$cmd\" --cur=\"$cur\" --prev=\"$prev\")}")
-  if [[ -n "$result" ]]; then
+  # Lines with an empty value (":message") are hints, not candidates.
+  local -a result
+  local line
+  for line in "${(@f)$(command gwt __complete --cmd=\"$cmd\" --cur=\"$cur\" --prev=\"$prev\")}"; do
+    if [[ "$line" == :* ]]; then
+      _message -r "${line#:}"
+    elif [[ -n "$line" ]]; then
+      result+=("$line")
+    fi
+  done
+  if (( ${#result} )); then
     _describe 'command' result
   fi
 }
@@ -67,18 +95,40 @@ compdef _gwt_zsh_completions gwt
 
 def _snippet_bash():
     return r"""# --- BEGIN GWT (pipx) ---
+_GWT_CD_FD=""
+_gwt_open_cd_fd() {
+  if (( BASH_VERSINFO[0] < 4 || (BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] < 1) )); then
+    return 1
+  fi
+  local fifo="${TMPDIR:-/tmp}/gwt_cd_fifo_$$"
+  rm -f "$fifo"
+  mkfifo -m 600 "$fifo" 2>/dev/null || return 1
+  exec {_GWT_CD_FD}<>"$fifo"
+  rm -f "$fifo"
+}
+_gwt_open_cd_fd || _GWT_CD_FD=""
+
+_gwt_read_cd_fd() {
+  _GWT_CD_TARGET=""
+  [ -n "$_GWT_CD_FD" ] || return 0
+  local line
+  while read -t 0 -u "$_GWT_CD_FD" && IFS= read -r -u "$_GWT_CD_FD" line; do _GWT_CD_TARGET="$line"; done
+}
+
 gwt() {
   local tmp_cd_file="/tmp/gwt_cd_target_$$"
-  GWT_CD_FILE="$tmp_cd_file" command gwt "$@"
+  _gwt_read_cd_fd
+  GWT_CD_FD="$_GWT_CD_FD" GWT_CD_FILE="$tmp_cd_file" command gwt "$@"
   local ret=$?
+  _gwt_read_cd_fd
+  local target_dir="$_GWT_CD_TARGET"
   if [ -f "$tmp_cd_file" ]; then
-    local target_dir
     target_dir="$(cat "$tmp_cd_file")"
-    if [ -n "$target_dir" ]; then
-      cd "$target_dir"
-    fi
     rm -f "$tmp_cd_file"
   fi
+  if [ -n "$target_dir" ]; then
+    cd "$target_dir"
+  fi
   return $ret
 }
 
@@ -96,7 +146,7 @@ _gwt_bash_completions() {
   fi
 
   local opts
-  opts="$(command gwt __complete --cmd=\"$cmd\" --cur=\"$cur\" --prev=\"$prev\" | cut -d':' -f1)"
+  opts="$(command gwt __complete --cmd=\"$cmd\" --cur=\"$cur\" --prev=\"$prev\" | grep -v '^:' | cut -d':' -f1)"
   local IFS=$'\n'
   COMPREPLY=( $(compgen -W "$opts" -- "$cur") )
 }
@@ -116,21 +166,31 @@ function gwt {
   $exe = (Get-Command gwt -CommandType Application -ErrorAction SilentlyContinue)
   if (-not $exe) { Write-Error "Cannot find gwt executable"; return }
 
-  $tmpCdFile = [System.IO.Path]::GetTempFileName()
+  # Anonymous pipe whose inheritable write handle is passed in GWT_CD_FD;
+  # the temp file is only used if gwt cannot write to the handle.
+  $pipe = New-Object System.IO.Pipes.AnonymousPipeServerStream([System.IO.Pipes.PipeDirection]::In, [System.IO.HandleInheritability]::Inheritable)
+  $tmpCdFile = Join-Path ([System.IO.Path]::GetTempPath()) ("gwt_cd_target_" + $PID)
+  $env:GWT_CD_FD = $pipe.GetClientHandleAsString()
   $env:GWT_CD_FILE = $tmpCdFile
 
   try {
     & $exe.Source @Args
   } finally {
+    Remove-Item Env:\GWT_CD_FD -ErrorAction SilentlyContinue
+    Remove-Item Env:\GWT_CD_FILE -ErrorAction SilentlyContinue
+    $pipe.DisposeLocalCopyOfClientHandle()
+    $reader = New-Object System.IO.StreamReader($pipe)
+    $lines = @($reader.ReadToEnd() -split "`r?`n" | Where-Object { $_ })
+    $reader.Dispose()
+    $targetDir = if ($lines.Count -gt 0) { $lines[-1] } else { $null }
     if (Test-Path $tmpCdFile) {
       $targetDir = Get-Content -Path $tmpCdFile -ErrorAction SilentlyContinue
-      if (-not [string]::IsNullOrWhiteSpace($targetDir)) {
-        $targetDir = $targetDir.Trim()
-        if (Test-Path $targetDir) { Set-Location -Path $targetDir }
-      }
       Remove-Item -Path $tmpCdFile -ErrorAction SilentlyContinue
     }
-    Remove-Item Env:\GWT_CD_FILE -ErrorAction SilentlyContinue
+    if (-not [string]::IsNullOrWhiteSpace($targetDir)) {
+      $targetDir = $targetDir.Trim()
+      if (Test-Path $targetDir) { Set-Location -Path $targetDir }
+    }
   }
 }
 
@@ -166,6 +226,7 @@ if (Get-Command Register-ArgumentCompleter -ErrorAction SilentlyContinue) {
     try {
       $results = & $exe.Source __complete --cmd=$cmd --cur=$wordToComplete --prev=$prev
       foreach ($res in $results) {
+        if ($res.StartsWith(":")) { continue }
         $parts = $res -split ":", 2
         $val = $parts[0]
         $desc = if ($parts.Count -gt 1) { $parts[1] } else { $val }
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""GWT Maintenance Command
+
+- status (default): what is in place, last run, schedule
+- run: commit-graph / multi-pack-index / incremental repack, with query
+  latency measured before and after
+- schedule [hourly|daily|weekly|off]: run it in the background when due
+"""
+
+import time
+
+from gwtlib import maintenance
+from gwtlib.config import get_effective_config, load_config, save_config
+from gwtlib.i18n import t
+from gwtlib.utils import format_age, get_git_common_dir, print_colored
+
+
+def _run(args, common_dir, config):
+    auto = bool(getattr(args, "auto", False))
+    if auto and not maintenance.is_due(common_dir, config):
+        return
+
+    if getattr(args, "dry_run", False):
+        print_colored(t("generic.dry_run"), "33")
+        for _, task_args in maintenance.TASKS:
+            print_colored(t("generic.would_run", cmd=" ".join(["git"] + task_args)), "90")
+        return
+
+    lock = maintenance.maintenance_lock(common_dir)
+    if not lock.acquire(blocking=False):
+        # --auto runs in the background: whoever holds the lock is busy, try next time.
+        if auto:
+            return
+        print_colored(t("maintenance.waiting"), "90")
+        lock.acquire()
+
+    try:
+        started = time.monotonic()
+        queries = [] if auto else maintenance.bench_queries(main_branch=config.get("mainBranch", "main"))
+        before = maintenance.time_queries(queries) if queries else None
+
+        if not auto:
+            print_colored(t("maintenance.title", path=common_dir), "36", bold=True)
+
+        def on_task(name, ok, secs):
+            if auto:
+                return
+            if ok:
+                print_colored(f"   ✅ {name:<20} {secs:.1f}s", "32")
+            else:
+                print_colored(f"   ❌ {name:<20} {t('maintenance.task_failed')}", "31")
+
+        results = maintenance.run_tasks(on_task=on_task)
+        after = maintenance.time_queries(queries) if queries else None
+        ok = all(task_ok for _, task_ok, _ in results)
+        state = {"at": time.time(), "ok": ok, "secs": round(time.monotonic() - started, 2)}
+        if before is not None:
+            state.update(before=round(before, 4), after=round(after, 4), queries=len(queries))
+        maintenance.write_state(common_dir, state)
+    finally:
+        lock.release()
+
+    if auto:
+        return 0 if ok else 1
+    print()
+    if before is not None:
+        speedup = before / after if after else 0
+        print_colored(
+            t("maintenance.latency", n=len(queries), before=f"{before:.3f}s", after=f"{after:.3f}s", x=f"{speedup:.1f}"),
+            "36",
+        )
+    print_colored(t("maintenance.done", secs=f"{state['secs']:.1f}"), "32" if ok else "33")
+    return 0 if ok else 1
+
+
+def _status(common_dir, config):
+    stats = maintenance.object_stats(common_dir)
+    state = maintenance.read_state(common_dir)
+    interval = maintenance.get_interval(config)
+    yes, no = t("maintenance.yes"), t("maintenance.no")
+
+    print_colored(t("maintenance.title", path=common_dir), "36", bold=True)
+    print(f"   commit-graph      {yes if stats['commit_graph'] else no}")
+    print(f"   multi-pack-index  {yes if stats['multi_pack_index'] else no}")
+    print(f"   packs             {stats['packs']}")
+    if state.get("at"):
+        print_colored(
+            t("maintenance.last_run", age=format_age(time.time() - state["at"]), result=yes if state.get("ok") else no),
+            "90",
+        )
+        if state.get("before") is not None:
+            print_colored(
+                t("maintenance.last_latency", before=f"{state['before']:.3f}s", after=f"{state['after']:.3f}s"), "90"
+            )
+    else:
+        print_colored(t("maintenance.never_run"), "33")
+    if interval:
+        print_colored(t("maintenance.scheduled", hours=interval), "90")
+    else:
+        print_colored(t("maintenance.not_scheduled"), "90")
+
+
+def _schedule(args):
+    name = getattr(args, "interval", None)
+    config = load_config()
+    current = maintenance.get_interval(get_effective_config())
+    if not name:
+        if current:
+            print_colored(t("maintenance.scheduled", hours=current), "36")
+        else:
+            print_colored(t("maintenance.not_scheduled"), "36")
+        return
+
+    if getattr(args, "dry_run", False):
+        print_colored(t("generic.dry_run"), "33")
+        print_colored(t("maintenance.would_schedule", name=name), "90")
+        return
+
+    config.setdefault("maintenance", {})["interval"] = maintenance.INTERVALS[name]
+    if not save_config(config):
+        return 1
+    if maintenance.INTERVALS[name]:
+        print_colored(t("maintenance.scheduled", hours=maintenance.INTERVALS[name]), "32")
+    else:
+        print_colored(t("maintenance.not_scheduled"), "32")
+
+
+def cmd_maintenance(args):
+    common_dir = get_git_common_dir()
+    if not common_dir:
+        print_colored(t("generic.not_git_repo"), "31")
+        return 1
+
+    action = getattr(args, "action", None) or "status"
+    if action == "schedule":
+        return _schedule(args)
+    config = get_effective_config()
+    if action == "run":
+        return _run(args, common_dir, config)
+    return _status(common_dir, config)
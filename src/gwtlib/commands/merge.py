@@ -7,7 +7,15 @@ import subprocess
 
 from gwtlib.i18n import t
 from gwtlib.config import detect_available_tools, get_effective_config
-from gwtlib.utils import git_output, print_colored
+from gwtlib.utils import (
+    get_branch_worktree,
+    get_main_worktree,
+    get_worktree_root,
+    git_output,
+    git_outputs,
+    print_colored,
+    run_cmd,
+)
 
 
 def has_uncommitted_changes(path=None):
@@ -167,11 +175,149 @@ def handle_merge_conflicts(config):
     return True
 
 
+def _resolve_commit(name):
+    """Full oid of a branch, falling back to its origin/ counterpart."""
+    for candidate in (name, f"origin/{name}"):
+        oid = git_output(["rev-parse", "--verify", "--quiet", f"{candidate}^{{commit}}"])
+        if oid:
+            return candidate, oid
+    return None, None
+
+
+def merge_tree(target_oid, source_oid):
+    """Runs `git merge-tree --write-tree`; returns (tree oid, conflicted paths) or (None, None) on error."""
+    result = subprocess.run(
+        ["git", "merge-tree", "--write-tree", "--name-only", "--no-messages", target_oid, source_oid],
+        capture_output=True,
+        text=True,
+    )
+    lines = result.stdout.splitlines()
+    if result.returncode not in (0, 1) or not lines:
+        return None, None
+    return lines[0], [line for line in lines[1:] if line]
+
+
+def _advance_target(target, holder, old_oid, new_oid, message):
+    """Moves `target` to `new_oid`; the worktree holding it (if any) is fast-forwarded in place."""
+    if holder:
+        print_colored(t("merge.updating_worktree", path=holder), "90")
+        return run_cmd(["git", "-C", holder, "merge", "--ff-only", "--quiet", new_oid])
+    # Compare-and-swap: fails if someone moved the branch since we read it.
+    return run_cmd(["git", "update-ref", "-m", message, f"refs/heads/{target}", new_oid, old_oid])
+
+
+# Temporary worktrees for conflicted merges: <worktreeDir>/.gwt-merge-<branch>
+MERGE_TEMP_PREFIX = ".gwt-merge-"
+
+
+def _is_merge_temp(path):
+    return os.path.basename(os.path.normpath(path)).startswith(MERGE_TEMP_PREFIX)
+
+
+def _drop_stale_temp(path):
+    """Clears a temporary merge worktree a crashed run left behind (registered or not)."""
+    run_cmd(["git", "worktree", "remove", "--force", path], capture_output=True)
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    run_cmd(["git", "worktree", "prune"], capture_output=True)
+
+
+def _merge_in_worktree(source_ref, target, holder, config):
+    """Conflict fallback: merge inside the target's worktree, or a temporary one."""
+    temp = None
+    if not holder:
+        # Only reads the location: a one-off merge must not edit the main worktree's .gitignore.
+        worktree_dir = get_worktree_root(get_main_worktree(), config, ensure_gitignore=False)
+        temp = os.path.join(worktree_dir, f"{MERGE_TEMP_PREFIX}{target.replace('/', '-')}")
+        _drop_stale_temp(temp)
+        if not run_cmd(["git", "worktree", "add", "--quiet", temp, target]):
+            print_colored(t("merge.temp_failed"), "31")
+            return
+        holder = temp
+
+    print_colored(t("merge.resolve_in", path=holder), "36")
+    original_dir = os.getcwd()
+    os.chdir(holder)
+    try:
+        _merge_here(source_ref, target, config)
+    finally:
+        os.chdir(original_dir)
+        if temp:
+            if git_output(["-C", temp, "rev-parse", "-q", "--verify", "MERGE_HEAD"]) is not None:
+                run_cmd(["git", "-C", temp, "merge", "--abort"])
+            run_cmd(["git", "worktree", "remove", "--force", temp])
+
+
+def _merge_in_memory(source, target, config, dry_run=False):
+    """Merges without touching any working tree unless there are conflicts."""
+    if not git_output(["rev-parse", "--verify", "--quiet", f"refs/heads/{target}"]):
+        print_colored(t("merge.target_not_local", branch=target), "31")
+        return
+    target_oid = git_output(["rev-parse", f"refs/heads/{target}"])
+    source_ref, source_oid = _resolve_commit(source)
+    if not source_oid:
+        print_colored(t("merge.source_missing", branch=source), "31")
+        return
+
+    # A worktree that has the target checked out is the only one we may touch.
+    holder = get_branch_worktree(target)
+    if holder and _is_merge_temp(holder):
+        # Left by a crashed run: it still holds the target, so clear it first.
+        _drop_stale_temp(holder)
+        holder = None
+    if holder and has_uncommitted_changes(holder):
+        print_colored(t("merge.target_dirty", branch=target, path=holder), "31")
+        return
+
+    if git_output(["merge-base", "--is-ancestor", source_oid, target_oid]) is not None:
+        print_colored(t("merge.up_to_date", source=source, target=target), "32")
+        return
+
+    message = f"Merge branch '{source}' into {target}"
+    if git_output(["merge-base", "--is-ancestor", target_oid, source_oid]) is not None:
+        new_oid = source_oid
+        print_colored(t("merge.fast_forward", target=target, oid=source_oid[:10]), "36")
+        if dry_run:
+            print_colored(t("generic.would_run", cmd=f"git update-ref refs/heads/{target} {source_oid[:10]}"), "90")
+            return
+    else:
+        print_colored(t("merge.in_memory", source=source, target=target), "36")
+        tree, conflicts = merge_tree(target_oid, source_oid)
+        if tree is None:
+            print_colored(t("merge.failed"), "31")
+            return
+        if conflicts:
+            print_colored(t("merge.conflicts_predicted", n=len(conflicts)), "33")
+            for path in conflicts:
+                print(f"   • {path}")
+            if dry_run:
+                return
+            _merge_in_worktree(source_ref, target, holder, config)
+            return
+        if dry_run:
+            print_colored(t("generic.would_run", cmd=f"git commit-tree {tree[:10]} -p {target} -p {source_ref}"), "90")
+            print_colored(t("generic.would_run", cmd=f"git update-ref refs/heads/{target}"), "90")
+            return
+        new_oid = git_output(["commit-tree", tree, "-p", target_oid, "-p", source_oid, "-m", message])
+        if not new_oid:
+            print_colored(t("merge.failed"), "31")
+            return
+
+    if not _advance_target(target, holder, target_oid, new_oid, message):
+        print_colored(t("merge.advance_failed", branch=target), "31")
+        return
+    print_colored(t("merge.ok_in_memory", target=target, oid=new_oid[:10]), "32")
+
+
 def cmd_merge(args):
     config = get_effective_config()
     auto_yes = bool(getattr(args, "yes", False) or getattr(args, "dry_run", False))
+    in_memory = getattr(args, "in_memory", None)
+    if in_memory is None:
+        in_memory = bool((config.get("merge") or {}).get("inMemory", False))
     
-    if has_uncommitted_changes():
+    # The in-memory mode never touches the current working tree.
+    if not in_memory and has_uncommitted_changes():
         print_colored(t("merge.uncommitted"), "31")
         print_colored(t("merge.uncommitted_tip"), "90")
         return
@@ -189,7 +335,7 @@ def cmd_merge(args):
     print(f"   Selected: {source}")
     print()
 
-    current_branch = git_output(["branch", "--show-current"]).strip()
+    current_branch = (git_output(["branch", "--show-current"]) or "").strip()
     print_colored(t("merge.select_target"), "33")
     print_colored(t("merge.current_branch", branch=current_branch), "90")
     target = select_branch_fzf(t("merge.target_prompt"), exclude=source)
@@ -213,6 +359,12 @@ def cmd_merge(args):
         print(t("generic.cancelled"))
         return
 
+    if in_memory:
+        if getattr(args, "dry_run", False):
+            print_colored(t("generic.dry_run"), "33")
+        _merge_in_memory(source, target, config, dry_run=getattr(args, "dry_run", False))
+        return
+
     if getattr(args, "dry_run", False):
         print_colored(t("generic.dry_run"), "33")
         if current_branch != target:
@@ -228,6 +380,11 @@ def cmd_merge(args):
             print(result.stderr)
             return
     
+    _merge_here(source, target, config)
+
+
+def _merge_here(source, target, config):
+    """`git merge <source>` in the current directory, with interactive conflict handling."""
     print_colored(t("merge.merging", source=source, target=target), "36")
     result = subprocess.run(["git", "merge", source], capture_output=True, text=True)
     
@@ -259,17 +416,14 @@ def cmd_merge(args):
     if not sm_output:
         return
 
-    for sm_path in sm_output.splitlines():
-        if not sm_path.strip():
-            continue
-
-        sm_conflicts = subprocess.run(
-            ["git", "-C", sm_path, "diff", "--name-only", "--diff-filter=U"],
-            capture_output=True,
-            text=True,
-        )
+    sm_paths = [p for p in sm_output.splitlines() if p.strip()]
+    # Scan all submodules for unmerged paths concurrently.
+    sm_conflicts = git_outputs(
+        [["-C", sm_path, "diff", "--name-only", "--diff-filter=U"] for sm_path in sm_paths]
+    )
 
-        if sm_conflicts.stdout.strip():
+    for sm_path, conflicts in zip(sm_paths, sm_conflicts):
+        if conflicts:
             print_colored(t("merge.submodule_has_conflicts", path=sm_path), "33")
             print_colored(t("merge.submodule_enter"), "90")
 
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""GWT Pool Command
+
+Keeps N detached, fully checked-out worktrees at `mainBranch` under
+`<worktreeDir>/.gwt-pool/`. `gwt new` claims one, moves it into place and
+switches branches, so only files that differ from the pool commit are written.
+
+- status: show pool slots
+- fill: create missing slots, refresh stale ones to the main branch tip
+- drain: remove all slots
+"""
+
+import os
+import time
+import uuid
+
+from gwtlib.i18n import t
+from gwtlib.config import get_effective_config
+from gwtlib.utils import (
+    POOL_DIR_NAME,
+    get_main_worktree,
+    get_worktree_root,
+    git_output,
+    list_worktrees,
+    print_colored,
+    run_cmd,
+)
+
+# A slot can be claimed only while its "<slot>.ready" marker exists; removing
+# the marker is the atomic claim.
+READY_SUFFIX = ".ready"
+FILL_MARKER = ".filling"
+FILL_STALE_SECONDS = 3600
+
+
+def get_pool_settings(config):
+    """Returns (size, refill_policy)."""
+    pool = config.get("pool") or {}
+    try:
+        size = max(0, int(pool.get("size", 0)))
+    except (TypeError, ValueError):
+        size = 0
+    return size, pool.get("refill", "background")
+
+
+def get_pool_dir(repo_root, config):
+    return os.path.join(get_worktree_root(repo_root, config), POOL_DIR_NAME)
+
+
+def _resolve_main_commit(config):
+    main = config.get("mainBranch", "main")
+    for ref in (main, f"origin/{main}"):
+        oid = git_output(["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"])
+        if oid:
+            return oid
+    return None
+
+
+def _same_path(a, b):
+    return os.path.normcase(os.path.normpath(a)) == os.path.normcase(os.path.normpath(b))
+
+
+def list_pool_slots(pool_dir):
+    """Returns registered pool slots: [{"path", "head", "ready"}]."""
+    slots = []
+    for wt in list_worktrees():
+        if not _same_path(os.path.dirname(wt["path"]), pool_dir):
+            continue
+        slots.append({
+            "path": wt["path"],
+            "head": wt["head"],
+            "ready": os.path.exists(wt["path"] + READY_SUFFIX),
+        })
+    return slots
+
+
+def _remove_slot(path):
+    try:
+        os.remove(path + READY_SUFFIX)
+    except OSError:
+        pass
+    run_cmd(["git", "worktree", "unlock", path], capture_output=True)
+    return run_cmd(["git", "worktree", "remove", "--force", path])
+
+
+def claim_pool_worktree(repo_root, config, new_path):
+    """Moves a ready pool slot to `new_path`. Returns True on success."""
+    pool_dir = get_pool_dir(repo_root, config)
+    if not os.path.isdir(pool_dir):
+        return False
+
+    for name in sorted(os.listdir(pool_dir)):
+        if not name.endswith(READY_SUFFIX):
+            continue
+        slot = os.path.join(pool_dir, name[: -len(READY_SUFFIX)])
+        try:
+            os.remove(os.path.join(pool_dir, name))
+        except OSError:
+            continue  # Claimed by another gwt process.
+        if not os.path.isdir(slot):
+            continue
+
+        os.makedirs(os.path.dirname(new_path), exist_ok=True)
+        run_cmd(["git", "worktree", "unlock", slot], capture_output=True)
+        if run_cmd(["git", "worktree", "move", slot, new_path]):
+            return True
+        _remove_slot(slot)
+    return False
+
+
+def _acquire_fill_marker(marker):
+    try:
+        if time.time() - os.path.getmtime(marker) > FILL_STALE_SECONDS:
+            os.remove(marker)
+    except OSError:
+        pass
+    try:
+        fd = os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    os.write(fd, str(os.getpid()).encode())
+    os.close(fd)
+    return True
+
+
+def fill_pool(repo_root, config):
+    size, _refill = get_pool_settings(config)
+    pool_dir = get_pool_dir(repo_root, config)
+    main_oid = _resolve_main_commit(config)
+    if not main_oid:
+        print_colored(t("pool.main_missing", branch=config.get("mainBranch", "main")), "31")
+        return False
+
+    os.makedirs(pool_dir, exist_ok=True)
+    marker = os.path.join(pool_dir, FILL_MARKER)
+    if not _acquire_fill_marker(marker):
+        print_colored(t("pool.fill_running"), "33")
+        return True
+
+    try:
+        slots = list_pool_slots(pool_dir)
+
+        # Trim surplus slots (pool shrunk), then refresh stale ones.
+        for slot in [s for s in slots if s["ready"]][: max(0, len(slots) - size)]:
+            print_colored(t("pool.removing", path=slot["path"]), "90")
+            _remove_slot(slot["path"])
+            slots.remove(slot)
+
+        for slot in list(slots):
+            if not slot["ready"] or slot["head"] == main_oid:
+                continue
+            ready = slot["path"] + READY_SUFFIX
+            try:
+                os.remove(ready)
+            except OSError:
+                continue
+            print_colored(t("pool.refreshing", path=slot["path"]), "90")
+            if run_cmd(["git", "-C", slot["path"], "checkout", "--quiet", "--detach", main_oid]):
+                open(ready, "w").close()
+            else:
+                _remove_slot(slot["path"])
+                slots.remove(slot)
+
+        for _ in range(size - len(slots)):
+            slot = os.path.join(pool_dir, f"slot-{uuid.uuid4().hex[:8]}")
+            print_colored(t("pool.creating", path=slot), "36")
+            if not run_cmd(["git", "worktree", "add", "--quiet", "--detach", slot, main_oid]):
+                print_colored(t("pool.create_failed"), "31")
+                return False
+            run_cmd(["git", "worktree", "lock", "--reason", "gwt pool", slot])
+            open(slot + READY_SUFFIX, "w").close()
+    finally:
+        try:
+            os.remove(marker)
+        except OSError:
+            pass
+
+    print_colored(t("pool.fill_ok", n=size), "32")
+    return True
+
+
+def drain_pool(repo_root, config):
+    pool_dir = get_pool_dir(repo_root, config)
+    slots = list_pool_slots(pool_dir)
+    for slot in slots:
+        print_colored(t("pool.removing", path=slot["path"]), "90")
+        _remove_slot(slot["path"])
+    run_cmd(["git", "worktree", "prune"])
+    print_colored(t("pool.drain_ok", n=len(slots)), "32")
+
+
+def cmd_pool(args):
+    action = getattr(args, "action", None) or "status"
+    repo_root = get_main_worktree()
+    if not repo_root:
+        print_colored(t("generic.not_git_repo"), "31")
+        return 1
+
+    config = get_effective_config()
+    size, refill = get_pool_settings(config)
+    pool_dir = get_pool_dir(repo_root, config)
+
+    if getattr(args, "dry_run", False) and action != "status":
+        print_colored(t("generic.dry_run"), "33")
+        print_colored(t("generic.would_run", cmd=f"gwt pool {action}"), "90")
+        return
+
+    # Pool git commands must run against the main repository.
+    os.chdir(repo_root)
+
+    if action == "fill":
+        if size == 0:
+            print_colored(t("pool.disabled"), "33")
+            return
+        return 0 if fill_pool(repo_root, config) else 1
+    if action == "drain":
+        drain_pool(repo_root, config)
+        return
+
+    slots = list_pool_slots(pool_dir)
+    main_oid = _resolve_main_commit(config)
+    print_colored(t("pool.status_title"), "36", bold=True)
+    print_colored(t("pool.status_summary", n=len(slots), size=size, refill=refill, path=pool_dir), "90")
+    for slot in slots:
+        state = t("pool.slot_ready") if slot["ready"] else t("pool.slot_busy")
+        if main_oid and slot["head"] != main_oid:
+            state += f" {t('pool.slot_stale')}"
+        print(f"   • {os.path.basename(slot['path'])}  {slot['head'][:8]}  {state}")
@@ -5,14 +5,124 @@ import datetime
 import os
 import shutil
 import subprocess
+import time
 from pathlib import Path
 
+from gwtlib import review_jobs, watermarks
 from gwtlib.i18n import t
 from gwtlib.config import DEFAULT_MODELS, get_effective_config
-from gwtlib.utils import git_output, print_colored
+from gwtlib.utils import format_age, git_output, print_colored, spawn_gwt_background
+from gwtlib.watermarks import WATERMARK_MODES, watermark_key
+
+
+def _tool_cmd(tool_bin, tool_path, model, prompt, use_wsl, batch=False):
+    """Command line running `tool_bin` on `prompt`; batch = non-interactive, prints and exits."""
+    if tool_bin == "codex":
+        if batch:
+            cmd = [tool_path, "exec", "--model", model, "-c", "reasoning_effort=high", "--sandbox", "read-only", prompt]
+        else:
+            cmd = [tool_path, "--model", model, "-c", "reasoning_effort=high"]
+            cmd.extend(["--sandbox", "read-only"])
+            cmd.extend(["--ask-for-approval", "on-request"])
+            cmd.append(prompt)
+    elif tool_bin == "gemini":
+        cmd = [tool_path, "--model", model, "-p" if batch else "-i", prompt]
+    elif batch:
+        cmd = [tool_path, "--model", model, "-p", prompt]
+    else:
+        cmd = [tool_path, "--model", model, prompt]
+
+    if use_wsl:
+        import shlex
+
+        cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
+        cmd = ["wsl", "bash", "-i", "-c", cmd_str]
+    return cmd
+
+
+def _review_prompt(tool_bin, diff_file, project, branch):
+    prompt = t("review.prompt", diff_file=diff_file, project=project, branch=branch)
+    if tool_bin == "claude":
+        prompt += (
+            "\nPS: Please use your most advanced reasoning capabilities "
+            "(UltraThink/DeepAnalysis) to verify the necessity of these changes."
+        )
+    return prompt
+
+
+def _jobs_dir():
+    root = git_output(["rev-parse", "--show-toplevel"])
+    return review_jobs.get_jobs_dir(root) if root else None
+
+
+def _job_cmd(job):
+    prompt = _review_prompt(job["tool"], job["diff_file"], job.get("project", ""), job.get("branch", ""))
+    return _tool_cmd(job["tool"], job["tool_path"], job["model"], prompt, job.get("use_wsl"), batch=True)
+
+
+def _job_done(job):
+    mark = job.get("watermark")
+    if mark:
+        watermarks.record(mark["root"], mark["key"], mark["snapshot"], job["diff_hash"])
+
+
+def _run_worker():
+    jobs_dir = _jobs_dir()
+    if not jobs_dir or not os.path.isdir(jobs_dir):
+        return
+    review_jobs.run_worker(jobs_dir, review_jobs.get_concurrency(get_effective_config()), _job_cmd, _job_done)
+
+
+def _list_jobs():
+    jobs_dir = _jobs_dir()
+    jobs = review_jobs.list_jobs(jobs_dir) if jobs_dir else []
+    if not jobs:
+        print_colored(t("review.jobs_none"), "90")
+        return
+    colors = {review_jobs.QUEUED: "90", review_jobs.RUNNING: "36", review_jobs.DONE: "32", review_jobs.FAILED: "31"}
+    now = time.time()
+    print_colored(t("review.jobs_title", n=len(jobs)), "36", bold=True)
+    for job in jobs:
+        status = review_jobs.effective_status(jobs_dir, job)
+        age = format_age(now - job.get("created", now))
+        print_colored(
+            f"   {job['id']}  {t('review.job_status.' + status):<8} {age:>4}  "
+            f"{job.get('tool', '')}/{job.get('model', '')}  {job.get('branch') or '-'}: {job.get('mode', '')}",
+            colors.get(status, "0"),
+        )
+    print_colored(t("review.jobs_hint"), "90")
+
+
+def _print_result(prefix):
+    jobs_dir = _jobs_dir()
+    job = review_jobs.find_job(jobs_dir, prefix) if jobs_dir else None
+    if not job:
+        print_colored(t("review.job_not_found", id=prefix), "31")
+        return 1
+    status = review_jobs.effective_status(jobs_dir, job)
+    if status in (review_jobs.QUEUED, review_jobs.RUNNING):
+        print_colored(t("review.job_pending", id=job["id"], status=t("review.job_status." + status)), "33")
+        return
+    try:
+        with open(review_jobs.output_path(jobs_dir, job["id"]), "r", encoding="utf-8", errors="replace") as f:
+            output = f.read()
+    except OSError:
+        output = ""
+    print_colored(t("review.job_header", id=job["id"], tool=job.get("tool", ""), mode=job.get("mode", "")), "36", bold=True)
+    print(output.rstrip())
+    if status == review_jobs.FAILED:
+        print_colored(t("review.job_failed", rc=job.get("returncode")), "31")
+        return 1
 
 
 def cmd_review(args):
+    if getattr(args, "worker", False):
+        return _run_worker()
+    if getattr(args, "list_jobs", False):
+        return _list_jobs()
+    if getattr(args, "result", None):
+        return _print_result(args.result)
+
     config = get_effective_config()
     config_default_tool = config.get("review", {}).get("defaultTool", "codex")
     config_models = config.get("review", {}).get("models", DEFAULT_MODELS)
@@ -32,21 +142,47 @@ def cmd_review(args):
     model = args.model if args.model else default_model
 
     diff_cmd = ["git", "diff", "HEAD"]
+    mode = "uncommitted"
     mode_label = t("review.mode.uncommitted")
 
     if args.staged:
         diff_cmd = ["git", "diff", "--staged"]
+        mode = "staged"
         mode_label = t("review.mode.staged")
     elif args.last:
         diff_cmd = ["git", "show", "HEAD"]
+        mode = "last"
         mode_label = t("review.mode.last")
     elif args.commit:
         diff_cmd = ["git", "diff", args.commit, "HEAD"]
+        mode = "commit"
         mode_label = t("review.mode.commit", sha=args.commit)
     elif args.branch:
         diff_cmd = ["git", "diff", args.branch, "HEAD"]
+        mode = "branch"
         mode_label = t("review.mode.branch", branch=args.branch)
 
+    # Watermark of the state this review covers; recorded once the review succeeds.
+    worktree_root = git_output(["rev-parse", "--show-toplevel"])
+    branch_name = git_output(["branch", "--show-current"]) or ""
+    mark_key = watermark_key(branch_name, mode, args.branch if mode == "branch" else None)
+    current = watermarks.snapshot(mode, args.branch) if worktree_root and mode in WATERMARK_MODES else None
+    previous = None
+    no_changes_key = "review.no_changes"
+
+    if getattr(args, "since_last", False):
+        if current is None:
+            print_colored(t("review.since_last_unsupported"), "33")
+        else:
+            previous = watermarks.load(worktree_root).get(mark_key)
+            base_tree, reason = watermarks.interdiff_base(previous, current)
+            if base_tree:
+                diff_cmd = ["git", "diff", base_tree, current["tree"]]
+                no_changes_key = "review.nothing_new"
+                mode_label = t("review.mode.since_last", mode=mode_label, age=format_age(time.time() - previous["at"]))
+            else:
+                print_colored(t(f"review.since_last_full.{reason}"), "33")
+
     print_colored(t("review.preparing", tool=tool_bin.capitalize(), mode=mode_label), "36")
     print_colored(t("review.using_model", model=model), "90")
 
@@ -76,51 +212,61 @@ def cmd_review(args):
         subprocess.run(diff_cmd, stdout=f, stderr=subprocess.PIPE)
 
     if os.path.getsize(diff_file) == 0:
-        print_colored(t("review.no_changes"), "32")
+        print_colored(t(no_changes_key), "32")
         try:
             os.remove(diff_file)
         except OSError:
             pass
         return
 
-    print_colored(t("review.diff_captured", path=diff_file), "90")
-    print_colored(t("review.launching", tool=tool_bin.capitalize()), "36")
+    sent_hash = watermarks.diff_hash(diff_file)
+    if previous and previous.get("diff_hash") == sent_hash:
+        print_colored(t("review.same_as_last"), "32")
+        try:
+            os.remove(diff_file)
+        except OSError:
+            pass
+        return
 
-    project_name = os.path.basename(git_output(["rev-parse", "--show-toplevel"]).strip())
-    branch_name = git_output(["branch", "--show-current"]).strip()
+    project_name = os.path.basename(worktree_root or "")
 
-    prompt = t(
-        "review.prompt",
-        diff_file=diff_file,
-        project=project_name,
-        branch=branch_name,
-    )
-    if tool_bin == "claude":
-        prompt += (
-            "\nPS: Please use your most advanced reasoning capabilities "
-            "(UltraThink/DeepAnalysis) to verify the necessity of these changes."
-        )
-
-    cmd = [tool_path, "--model", model]
+    if getattr(args, "run_async", False):
+        jobs_dir = review_jobs.get_jobs_dir(worktree_root or os.getcwd())
+        fields = {
+            "tool": tool_bin,
+            "tool_path": tool_path,
+            "model": model,
+            "use_wsl": use_wsl,
+            "mode": mode_label,
+            "project": project_name,
+            "branch": branch_name,
+            "cwd": os.getcwd(),
+            "diff_file": review_jobs.diff_path(jobs_dir, review_jobs.job_id(sent_hash, tool_bin, model)),
+        }
+        if current:
+            fields["watermark"] = {"root": worktree_root, "key": mark_key, "snapshot": current}
+        job, created = review_jobs.enqueue(jobs_dir, str(diff_file), sent_hash, fields)
+        if created:
+            spawn_gwt_background(["review", "--worker"], cwd=os.getcwd())
+            print_colored(t("review.job_queued", id=job["id"]), "32")
+        else:
+            status = review_jobs.effective_status(jobs_dir, job)
+            print_colored(t("review.job_duplicate", id=job["id"], status=t("review.job_status." + status)), "33")
+        print_colored(t("review.job_result_hint", id=job["id"]), "90")
+        return
 
-    if tool_bin == "codex":
-        cmd.extend(["-c", "reasoning_effort=high"])
-        cmd.extend(["--sandbox", "read-only"])
-        cmd.extend(["--ask-for-approval", "on-request"])
-        cmd.append(prompt)
-    elif tool_bin == "gemini":
-        cmd.extend(["-i", prompt])
-    else:
-        cmd.append(prompt)
+    print_colored(t("review.diff_captured", path=diff_file), "90")
+    print_colored(t("review.launching", tool=tool_bin.capitalize()), "36")
 
+    cmd = _tool_cmd(tool_bin, tool_path, model, _review_prompt(tool_bin, diff_file, project_name, branch_name), use_wsl)
     if use_wsl:
-        import shlex
-
-        cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
-        cmd = ["wsl", "bash", "-i", "-c", cmd_str]
         print_colored(t("review.wsl_running"), "90")
 
     try:
-        subprocess.run(cmd)
+        result = subprocess.run(cmd)
     except KeyboardInterrupt:
         print(t("review.cancelled"))
+        return
+
+    if result.returncode == 0 and current:
+        watermarks.record(worktree_root, mark_key, current, sent_hash)
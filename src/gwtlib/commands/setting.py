@@ -17,7 +17,8 @@ from gwtlib.config import (
     load_config,
     save_config,
 )
-from gwtlib.utils import print_colored
+from gwtlib import perf
+from gwtlib.utils import git_output, print_colored
 
 
 def _select_branch_for_setting(current_branch, prompt_text="Select branch", cwd=None):
@@ -104,9 +105,52 @@ def _select_branch_for_setting(current_branch, prompt_text="Select branch", cwd=
         return choice
 
 
+def _format_secs(secs):
+    return "?" if secs is None else f"{secs:.2f}s"
+
+
+def _perf_profile(args):
+    """`gwt setting --perf`: applies the git performance profile to this worktree."""
+    path = git_output(["rev-parse", "--show-toplevel"])
+    if not path:
+        print_colored(t("setting.not_git_repo"), "31")
+        return 1
+
+    settings = perf.profile_settings()
+    scope = (get_effective_config().get("perf") or {}).get("scope", "worktree")
+    print_colored(t("perf.title", path=path), "36", bold=True)
+    if getattr(args, "dry_run", False):
+        for key, value in settings:
+            print_colored(t("generic.would_run", cmd=f"git config --{scope} {key} {value}"), "90")
+        return
+
+    before_values = perf.current_values(path, [key for key, _ in settings])
+    before = perf.time_status(path)
+    scope, mismatched = perf.apply_profile(path, settings, scope)
+    print_colored(t("perf.scope", scope=scope), "90")
+    for key, value in settings:
+        old = before_values.get(key) or t("perf.unset")
+        if key in mismatched:
+            print_colored(f"   ✗ {key} = {value}  ({t('perf.not_effective')})", "31")
+        else:
+            print_colored(f"   ✓ {key} = {value}  ({t('perf.was', value=old)})", "32")
+    if not any(key == "core.fsmonitor" for key, _ in settings):
+        print_colored(t("perf.no_fsmonitor"), "90")
+
+    after = perf.time_status(path, warmup=True)
+    print()
+    print_colored(t("perf.timing", before=_format_secs(before), after=_format_secs(after)), "36")
+    if mismatched:
+        print_colored(t("perf.not_applied", keys=", ".join(mismatched)), "33")
+        return 1
+
+
 def cmd_setting(args):
     is_global = args.is_global
 
+    if getattr(args, "perf", False):
+        return _perf_profile(args)
+
     if args.show:
         config = get_effective_config() if not is_global else load_config(is_global=True)
         print_colored(t("setting.current_config"), "36", bold=True)
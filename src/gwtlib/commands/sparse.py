@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""GWT Sparse Command
+
+Cone-mode sparse-checkout helpers:
+- named profiles (`sparseProfiles` in setting.json) applied by `gwt new --profile`
+- `gwt sparse list/add/remove` to widen or narrow an existing worktree in place
+"""
+
+import json
+
+from gwtlib.i18n import t
+from gwtlib.config import get_effective_config
+from gwtlib.utils import git_output, is_inside_worktree, print_colored, run_cmd
+
+
+def _normalize_dir(path):
+    return path.replace("\\", "/").strip().strip("/")
+
+
+def get_sparse_profile(config, name):
+    """Returns the directory list of a profile, or None if it is not defined."""
+    profiles = config.get("sparseProfiles") or {}
+    dirs = profiles.get(name)
+    if dirs is None:
+        return None
+    return [d for d in (_normalize_dir(x) for x in dirs) if d]
+
+
+def apply_sparse_checkout(path, dirs):
+    """Sets cone-mode patterns on a `--no-checkout` worktree, then populates only those paths."""
+    if not run_cmd(["git", "-C", path, "sparse-checkout", "set", "--cone"] + dirs):
+        return False
+    # The index is still empty after `worktree add --no-checkout`; read-tree
+    # fills it and writes only the files inside the cone.
+    return run_cmd(["git", "-C", path, "read-tree", "-mu", "HEAD"])
+
+
+def _is_sparse():
+    return git_output(["config", "--bool", "core.sparseCheckout"]) == "true"
+
+
+def _current_dirs():
+    out = git_output(["sparse-checkout", "list"])
+    return [d for d in (_normalize_dir(x) for x in (out.splitlines() if out else [])) if d]
+
+
+def _tree_dirs(parent=""):
+    treeish = f"HEAD:{parent}" if parent else "HEAD"
+    out = git_output(["ls-tree", "-d", treeish])
+    if not out:
+        return []
+    prefix = f"{parent}/" if parent else ""
+    dirs = []
+    for line in out.splitlines():
+        # "<mode> <type> <oid>\t<name>"; gitlinks (submodules) are not directories here.
+        meta, _, name = line.partition("\t")
+        if name and meta.split()[1:2] == ["tree"]:
+            dirs.append(prefix + name)
+    return dirs
+
+
+def _expand_excluding(parent, target):
+    """Replaces `parent` by its sub-directories, minus the branch leading to `target`."""
+    kept = []
+    for child in _tree_dirs(parent):
+        if child == target:
+            continue
+        if target.startswith(child + "/"):
+            kept.extend(_expand_excluding(child, target))
+        else:
+            kept.append(child)
+    return kept
+
+
+def _narrow(dirs, target):
+    result = []
+    found = False
+    for d in dirs:
+        if d == target or d.startswith(target + "/"):
+            found = True
+            continue
+        if target.startswith(d + "/"):
+            found = True
+            result.extend(_expand_excluding(d, target))
+            continue
+        result.append(d)
+    return result, found
+
+
+def _print_dirs(dirs):
+    print_colored(t("sparse.list_title"), "36", bold=True)
+    for d in dirs:
+        print(f"   • {d}")
+
+
+def cmd_sparse(args):
+    action = getattr(args, "action", None) or "list"
+    config = get_effective_config()
+
+    if action == "profiles":
+        profiles = config.get("sparseProfiles") or {}
+        if not profiles:
+            print_colored(t("sparse.no_profiles"), "33")
+            return
+        print(json.dumps(profiles, indent=2, ensure_ascii=False))
+        return
+
+    if not is_inside_worktree():
+        print_colored(t("generic.not_git_dir"), "31")
+        return 1
+
+    if action == "list":
+        if not _is_sparse():
+            print_colored(t("sparse.not_sparse"), "90")
+            return
+        _print_dirs(_current_dirs())
+        return
+
+    paths = [d for d in (_normalize_dir(p) for p in (getattr(args, "paths", None) or [])) if d]
+    profile = getattr(args, "profile", None)
+    if profile:
+        profile_dirs = get_sparse_profile(config, profile)
+        if profile_dirs is None:
+            names = ", ".join(sorted((config.get("sparseProfiles") or {}).keys())) or "-"
+            print_colored(t("sparse.profile_unknown", name=profile, names=names), "31")
+            return 1
+        paths.extend(profile_dirs)
+
+    if not paths:
+        print_colored(t("sparse.no_paths"), "31")
+        return 1
+
+    sparse = _is_sparse()
+    if action == "add":
+        if not sparse:
+            print_colored(t("sparse.add_full"), "90")
+            return
+        cmd = ["git", "sparse-checkout", "add"] + paths
+        new_dirs = None
+    else:
+        dirs = _current_dirs() if sparse else _tree_dirs()
+        for target in paths:
+            dirs, found = _narrow(dirs, target)
+            if not found:
+                print_colored(t("sparse.not_in_cone", path=target), "33")
+        new_dirs = dirs
+        cmd = ["git", "sparse-checkout", "set", "--cone"] + new_dirs
+
+    if getattr(args, "dry_run", False):
+        print_colored(t("generic.dry_run"), "33")
+        print_colored(t("generic.would_run", cmd=" ".join(cmd)), "90")
+        return
+
+    if not run_cmd(cmd):
+        print_colored(t("sparse.failed"), "31")
+        return 1
+
+    dirs = _current_dirs()
+    print_colored(t("sparse.updated", n=len(dirs)), "32")
+    _print_dirs(dirs)
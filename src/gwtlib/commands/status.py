@@ -2,42 +2,133 @@
 """GWT Status Command"""
 import os
 import subprocess
+import sys
 import textwrap
+import time
 from pathlib import Path
 
 from gwtlib.i18n import t
-from gwtlib.utils import git_output, print_colored
+from gwtlib.utils import git_output, git_outputs, print_colored
+from gwtlib.watch import RepoWatcher
+
+
+def _submodule_paths():
+    """Initialized submodules (recursive), relative to the current directory."""
+    out = git_output(["submodule", "status", "--recursive"]) if os.path.exists(".gitmodules") else None
+    paths = []
+    for line in (out or "").splitlines():
+        parts = line.split()
+        # "-": not initialized; its empty directory would resolve to the superproject.
+        if len(parts) >= 2 and not line.startswith("-") and Path(parts[1]).exists():
+            paths.append(parts[1])
+    return paths
+
+
+def _query_blocks(root, sm_paths, which):
+    """{repo: [lines]} for the repos in `which` (root and/or submodule paths).
+
+    `root` may be None to query submodules only.
+    """
+    queries = []
+    order = []
+    if root in which:
+        # Submodules get their own block; here only their commit matters.
+        queries.append(["-C", root, "-c", "color.status=always", "status", "-sb", "--ignore-submodules=dirty"])
+        order.append(root)
+    for sm_path in sm_paths:
+        if sm_path in which:
+            queries.append(["-C", sm_path, "branch", "--show-current"])
+            queries.append(["-C", sm_path, "status", "-s"])
+            order.append(sm_path)
+    results = git_outputs(queries)
+
+    blocks = {}
+    i = 0
+    for repo in order:
+        if repo == root:
+            blocks[repo] = (results[i] or "").splitlines()
+            i += 1
+            continue
+        branch, stat = results[i] or "", results[i + 1] or ""
+        i += 2
+        if stat:
+            blocks[repo] = [f"  🔸 {repo} [{branch}]:"] + textwrap.indent(stat, "      ").splitlines()
+        else:
+            blocks[repo] = [f"  {t('status.submodule_clean', path=repo, branch=branch)}"]
+    return blocks
+
+
+def _redraw(root, sm_paths, blocks, backend, secs):
+    lines = [t("status.watch_header", n=1 + len(sm_paths), backend=backend, time=time.strftime("%H:%M:%S"), secs=secs), ""]
+    lines.append(f"\033[1;36m{t('status.main_repo')}\033[0m")
+    lines.extend(blocks.get(root, []))
+    if sm_paths:
+        lines.append("")
+        lines.append(f"\033[1;36m{t('status.submodules')}\033[0m")
+        for sm_path in sm_paths:
+            lines.extend(blocks.get(sm_path, []))
+    # Cursor home, rewrite, clear what is left of the previous frame.
+    sys.stdout.write("\033[H" + "".join(f"{line}\033[K\n" for line in lines) + "\033[J")
+    sys.stdout.flush()
+
+
+def _watch():
+    root = git_output(["rev-parse", "--show-toplevel"])
+    if not root:
+        print_colored(t("generic.not_git_repo"), "31")
+        return 1
+    os.chdir(root)
+    sm_paths = _submodule_paths()
+    repos = [root] + sm_paths
+    git_dirs = git_outputs([["-C", repo, "rev-parse", "--absolute-git-dir"] for repo in repos])
+    # Only submodules with a repository of their own are watched separately.
+    kept = [(repo, git_dir) for repo, git_dir in zip(repos, git_dirs) if repo == root or (git_dir and git_dir != git_dirs[0])]
+    sm_paths = [repo for repo, _ in kept[1:]]
+    repos = [root] + sm_paths
+    watcher = RepoWatcher({os.path.abspath(repo): git_dir for repo, git_dir in kept})
+    by_abs = {os.path.normpath(os.path.abspath(repo)): repo for repo in repos}
+    # A submodule's HEAD moving also changes the line the superproject shows for it.
+    sm_heads = git_outputs([["-C", sm, "rev-parse", "HEAD"] for sm in sm_paths])
+
+    start = time.monotonic()
+    blocks = _query_blocks(root, sm_paths, set(repos))
+    sys.stdout.write("\033[2J")
+    _redraw(root, sm_paths, blocks, watcher.backend, f"{time.monotonic() - start:.2f}")
+    try:
+        while True:
+            changed = {by_abs[r] for r in watcher.wait() if r in by_abs}
+            if not changed:
+                continue
+            if changed & set(sm_paths):
+                heads = git_outputs([["-C", sm, "rev-parse", "HEAD"] for sm in sm_paths])
+                if heads != sm_heads:
+                    changed.add(root)
+                sm_heads = heads
+            start = time.monotonic()
+            updated = _query_blocks(root, sm_paths, changed)
+            if any(blocks.get(repo) != lines for repo, lines in updated.items()):
+                blocks.update(updated)
+                _redraw(root, sm_paths, blocks, watcher.backend, f"{time.monotonic() - start:.2f}")
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
 
 
 def cmd_status(args):
     """Show status of main repository and submodules."""
+    if getattr(args, "watch", False):
+        return _watch()
+
     print_colored(t("status.main_repo"), "36", bold=True)
     subprocess.run(["git", "status", "-sb"])
     print("")
 
     if os.path.exists(".gitmodules"):
         print_colored(t("status.submodules"), "36", bold=True)
-        submodules_status = git_output(["submodule", "status", "--recursive"])
-        if submodules_status:
-            for line in submodules_status.splitlines():
-                parts = line.split()
-                if len(parts) >= 2:
-                    sm_path = parts[1]
-                    sm_full_path = Path(sm_path)
-                    if sm_full_path.exists():
-                        proc_branch = subprocess.run(
-                            ["git", "-C", sm_path, "branch", "--show-current"],
-                            capture_output=True, text=True
-                        )
-                        branch = proc_branch.stdout.strip()
-                        proc_stat = subprocess.run(
-                            ["git", "-C", sm_path, "status", "-s"],
-                            capture_output=True, text=True
-                        )
-                        stat = proc_stat.stdout.strip()
-
-                        if stat:
-                            print(f"  🔸 {sm_path} [{branch}]:")
-                            print(textwrap.indent(stat, "      "))
-                        else:
-                            print(f"  {t('status.submodule_clean', path=sm_path, branch=branch)}")
+        sm_paths = _submodule_paths()
+        # Query every submodule concurrently, then print in order.
+        blocks = _query_blocks(None, sm_paths, set(sm_paths))
+        for sm_path in sm_paths:
+            for line in blocks[sm_path]:
+                print(line)
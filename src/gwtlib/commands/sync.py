@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""GWT Sync Command
+
+Brings every worktree up to date with its upstream:
+
+- one `git fetch --all --prune` for the whole repository (coordinated, see gwtlib.fetch)
+- per worktree, in parallel: fast-forward (or rebase, per `sync.policy`)
+- dirty worktrees, detached HEADs and branches without upstream are skipped
+"""
+
+from gwtlib.config import get_effective_config
+from gwtlib.fetch import fetch_remotes
+from gwtlib.i18n import t
+from gwtlib.utils import (
+    ASYNC_CMD_LIMIT,
+    gather_cmds,
+    get_main_worktree,
+    git_output,
+    git_outputs,
+    is_pool_worktree,
+    list_worktrees,
+    print_colored,
+)
+
+# Rows that still need a git command; everything else is a final result.
+PENDING = ("ff", "rebase")
+
+
+def _upstreams():
+    """{branch: (upstream ref, short name, gone)} for local branches with an upstream."""
+    out = git_output(["for-each-ref", "--format=%(refname)%00%(upstream)%00%(upstream:short)%00%(upstream:track)", "refs/heads"])
+    result = {}
+    for line in (out or "").splitlines():
+        parts = line.split("\0")
+        if len(parts) == 4 and parts[1]:
+            result[parts[0][len("refs/heads/"):]] = (parts[1], parts[2], parts[3] == "[gone]")
+    return result
+
+
+def plan_sync(worktrees, upstreams, dirty, counts, policy):
+    """Decides what to do with each worktree.
+
+    worktrees: dicts from list_worktrees(); upstreams: from _upstreams();
+    dirty: {path: bool}; counts: {path: (ahead, behind)}.
+    Returns rows {"wt", "upstream", "action", "ahead", "behind"} where action is
+    "ff"/"rebase" (to run) or a final result: "uptodate", "ahead", "diverged",
+    "dirty", "no_upstream", "gone", "detached", "failed".
+    """
+    rows = []
+    for wt in worktrees:
+        row = {"wt": wt, "upstream": None, "action": None, "ahead": 0, "behind": 0}
+        rows.append(row)
+        branch = wt.get("branch")
+        if not branch:
+            row["action"] = "detached"
+            continue
+        upstream = upstreams.get(branch)
+        if not upstream:
+            row["action"] = "no_upstream"
+            continue
+        row["upstream"] = upstream
+        if upstream[2]:
+            row["action"] = "gone"
+            continue
+        if dirty.get(wt["path"], True):
+            row["action"] = "dirty"
+            continue
+        if wt["path"] not in counts:
+            row["action"] = "failed"
+            continue
+        ahead, behind = counts[wt["path"]]
+        row["ahead"], row["behind"] = ahead, behind
+        if not behind:
+            row["action"] = "ahead" if ahead else "uptodate"
+        elif not ahead:
+            row["action"] = "ff"
+        elif policy == "rebase":
+            row["action"] = "rebase"
+        else:
+            row["action"] = "diverged"
+    return rows
+
+
+def _parse_counts(out):
+    try:
+        ahead, behind = out.split()
+        return int(ahead), int(behind)
+    except (AttributeError, ValueError):
+        return None
+
+
+_RESULTS = {
+    "ff": ("✅", "32"),
+    "rebase": ("✅", "32"),
+    "uptodate": ("✔️ ", "90"),
+    "ahead": ("⬆️ ", "36"),
+    "diverged": ("⚠️ ", "33"),
+    "conflict": ("❌", "31"),
+    "failed": ("❌", "31"),
+}
+
+
+def _print_row(row, dry_run):
+    action = row["action"]
+    icon, color = _RESULTS.get(action, ("⏭️ ", "90"))
+    key = f"sync.would.{action}" if dry_run and action in PENDING else f"sync.result.{action}"
+    detail = t(key, ahead=row["ahead"], behind=row["behind"], upstream=row["upstream"][1] if row["upstream"] else "")
+    wt = row["wt"]
+    print_colored(f"   {icon} {(wt.get('branch') or '-'):<30} {detail}", color)
+    print_colored(f"       {wt['path']}", "90")
+
+
+def cmd_sync(args):
+    main_worktree = get_main_worktree()
+    if not main_worktree:
+        print_colored(t("generic.not_git_repo"), "31")
+        return 1
+
+    config = get_effective_config()
+    policy = getattr(args, "policy", None) or (config.get("sync") or {}).get("policy", "ff-only")
+    jobs = getattr(args, "jobs", None) or ASYNC_CMD_LIMIT
+    dry_run = bool(getattr(args, "dry_run", False))
+
+    if dry_run:
+        print_colored(t("generic.dry_run"), "33")
+    if getattr(args, "no_fetch", False):
+        print_colored(t("sync.fetch_skipped"), "90")
+    elif dry_run:
+        fetch = ["git", "-C", main_worktree, "fetch", "--all", "--prune", f"--jobs={jobs}"]
+        print_colored(t("generic.would_run", cmd=" ".join(fetch)), "90")
+    else:
+        print_colored(t("sync.fetching"), "36")
+        if not fetch_remotes(config, cwd=main_worktree, jobs=jobs, force=getattr(args, "fetch", False)):
+            print_colored(t("sync.fetch_failed"), "33")
+
+    worktrees = [
+        wt for wt in list_worktrees()
+        if not wt["bare"] and not wt["prunable"] and not is_pool_worktree(wt["path"])
+    ]
+    upstreams = _upstreams()
+    tracked = [wt for wt in worktrees if wt.get("branch") in upstreams]
+
+    statuses = git_outputs(
+        [["-C", wt["path"], "status", "--porcelain", "--untracked-files=no"] for wt in tracked], limit=jobs
+    )
+    dirty = {wt["path"]: status is None or bool(status) for wt, status in zip(tracked, statuses)}
+    count_out = git_outputs(
+        [
+            ["rev-list", "--left-right", "--count", f"refs/heads/{wt['branch']}...{upstreams[wt['branch']][0]}"]
+            for wt in tracked
+        ],
+        limit=jobs,
+    )
+    counts = {}
+    for wt, out in zip(tracked, count_out):
+        parsed = _parse_counts(out)
+        if parsed:
+            counts[wt["path"]] = parsed
+
+    rows = plan_sync(worktrees, upstreams, dirty, counts, policy)
+    pending = [row for row in rows if row["action"] in PENDING]
+
+    if pending and not dry_run:
+        cmds = []
+        for row in pending:
+            git_c = ["git", "-C", row["wt"]["path"]]
+            if row["action"] == "ff":
+                cmds.append(git_c + ["merge", "--ff-only", "--quiet", row["upstream"][0]])
+            else:
+                cmds.append(git_c + ["rebase", "--quiet", row["upstream"][0]])
+        results = gather_cmds(cmds, capture_output=True, limit=jobs)
+        aborts = []
+        for row, result in zip(pending, results):
+            if result is not None:
+                continue
+            if row["action"] == "rebase":
+                row["action"] = "conflict"
+                aborts.append(["git", "-C", row["wt"]["path"], "rebase", "--abort"])
+            else:
+                row["action"] = "failed"
+        gather_cmds(aborts, capture_output=True, limit=jobs)
+
+    print_colored(t("sync.title", n=len(rows), policy=policy), "36", bold=True)
+    for row in rows:
+        _print_row(row, dry_run)
+
+    summary = {"updated": 0, "current": 0, "diverged": 0, "skipped": 0, "failed": 0}
+    for row in rows:
+        action = row["action"]
+        if action in PENDING:
+            summary["updated"] += 1
+        elif action in ("uptodate", "ahead"):
+            summary["current"] += 1
+        elif action == "diverged":
+            summary["diverged"] += 1
+        elif action in ("conflict", "failed"):
+            summary["failed"] += 1
+        else:
+            summary["skipped"] += 1
+    print_colored(t("sync.summary", **summary), "31" if summary["failed"] else "32")
+    return 1 if summary["failed"] else None
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""GWT Trash Command
+
+Inspects or empties the trash filled by `gwt remove --fast`.
+
+- status: list pending entries and their size
+- empty: delete them now (also what the background reaper runs)
+"""
+
+import time
+
+from gwtlib.i18n import t
+from gwtlib.trash import empty_trash, trash_entries, tree_size
+from gwtlib.utils import format_size, get_git_common_dir, print_colored
+
+
+def cmd_trash(args):
+    action = getattr(args, "action", None) or "status"
+    common_dir = get_git_common_dir()
+    if not common_dir:
+        print_colored(t("generic.not_git_repo"), "31")
+        return 1
+
+    entries = trash_entries(common_dir)
+    if not entries:
+        print_colored(t("trash.empty"), "32")
+        return
+
+    if action == "empty":
+        if getattr(args, "dry_run", False):
+            print_colored(t("generic.dry_run"), "33")
+            for entry in entries:
+                print_colored(t("trash.would_delete", path=entry), "90")
+            return
+        start = time.monotonic()
+        left = empty_trash(common_dir)
+        if left:
+            print_colored(t("trash.left", n=left), "33")
+            return 1
+        print_colored(t("trash.emptied", n=len(entries), secs=f"{time.monotonic() - start:.1f}"), "32")
+        return
+
+    print_colored(t("trash.status_title"), "36", bold=True)
+    total = 0
+    for entry in entries:
+        files, size = tree_size(entry)
+        total += size
+        print(f"   • {entry}  {t('trash.entry_size', files=files, size=format_size(size))}")
+    print_colored(t("trash.status_total", n=len(entries), size=format_size(total)), "90")
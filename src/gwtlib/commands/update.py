@@ -3,8 +3,10 @@
 import os
 import subprocess
 
+from gwtlib.config import get_effective_config
+from gwtlib.fetch import fetch_remotes
 from gwtlib.i18n import t
-from gwtlib.utils import run_cmd, print_colored
+from gwtlib.utils import print_colored
 
 
 def _find_git_root(start_dir):
@@ -27,8 +29,8 @@ def cmd_update(args):
 
     if getattr(args, "dry_run", False):
         print_colored(t("generic.dry_run"), "33")
-        print_colored(t("generic.would_run", cmd="git fetch"), "90")
-        print_colored(t("generic.would_run", cmd="git pull --ff-only"), "90")
+        print_colored(t("generic.would_run", cmd="git fetch --all --prune"), "90")
+        print_colored(t("generic.would_run", cmd="git merge --ff-only @{u}"), "90")
         return
     
     if not gwt_dir:
@@ -41,13 +43,13 @@ def cmd_update(args):
         os.chdir(gwt_dir)
         print_colored(t("update.cd_to", path=gwt_dir), "90")
         
-        # Fetch first
+        # Fetch first (skipped when another gwt just fetched this repository)
         print_colored(t("update.fetching"), "36")
-        run_cmd(["git", "fetch"])
+        fetch_remotes(get_effective_config(), cwd=gwt_dir)
         
-        # Pull with --ff-only
+        # Fast-forward to the fetched upstream; `git pull` would fetch again
         print_colored(t("update.pulling"), "36")
-        result = subprocess.run(["git", "pull", "--ff-only"], capture_output=True, text=True)
+        result = subprocess.run(["git", "merge", "--ff-only", "@{u}"], capture_output=True, text=True)
         
         if result.returncode == 0:
             if "Already up to date" in result.stdout or "Already up-to-date" in result.stdout:
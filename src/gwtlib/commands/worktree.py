@@ -9,26 +9,279 @@ Commands:
 - prune
 """
 
+import json
 import os
 import shutil
+import sqlite3
 import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from gwtlib import frecency, maintenance, perf, wtindex
 from gwtlib.i18n import t
+from gwtlib.artifacts import get_artifact_settings, seed_artifacts
 from gwtlib.config import get_effective_config
+from gwtlib.diskusage import SizeWalker, classify
+from gwtlib.fetch import fetch_remotes
+from gwtlib.commands.pool import claim_pool_worktree, get_pool_settings
+from gwtlib.commands.sparse import apply_sparse_checkout, get_sparse_profile
+from gwtlib.trash import trash_worktree
 from gwtlib.utils import (
-    ensure_worktree_gitignore,
+    ASYNC_CMD_LIMIT,
+    gather_cmds,
+    format_age,
+    find_git_dirs,
+    format_size,
     get_branch_worktree,
+    get_git_common_dir,
     get_main_worktree,
+    get_worktree_root,
     git_output,
+    git_outputs,
     is_inside_worktree,
+    is_pool_worktree,
+    list_worktrees,
     print_colored,
     request_cd,
     run_cmd,
+    spawn_gwt_background,
 )
 
 
+def _visible_worktrees():
+    """Worktrees users work in: no bare entry, no idle pool slots."""
+    return [wt for wt in list_worktrees() if not wt["bare"] and not is_pool_worktree(wt["path"])]
+
+
+def _update_index(func, *args, common_dir=None):
+    """Best effort: the metadata index must never fail a worktree operation."""
+    common_dir = common_dir or get_git_common_dir()
+    if not common_dir:
+        return None
+    try:
+        return func(common_dir, *args)
+    except (sqlite3.Error, OSError):
+        return None
+
+
 def cmd_list(args):
-    subprocess.run(["git", "worktree", "list"])
+    if not any(getattr(args, flag, False) for flag in ("meta", "size", "long", "json")):
+        subprocess.run(["git", "worktree", "list"])
+        return
+    _list_table(args)
+
+
+def _measure_sizes(worktrees, common_dir, refresh=False):
+    """Walks all worktrees in parallel; returns ({path: (total, tracked, ignored, untracked)}, deduped_total)."""
+    roots = [os.path.normpath(wt["path"]) for wt in worktrees]
+    # Never descend into another worktree (nested .worktree dirs, pool slots) or a .git dir.
+    skip = {os.path.normpath(wt["path"]) for wt in list_worktrees()}
+    skip.update(os.path.join(root, ".git") for root in roots)
+
+    listings = []
+    lister = threading.Thread(
+        target=lambda: listings.extend(
+            git_outputs(
+                [["-C", root, "ls-files", "--others", "--ignored", "--exclude-standard", "--directory"] for root in roots]
+                + [["-C", root, "ls-files", "--others", "--exclude-standard", "--directory"] for root in roots]
+            )
+        )
+    )
+    lister.start()
+
+    walker = SizeWalker(skip=skip, common_dir=common_dir, refresh=refresh)
+    tty = sys.stdout.isatty()
+
+    def _progress(n):
+        if tty:
+            print(f"\r\033[K{t('list.size_scanning', n=n)}", end="", flush=True)
+
+    walker.walk(roots, on_progress=_progress)
+    lister.join()
+    if tty:
+        print("\r\033[K", end="", flush=True)
+
+    ignored_out, untracked_out = listings[: len(roots)], listings[len(roots):]
+    sizes = {}
+    for root, ign, unt in zip(roots, ignored_out, untracked_out):
+        sizes[root] = classify(walker, root, (ign or "").splitlines(), (unt or "").splitlines())
+        _update_index(wtindex.record_size, root, sizes[root][0], common_dir=common_dir)
+    seen = set()
+    deduped = sum(walker.subtree(root, seen) for root in roots)
+    return sizes, deduped
+
+
+_REF_FIELDS = ("ref", "upstream", "track", "date", "subject")
+
+
+def parse_ref_details(output, with_ahead_behind):
+    """Parses `for-each-ref` output (NUL separated fields, see _branch_details)."""
+    details = {}
+    for line in (output or "").splitlines():
+        parts = line.split("\0")
+        expected = len(_REF_FIELDS) + (1 if with_ahead_behind else 0)
+        if len(parts) != expected:
+            continue
+        info = dict(zip(_REF_FIELDS, parts[: len(_REF_FIELDS)]))
+        info["date"] = int(info["date"]) if info["date"].isdigit() else None
+        if with_ahead_behind:
+            counts = parts[-1].split()
+            if len(counts) == 2 and all(c.isdigit() for c in counts):
+                info["ahead"], info["behind"] = int(counts[0]), int(counts[1])
+        details[info.pop("ref")] = info
+    return details
+
+
+def _branch_details(worktrees, main_branch):
+    """Upstream, track, ahead/behind vs main, last commit date + subject for every worktree.
+
+    One `for-each-ref` covers all branches; `%(ahead-behind:)` needs git 2.41,
+    older gits get the counts from parallel `rev-list --left-right --count`.
+    Detached HEADs are resolved with a single `log --no-walk`.
+    """
+    branches = sorted({wt["branch"] for wt in worktrees if wt["branch"]})
+    patterns = [f"refs/heads/{b}" for b in branches]
+    fields = "%(refname:short)%00%(upstream:short)%00%(upstream:track,nobracket)%00%(committerdate:unix)%00%(subject)"
+    details = {}
+    if patterns:
+        out = git_output(["for-each-ref", f"--format={fields}%00%(ahead-behind:{main_branch})"] + patterns)
+        with_ab = out is not None
+        if not with_ab:
+            out = git_output(["for-each-ref", f"--format={fields}"] + patterns)
+        details = parse_ref_details(out, with_ab)
+
+    detached = [wt["head"] for wt in worktrees if not wt["branch"] and wt["head"]]
+    if detached:
+        out = git_output(["log", "--no-walk=unsorted", "--format=%H%x00%ct%x00%s"] + detached)
+        for line in (out or "").splitlines():
+            parts = line.split("\0")
+            if len(parts) == 3:
+                details[parts[0]] = {"upstream": "", "track": "", "date": int(parts[1]) if parts[1].isdigit() else None, "subject": parts[2]}
+
+    keys = [wt["branch"] or wt["head"] for wt in worktrees]
+    missing = [k for k in dict.fromkeys(keys) if k in details and "ahead" not in details[k]]
+    if missing:
+        counts = git_outputs([["rev-list", "--left-right", "--count", f"{k}...{main_branch}"] for k in missing])
+        for key, out in zip(missing, counts):
+            parts = (out or "").split()
+            if len(parts) == 2:
+                details[key]["ahead"], details[key]["behind"] = int(parts[0]), int(parts[1])
+    return {wt["path"]: details.get(wt["branch"] or wt["head"], {}) for wt in worktrees}
+
+
+def _list_table(args):
+    """`gwt list --meta/--size/--long [--json]`.
+
+    --meta reads the index (no per-worktree git), --long adds one for-each-ref
+    pass, --size walks the worktrees.
+    """
+    worktrees = _visible_worktrees()
+    if not worktrees:
+        print_colored(t("worktree.no_worktrees"), "31")
+        return
+    meta = getattr(args, "meta", False)
+    long_fmt = getattr(args, "long", False)
+    as_json = getattr(args, "json", False)
+    refresh = getattr(args, "refresh", False)
+    common_dir = get_git_common_dir()
+    rows = _update_index(wtindex.reconcile, worktrees, common_dir=common_dir) or {}
+
+    if meta and refresh:
+        paths = [wt["path"] for wt in worktrees]
+        statuses = git_outputs([["-C", path, "status", "--porcelain"] for path in paths])
+        states = {path: status is None or bool(status) for path, status in zip(paths, statuses)}
+        _update_index(wtindex.record_dirty, states, common_dir=common_dir)
+        for path, dirty in states.items():
+            row = rows.get(os.path.normpath(os.path.abspath(path)))
+            if row is not None:
+                row["dirty"] = int(dirty)
+
+    sizes, deduped = ({}, 0)
+    if getattr(args, "size", False):
+        sizes, deduped = _measure_sizes(worktrees, common_dir, refresh=refresh)
+    details = {}
+    main_branch = get_effective_config().get("mainBranch", "main")
+    if long_fmt:
+        details = _branch_details(worktrees, main_branch)
+
+    records = []
+    for wt in worktrees:
+        path = os.path.normpath(os.path.abspath(wt["path"]))
+        rec = {
+            "path": wt["path"],
+            "branch": wt["branch"],
+            "head": wt["head"],
+            "locked": wt["locked"],
+        }
+        if meta:
+            row = rows.get(path) or {}
+            rec.update({k: row.get(k) for k in ("base", "created_at", "last_used", "size_bytes")})
+            rec["dirty"] = None if row.get("dirty") is None else bool(row["dirty"])
+        if long_fmt:
+            info = details.get(wt["path"], {})
+            rec.update({
+                "upstream": info.get("upstream") or None,
+                "track": info.get("track") or None,
+                "ahead": info.get("ahead"),
+                "behind": info.get("behind"),
+                "committed_at": info.get("date"),
+                "subject": info.get("subject"),
+            })
+        if sizes:
+            total, tracked, ignored, untracked = sizes.get(path, (0, 0, 0, 0))
+            rec.update(size_bytes=total, tracked_bytes=tracked, ignored_bytes=ignored, untracked_bytes=untracked)
+        records.append(rec)
+
+    if as_json:
+        print(json.dumps({"mainBranch": main_branch, "worktrees": records}, ensure_ascii=False, indent=2))
+        return
+
+    now = time.time()
+
+    def _ago(ts):
+        return format_age(now - ts) if ts else "-"
+
+    columns = [
+        ("list.col.path", lambda r: r["path"]),
+        ("list.col.branch", lambda r: r["branch"] or f"({r['head'][:8]})"),
+    ]
+    if long_fmt:
+        columns += [
+            ("list.col.main", lambda r: "-" if r["ahead"] is None else f"+{r['ahead']}/-{r['behind']}"),
+            ("list.col.upstream", lambda r: (r["upstream"] or "-") + (f" [{r['track']}]" if r["track"] else "")),
+            ("list.col.commit", lambda r: _ago(r["committed_at"])),
+        ]
+    if meta:
+        columns += [
+            ("list.col.base", lambda r: r["base"] or "-"),
+            ("list.col.age", lambda r: _ago(r["created_at"])),
+            ("list.col.used", lambda r: _ago(r["last_used"])),
+        ]
+        if not sizes:
+            columns.append(("list.col.size", lambda r: format_size(r["size_bytes"]) if r["size_bytes"] is not None else "-"))
+        columns.append(("list.col.dirty", lambda r: "?" if r["dirty"] is None else ("*" if r["dirty"] else "")))
+    if sizes:
+        columns += [
+            ("list.col.size", lambda r: format_size(r["size_bytes"])),
+            ("list.col.tracked", lambda r: format_size(r["tracked_bytes"])),
+            ("list.col.ignored", lambda r: format_size(r["ignored_bytes"])),
+            ("list.col.untracked", lambda r: format_size(r["untracked_bytes"])),
+        ]
+    if long_fmt:
+        columns.append(("list.col.subject", lambda r: r["subject"] or ""))
+
+    header = [t(key) for key, _ in columns]
+    table = [[fn(r) for _, fn in columns] for r in records]
+    widths = [max(len(str(r[i])) for r in table + [header]) for i in range(len(header))]
+    print_colored("  ".join(h.ljust(w) for h, w in zip(header, widths)).rstrip(), "36", bold=True)
+    for r in table:
+        print("  ".join(str(c).ljust(w) for c, w in zip(r, widths)).rstrip())
+    if sizes:
+        print_colored(t("list.size_total", size=format_size(deduped), n=len(sizes)), "90")
+    if meta and any(r["dirty"] is None for r in records):
+        print_colored(t("list.dirty_hint"), "90")
 
 
 def _interactive_select_branch():
@@ -40,7 +293,7 @@ def _interactive_select_branch():
     - is_remote: True if selected from remote branches
     """
     print_colored(t("worktree.fetch_remote"), "36")
-    run_cmd(["git", "fetch", "--all", "--prune"])
+    fetch_remotes(get_effective_config())
 
     local_output = git_output(["branch", "--format=%(refname:short)"])
     local_branches = local_output.splitlines() if local_output else []
@@ -139,56 +392,129 @@ def _interactive_select_branch():
     return None, False
 
 
-def cmd_new(args):
-    branch_name = args.branch if getattr(args, "branch", None) else None
-    base_branch = args.base if getattr(args, "base", None) else "HEAD"
-    auto_yes = bool(getattr(args, "yes", False) or getattr(args, "dry_run", False))
+def _submodule_settings(config):
+    settings = config.get("submoduleUpdate") or {}
+    jobs = settings.get("jobs", 0) or os.cpu_count() or 4
+    return jobs, settings.get("shareObjects", True)
 
-    repo_root = get_main_worktree()
-    if not repo_root:
-        print_colored(t("generic.not_git_repo"), "31")
-        return
 
-    if not branch_name:
-        branch_name, _is_remote = _interactive_select_branch()
-        if not branch_name:
-            return
+def _update_submodules(worktree_path, config, quiet=False):
+    """Initialises submodules of a new worktree, reusing the main worktree's object stores.
 
-    config = get_effective_config()
-    worktree_dir_template = config.get("worktreeDir", ".worktree")
+    Each submodule whose repository already exists under `<common-dir>/modules`
+    is cloned from that local copy (objects are hardlinked, no network), then
+    its `origin` URL and remote-tracking refs are restored from the real remote.
+    The local clone needs `protocol.file.allow=always` (git >= 2.38.1 refuses
+    the file transport for submodules by default); if it fails anyway, a
+    plain `submodule update --init` is run instead.
+    """
+    jobs, share = _submodule_settings(config)
+    git_c = ["git", "-C", worktree_path]
+    overrides = []
+    shared = []
+
+    if share:
+        run_cmd(git_c + ["submodule", "init"], capture_output=True)
+        common_dir = get_git_common_dir(worktree_path)
+        paths_out = git_output(
+            ["-C", worktree_path, "config", "-f", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"]
+        )
+        names = []
+        for line in (paths_out or "").splitlines():
+            key, _, _sm_path = line.partition(" ")
+            name = key[len("submodule."):-len(".path")]
+            module_dir = os.path.join(common_dir or os.path.join(worktree_path, ".git"), "modules", name)
+            if os.path.isdir(os.path.join(module_dir, "objects")):
+                names.append((name, os.path.normpath(module_dir)))
+
+        urls = git_outputs([["-C", worktree_path, "config", "--get", f"submodule.{n}.url"] for n, _ in names])
+        for (name, module_dir), url in zip(names, urls):
+            if url:
+                overrides.extend(["-c", f"submodule.{name}.url={module_dir}"])
+                shared.append((name, module_dir, url))
+        if overrides:
+            overrides = ["-c", "protocol.file.allow=always"] + overrides
+
+    def _update(extra):
+        # The shared attempt stays quiet: its errors are followed by a retry.
+        capture = quiet or bool(extra)
+        cmd = ["git", "-C", worktree_path] + extra + ["submodule", "update", "--init", "--force", f"--jobs={jobs}"]
+        ok = run_cmd(cmd, capture_output=capture)
+        return ok is not None if capture else ok
+
+    if not shared:
+        return _update([])
+    if not _update(overrides):
+        # Leave the shared clone to git's usual path (network, protocol policy).
+        return _update([])
+
+    if not quiet:
+        print_colored(t("worktree.submodules_shared", n=len(shared)), "90")
+    sm_paths = {}
+    for line in (git_output(["-C", worktree_path, "submodule", "foreach", "--quiet", "echo $name $sm_path"]) or "").splitlines():
+        name, _, sm_path = line.partition(" ")
+        sm_paths[name] = os.path.join(worktree_path, sm_path)
+
+    shared = [(n, d, u) for n, d, u in shared if n in sm_paths]
+    # Point origin back at the real remote and mirror its tracking refs from the local copy.
+    gather_cmds(
+        [["git", "-C", sm_paths[n], "remote", "set-url", "origin", u] for n, _, u in shared],
+        limit=jobs,
+    )
+    gather_cmds(
+        [
+            [
+                "git", "-C", sm_paths[n], "fetch", "--quiet", "--prune", "--no-tags", d,
+                "+refs/remotes/origin/*:refs/remotes/origin/*",
+                "^refs/remotes/origin/HEAD",
+                "+refs/tags/*:refs/tags/*",
+            ]
+            for n, d, _ in shared
+        ],
+        limit=jobs,
+    )
+    return True
 
-    # Get repository name for path template
-    repo_name = os.path.basename(repo_root)
-    worktree_dir_name = worktree_dir_template.format(repo_name=repo_name, sep=os.sep)
 
-    # Handle relative paths starting with ../ (place worktree outside repo)
-    if worktree_dir_name.startswith(".." + os.sep) or worktree_dir_name.startswith("../"):
-        worktree_dir = os.path.normpath(os.path.join(repo_root, worktree_dir_name))
+def _create_from_pool(repo_root, config, new_path, branch_name, start_point, remote_branch):
+    """Claims a pre-warmed pool slot for `new_path` and switches it to the branch."""
+    if start_point is None:
+        checkout = ["checkout", branch_name]
     else:
-        worktree_dir = os.path.join(repo_root, worktree_dir_name)
-        ensure_worktree_gitignore(repo_root, worktree_dir_name)
+        if start_point != remote_branch:
+            # Relative refs like HEAD must be resolved here, not inside the slot.
+            start_point = git_output(["rev-parse", "--verify", "--quiet", f"{start_point}^{{commit}}"])
+            if not start_point:
+                return False
+        checkout = ["checkout", "-b", branch_name, start_point]
 
-    safe_branch_name = branch_name.replace("/", "-")
-    new_path = os.path.join(worktree_dir, safe_branch_name)
+    if not claim_pool_worktree(repo_root, config, new_path):
+        return False
 
-    print_colored(
-        t("worktree.create_worktree", path=new_path, branch=branch_name),
-        "36",
-    )
+    print_colored(t("worktree.pool_claimed"), "90")
+    if run_cmd(["git", "-C", new_path] + checkout):
+        return True
 
-    local_branch_exists = (
-        run_cmd(["git", "rev-parse", "--verify", branch_name], capture_output=True)
-        is not None
-    )
+    run_cmd(["git", "worktree", "remove", "--force", new_path])
+    return False
 
-    remote_branch = f"origin/{branch_name}"
-    remote_branch_exists = (
-        run_cmd(["git", "rev-parse", "--verify", remote_branch], capture_output=True)
-        is not None
-    )
 
+def _read_branch_list(source):
+    """Branch names from a file (`-` = stdin): one per line, `#` starts a comment."""
+    if source == "-":
+        text = sys.stdin.read()
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            text = f.read()
+    return [name for name in (line.split("#", 1)[0].strip() for line in text.splitlines()) if name]
+
+
+def _plan_worktree(branch_name, base_branch, new_path, no_checkout, auto_yes, local_exists, remote_exists):
+    """Prints what will happen for one branch; returns (worktree add cmd, start point) or None."""
     cmd = ["git", "worktree", "add"]
-    if local_branch_exists:
+    if no_checkout:
+        cmd.append("--no-checkout")
+    if local_exists:
         existing_worktree = get_branch_worktree(branch_name)
         if existing_worktree:
             print_colored(t("worktree.branch_used", branch=branch_name), "33")
@@ -196,11 +522,14 @@ def cmd_new(args):
             print_colored(t("worktree.you_can"), "36")
             print(t("worktree.you_can_1"))
             print(t("worktree.you_can_2"))
-            return
+            return None
 
         print_colored(t("worktree.branch_exists_local", branch=branch_name), "90")
         cmd.extend([new_path, branch_name])
-    elif remote_branch_exists:
+        return cmd, None
+
+    remote_branch = f"origin/{branch_name}"
+    if remote_exists:
         print_colored(t("worktree.found_remote_branch", branch=remote_branch), "36")
         if auto_yes:
             choice = "y"
@@ -216,72 +545,70 @@ def cmd_new(args):
                 "90",
             )
             cmd.extend(["-b", branch_name, new_path, remote_branch])
-        else:
-            print_colored(t("worktree.create_from_base", branch=branch_name, base=base_branch), "90")
-            cmd.extend(["-b", branch_name, new_path, base_branch])
+            return cmd, remote_branch
+        print_colored(t("worktree.create_from_base", branch=branch_name, base=base_branch), "90")
     else:
         print_colored(
             t("worktree.branch_not_found_create", branch=branch_name, base=base_branch),
             "90",
         )
-        cmd.extend(["-b", branch_name, new_path, base_branch])
+    cmd.extend(["-b", branch_name, new_path, base_branch])
+    return cmd, base_branch
 
-    if getattr(args, "dry_run", False):
-        print_colored(t("generic.dry_run"), "33")
-        print_colored(t("generic.would_run", cmd=" ".join(cmd)), "90")
-        print_colored(t("generic.would_cd", path=new_path), "90")
-        return
 
-    if not run_cmd(cmd):
-        print_colored(t("worktree.create_failed"), "31")
-        return
+def _branch_existence(branch_names):
+    """[(local_exists, remote_exists)] for each branch, resolved in one fan-out."""
+    queries = []
+    for name in branch_names:
+        queries.append(["rev-parse", "--verify", "--quiet", name])
+        queries.append(["rev-parse", "--verify", "--quiet", f"origin/{name}"])
+    results = git_outputs(queries)
+    return [(results[2 * i] is not None, results[2 * i + 1] is not None) for i in range(len(branch_names))]
 
-    print_colored(t("worktree.created_ok"), "32")
-    request_cd(new_path)
-    os.chdir(new_path)
 
-    if not os.path.exists(".gitmodules"):
-        return
+def _base_label(start_point):
+    if start_point == "HEAD":
+        return git_output(["branch", "--show-current"]) or "HEAD"
+    return start_point
 
-    print_colored(t("worktree.submodules_detected"), "36")
-    run_cmd(["git", "submodule", "update", "--init", "--force"])
 
-    print_colored(t("worktree.sync_submodules"), "36")
-    output = git_output(["submodule", "foreach", "--recursive", "--quiet", "echo $path"])
+def _fork_point_args(path, config):
+    """Where a new worktree's branch meets main; its tip stays there until it gets commits of its own."""
+    return ["-C", path, "merge-base", "HEAD", config.get("mainBranch", "main")]
+
+
+def _checkout_submodule_branches(worktree_path, branch_name, auto_yes, quiet=False):
+    """Puts every submodule of a new worktree on `branch_name` (local, tracking or new)."""
+    output = git_output(["-C", worktree_path, "submodule", "foreach", "--recursive", "--quiet", "echo $displaypath"])
     if not output:
         return
 
-    for sm_path in output.splitlines():
-        if not sm_path.strip():
-            continue
+    sm_paths = [p for p in output.splitlines() if p.strip()]
+    sm_remote_branch = f"origin/{branch_name}"
+    say = (lambda *a, **k: None) if quiet else print
 
-        sm_local_exists = (
-            subprocess.run(
-                ["git", "-C", sm_path, "rev-parse", "--verify", branch_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            ).returncode
-            == 0
-        )
+    # Resolve local/remote branch existence for all submodules in one fan-out.
+    queries = []
+    for sm_path in sm_paths:
+        full = os.path.join(worktree_path, sm_path)
+        queries.append(["-C", full, "rev-parse", "--verify", "--quiet", branch_name])
+        queries.append(["-C", full, "rev-parse", "--verify", "--quiet", sm_remote_branch])
+    results = git_outputs(queries)
 
-        sm_remote_branch = f"origin/{branch_name}"
-        sm_remote_exists = (
-            subprocess.run(
-                ["git", "-C", sm_path, "rev-parse", "--verify", sm_remote_branch],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            ).returncode
-            == 0
-        )
+    for i, sm_path in enumerate(sm_paths):
+        full = os.path.join(worktree_path, sm_path)
+        sm_local_exists = results[2 * i] is not None
+        sm_remote_exists = results[2 * i + 1] is not None
 
         if sm_local_exists:
-            print(t("worktree.submodule_checkout_local", path=sm_path, branch=branch_name))
-            run_cmd(["git", "-C", sm_path, "checkout", branch_name])
+            say(t("worktree.submodule_checkout_local", path=sm_path, branch=branch_name))
+            checkout = ["checkout", branch_name]
         elif sm_remote_exists:
-            print_colored(
-                t("worktree.submodule_found_remote", path=sm_path, remote=sm_remote_branch),
-                "36",
-            )
+            if not quiet:
+                print_colored(
+                    t("worktree.submodule_found_remote", path=sm_path, remote=sm_remote_branch),
+                    "36",
+                )
             if auto_yes:
                 choice = "y"
             else:
@@ -291,16 +618,276 @@ def cmd_new(args):
                     choice = ""
 
             if choice in ["", "y", "yes"]:
-                print(t("worktree.submodule_create_tracking", path=sm_path, remote=sm_remote_branch))
-                run_cmd(
-                    ["git", "-C", sm_path, "checkout", "-b", branch_name, sm_remote_branch]
-                )
+                say(t("worktree.submodule_create_tracking", path=sm_path, remote=sm_remote_branch))
+                checkout = ["checkout", "-b", branch_name, sm_remote_branch]
             else:
-                print(t("worktree.submodule_create_local", path=sm_path, branch=branch_name))
-                run_cmd(["git", "-C", sm_path, "checkout", "-b", branch_name])
+                say(t("worktree.submodule_create_local", path=sm_path, branch=branch_name))
+                checkout = ["checkout", "-b", branch_name]
         else:
-            print(t("worktree.submodule_create_local", path=sm_path, branch=branch_name))
-            run_cmd(["git", "-C", sm_path, "checkout", "-b", branch_name])
+            say(t("worktree.submodule_create_local", path=sm_path, branch=branch_name))
+            checkout = ["checkout", "-b", branch_name]
+        run_cmd(["git", "-C", full] + checkout, capture_output=quiet)
+
+
+def _split_legacy_base(branch_names, base_option):
+    """Reads `gwt new <branch> <base>` (the pre-batch form) when that is what it must mean.
+
+    Two names without --base are a branch and its base only if the second one
+    resolves to an existing commit; otherwise both become worktrees.
+    Returns (branch_names, base_option, legacy).
+    """
+    if len(branch_names) != 2 or base_option:
+        return branch_names, base_option, False
+    if not git_output(["rev-parse", "--verify", "--quiet", f"{branch_names[1]}^{{commit}}"]):
+        return branch_names, base_option, False
+    return branch_names[:1], branch_names[1], True
+
+
+def cmd_new(args):
+    branch_names = list(getattr(args, "branch", None) or [])
+    base_option = getattr(args, "base", None)
+    from_file = getattr(args, "from_file", None)
+    auto_yes = bool(getattr(args, "yes", False) or getattr(args, "dry_run", False))
+
+    repo_root = get_main_worktree()
+    if not repo_root:
+        print_colored(t("generic.not_git_repo"), "31")
+        return
+
+    if from_file:
+        try:
+            branch_names.extend(_read_branch_list(from_file))
+        except OSError as e:
+            print_colored(t("worktree.batch_list_failed", path=from_file, error=e), "31")
+            return
+        if not branch_names:
+            print_colored(t("worktree.batch_list_empty", path=from_file), "33")
+            return
+    else:
+        branch_names, base_option, legacy = _split_legacy_base(branch_names, base_option)
+        if legacy:
+            print_colored(t("worktree.legacy_base_hint", branch=branch_names[0], base=base_option), "33")
+    base_branch = base_option or "HEAD"
+    branch_names = list(dict.fromkeys(branch_names))
+
+    config = get_effective_config()
+
+    profile_name = getattr(args, "profile", None)
+    sparse_dirs = None
+    if profile_name:
+        sparse_dirs = get_sparse_profile(config, profile_name)
+        if sparse_dirs is None:
+            names = ", ".join(sorted((config.get("sparseProfiles") or {}).keys())) or "-"
+            print_colored(t("sparse.profile_unknown", name=profile_name, names=names), "31")
+            return
+
+    if len(branch_names) > 1:
+        _batch_new(args, repo_root, config, branch_names, base_branch, sparse_dirs, auto_yes)
+        return
+
+    if branch_names:
+        branch_name = branch_names[0]
+    else:
+        branch_name, _is_remote = _interactive_select_branch()
+        if not branch_name:
+            return
+
+    worktree_dir = get_worktree_root(repo_root, config, ensure_gitignore=True)
+
+    safe_branch_name = branch_name.replace("/", "-")
+    new_path = os.path.join(worktree_dir, safe_branch_name)
+
+    print_colored(
+        t("worktree.create_worktree", path=new_path, branch=branch_name),
+        "36",
+    )
+
+    (local_exists, remote_exists), = _branch_existence([branch_name])
+    remote_branch = f"origin/{branch_name}"
+    # Populate only the profile's cone after the worktree is registered.
+    plan = _plan_worktree(
+        branch_name, base_branch, new_path, sparse_dirs is not None, auto_yes, local_exists, remote_exists
+    )
+    if plan is None:
+        return
+    cmd, start_point = plan
+
+    pool_size, pool_refill = get_pool_settings(config)
+    use_pool = pool_size > 0 and sparse_dirs is None
+
+    if getattr(args, "dry_run", False):
+        print_colored(t("generic.dry_run"), "33")
+        print_colored(t("generic.would_run", cmd=" ".join(cmd)), "90")
+        if sparse_dirs is not None:
+            print_colored(
+                t("generic.would_run", cmd=" ".join(["git", "sparse-checkout", "set", "--cone"] + sparse_dirs)),
+                "90",
+            )
+            print_colored(t("generic.would_run", cmd="git read-tree -mu HEAD"), "90")
+        if use_pool:
+            print_colored(t("worktree.pool_would_claim"), "90")
+        if get_artifact_settings(config)["patterns"] and not getattr(args, "no_seed", False):
+            print_colored(t("worktree.would_seed"), "90")
+        print_colored(t("generic.would_cd", path=new_path), "90")
+        return
+
+    with maintenance.worktree_lock(on_wait=_wait_for_maintenance):
+        created = False
+        if use_pool:
+            created = _create_from_pool(repo_root, config, new_path, branch_name, start_point, remote_branch)
+            if pool_refill == "background":
+                spawn_gwt_background(["pool", "fill"], cwd=repo_root)
+
+        if not created and not run_cmd(cmd):
+            print_colored(t("worktree.create_failed"), "31")
+            return
+
+        if sparse_dirs is not None:
+            print_colored(t("worktree.sparse_applying", name=profile_name, n=len(sparse_dirs)), "36")
+            if not apply_sparse_checkout(new_path, sparse_dirs):
+                print_colored(t("worktree.sparse_failed"), "31")
+                return
+
+        if not getattr(args, "no_seed", False):
+            seed_artifacts(config, new_path)
+
+        _apply_perf_profile(new_path, config)
+
+        _update_index(
+            wtindex.record_created, new_path, branch_name, _base_label(start_point), git_output(_fork_point_args(new_path, config))
+        )
+
+    print_colored(t("worktree.created_ok"), "32")
+    maintenance.trigger_if_due(config)
+    request_cd(new_path)
+    os.chdir(new_path)
+
+    if not os.path.exists(".gitmodules"):
+        return
+
+    print_colored(t("worktree.submodules_detected"), "36")
+    _update_submodules(new_path, config)
+
+    print_colored(t("worktree.sync_submodules"), "36")
+    _checkout_submodule_branches(new_path, branch_name, auto_yes)
+
+
+# `worktree add` writes refs, the repo config and `.git/worktrees/<name>`;
+# concurrent adds trip over each other's lock files, so only that step is serial.
+_WORKTREE_ADD_LOCK = threading.Lock()
+
+
+def _wait_for_maintenance():
+    print_colored(t("maintenance.worktree_waiting"), "90")
+
+
+def _apply_perf_profile(path, config, quiet=False):
+    """perf.enabled: configures the new worktree with the git performance profile."""
+    perf_cfg = config.get("perf") or {}
+    if not perf_cfg.get("enabled"):
+        return True
+    settings = perf.profile_settings()
+    scope, mismatched = perf.apply_profile(path, settings, perf_cfg.get("scope", "worktree"))
+    if mismatched:
+        print_colored(t("perf.not_applied", keys=", ".join(mismatched)), "33")
+    elif not quiet:
+        print_colored(t("perf.applied_new", n=len(settings), scope=scope), "90")
+    return not mismatched
+
+
+def _create_batch_worktree(plan, config, sparse_dirs, seed):
+    """Worker for `_batch_new`; returns (failed step or None, seconds)."""
+    start = time.monotonic()
+    path = plan["path"]
+    with _WORKTREE_ADD_LOCK:
+        if run_cmd(plan["cmd"], capture_output=True) is None:
+            return "add", time.monotonic() - start
+
+    # Before populating, so checkout.workers already covers read-tree. Serialized
+    # like `worktree add`: enabling extensions.worktreeConfig writes the shared config.
+    with _WORKTREE_ADD_LOCK:
+        _apply_perf_profile(path, config, quiet=True)
+
+    # Added with --no-checkout; read-tree fills the index and writes the files (only the cone when sparse).
+    populate = [["git", "-C", path, "read-tree", "-mu", "HEAD"]]
+    if sparse_dirs is not None:
+        populate.insert(0, ["git", "-C", path, "sparse-checkout", "set", "--cone"] + sparse_dirs)
+    if any(run_cmd(cmd, capture_output=True) is None for cmd in populate):
+        with _WORKTREE_ADD_LOCK:
+            run_cmd(["git", "worktree", "remove", "--force", path], capture_output=True)
+        return "checkout", time.monotonic() - start
+
+    if seed:
+        seed_artifacts(config, path, quiet=True)
+
+    if os.path.exists(os.path.join(path, ".gitmodules")):
+        if not _update_submodules(path, config, quiet=True):
+            return "submodules", time.monotonic() - start
+        _checkout_submodule_branches(path, plan["branch"], auto_yes=True, quiet=True)
+    return None, time.monotonic() - start
+
+
+def _batch_new(args, repo_root, config, branch_names, base_branch, sparse_dirs, auto_yes):
+    """`gwt new a b c`: plan every branch, then create the worktrees concurrently."""
+    worktree_dir = get_worktree_root(repo_root, config, ensure_gitignore=True)
+    jobs = getattr(args, "jobs", None) or ASYNC_CMD_LIMIT
+    cd_branch = getattr(args, "cd", None)
+    seed = not getattr(args, "no_seed", False)
+
+    print_colored(t("worktree.batch_title", n=len(branch_names), jobs=min(jobs, len(branch_names))), "36", bold=True)
+    plans = []
+    for name, (local_exists, remote_exists) in zip(branch_names, _branch_existence(branch_names)):
+        path = os.path.join(worktree_dir, name.replace("/", "-"))
+        print_colored(t("worktree.create_worktree", path=path, branch=name), "36")
+        planned = _plan_worktree(name, base_branch, path, True, auto_yes, local_exists, remote_exists)
+        if planned:
+            plans.append({"branch": name, "path": path, "cmd": planned[0], "start": planned[1]})
+
+    if not plans:
+        return
+
+    if getattr(args, "dry_run", False):
+        print_colored(t("generic.dry_run"), "33")
+        for plan in plans:
+            print_colored(t("generic.would_run", cmd=" ".join(plan["cmd"])), "90")
+        by_branch = {plan["branch"]: plan["path"] for plan in plans}
+        print_colored(t("generic.would_cd", path=by_branch.get(cd_branch, plans[0]["path"])), "90")
+        return
+
+    start = time.monotonic()
+    created = {}
+    with maintenance.worktree_lock(on_wait=_wait_for_maintenance), ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_create_batch_worktree, plan, config, sparse_dirs, seed): plan for plan in plans}
+        for future in as_completed(futures):
+            plan = futures[future]
+            failed, secs = future.result()
+            if failed:
+                print_colored(t("worktree.batch_failed", branch=plan["branch"], step=failed), "31")
+                continue
+            created[plan["branch"]] = plan["path"]
+            print_colored(t("worktree.batch_created", branch=plan["branch"], path=plan["path"], secs=f"{secs:.1f}"), "32")
+
+    common_dir = get_git_common_dir()
+    done = [plan for plan in plans if plan["branch"] in created]
+    forks = git_outputs([_fork_point_args(plan["path"], config) for plan in done], limit=jobs)
+    for plan, fork in zip(done, forks):
+        _update_index(
+            wtindex.record_created, plan["path"], plan["branch"], _base_label(plan["start"]), fork, common_dir=common_dir
+        )
+
+    print_colored(
+        t("worktree.batch_summary", ok=len(created), total=len(branch_names), secs=f"{time.monotonic() - start:.1f}"),
+        "32" if len(created) == len(branch_names) else "33",
+    )
+    if not created:
+        return
+    maintenance.trigger_if_due(config)
+
+    if cd_branch and cd_branch not in created:
+        print_colored(t("worktree.batch_cd_missing", branch=cd_branch), "33")
+        cd_branch = None
+    target = created[cd_branch] if cd_branch else next(p["path"] for p in plans if p["branch"] in created)
+    request_cd(target)
 
 
 def cmd_remove(args):
@@ -321,7 +908,7 @@ def cmd_remove(args):
     worktrees = []
     for line in wt_list.splitlines():
         path = line.split()[0]
-        if path != main_worktree:
+        if path != main_worktree and not is_pool_worktree(path):
             worktrees.append(path)
 
     if not worktrees:
@@ -368,7 +955,7 @@ def cmd_remove(args):
     else:
         for line in wt_list.splitlines():
             path = line.split()[0]
-            if target_key in path:
+            if target_key in path and not is_pool_worktree(path):
                 target_path = path
                 break
 
@@ -409,9 +996,14 @@ def cmd_remove(args):
             print(t("generic.cancelled"))
             return
 
+    fast = bool(getattr(args, "fast", False) or (get_effective_config().get("remove") or {}).get("fast"))
+
     if getattr(args, "dry_run", False):
         print_colored(t("generic.dry_run"), "33")
-        print_colored(t("generic.would_run", cmd=f"git worktree remove --force {target_path}"), "90")
+        if fast:
+            print_colored(t("worktree.would_trash", path=target_path), "90")
+        else:
+            print_colored(t("generic.would_run", cmd=f"git worktree remove --force {target_path}"), "90")
         print_colored(t("generic.would_run", cmd="git worktree prune"), "90")
         return
 
@@ -419,32 +1011,252 @@ def cmd_remove(args):
         print_colored("📂 Switching to main worktree...", "90")
         os.chdir(main_worktree)
 
-    if run_cmd(["git", "worktree", "remove", "--force", target_path]):
-        run_cmd(["git", "worktree", "prune"])
+    if remove_worktree(target_path, fast=fast):
         print_colored(t("worktree.removed_ok"), "32")
     else:
         print_colored(t("worktree.remove_failed"), "31")
 
 
+def remove_worktree(path, fast=False, reap=True):
+    """Removes a linked worktree; returns True on success.
+
+    With `fast`, the tree is renamed into the trash and deleted by a detached
+    `gwt trash empty`; locked worktrees or refused renames fall back to
+    `git worktree remove --force`.
+    """
+    try:
+        frecency.forget(path)
+    except (sqlite3.Error, OSError):
+        pass
+
+    with maintenance.worktree_lock(on_wait=_wait_for_maintenance):
+        return _remove_worktree(path, fast, reap)
+
+
+def _remove_worktree(path, fast, reap):
+    if fast:
+        common_dir = get_git_common_dir()
+        trashed = trash_worktree(path, common_dir) if common_dir else None
+        if trashed:
+            run_cmd(["git", "worktree", "prune"])
+            print_colored(t("worktree.trashed", path=trashed), "90")
+            _update_index(wtindex.record_removed, path, common_dir=common_dir)
+            if reap:
+                spawn_gwt_background(["trash", "empty"], cwd=get_main_worktree())
+            return True
+        print_colored(t("worktree.trash_fallback"), "33")
+
+    if run_cmd(["git", "worktree", "remove", "--force", path]):
+        run_cmd(["git", "worktree", "prune"])
+        _update_index(wtindex.record_removed, path)
+        return True
+    return False
+
+
 def cmd_prune(args):
     print_colored(t("worktree.prune_start"), "36")
+    bulk = getattr(args, "merged", False) or getattr(args, "gone", False) or getattr(args, "stale", None) is not None
     if getattr(args, "dry_run", False):
         print_colored(t("generic.dry_run"), "33")
         print_colored(t("generic.would_run", cmd="git worktree prune -v"), "90")
+        if bulk:
+            _bulk_prune(args)
         return
     if run_cmd(["git", "worktree", "prune", "-v"]):
         print_colored(t("worktree.prune_ok"), "32")
     else:
         print_colored(t("worktree.prune_failed"), "31")
+    if bulk:
+        _bulk_prune(args)
+    _update_index(wtindex.reconcile, _visible_worktrees())
 
 
-def cmd_cd(args):
-    wt_output = git_output(["worktree", "list"])
-    if not wt_output:
+def classify_worktrees(worktrees, refs, merged, main_branch, now, merged_flag=True, gone_flag=True, stale_days=None,
+                       unchanged=frozenset()):
+    """Decides which worktrees a bulk prune would remove.
+
+    worktrees: dicts from list_worktrees() (main/pool already excluded)
+    refs: {branch: (upstream, track, committer_unix_time)} from one for-each-ref
+    merged: set of branch names merged into main_branch
+    unchanged: branches with no commits of their own (see _unchanged_branches);
+    `git branch --merged` lists them too, but they were never merged
+    Returns [(worktree, [reasons])] for every worktree with at least one reason.
+    """
+    selected = []
+    for wt in worktrees:
+        branch = wt.get("branch")
+        if not branch or branch == main_branch:
+            continue
+        upstream, track, ctime = refs.get(branch, ("", "", None))
+        reasons = []
+        if merged_flag and branch in merged and branch not in unchanged:
+            reasons.append("merged")
+        if gone_flag and upstream and track == "[gone]":
+            reasons.append("gone")
+        if stale_days is not None and ctime is not None and now - ctime > stale_days * 86400:
+            reasons.append("stale")
+        if reasons:
+            selected.append((wt, reasons))
+    return selected
+
+
+def _branch_refs():
+    out = git_output(
+        ["for-each-ref", "--format=%(refname:short)%00%(upstream)%00%(upstream:track)%00%(committerdate:unix)", "refs/heads"]
+    )
+    refs = {}
+    for line in (out or "").splitlines():
+        parts = line.split("\0")
+        if len(parts) != 4:
+            continue
+        name, upstream, track, ctime = parts
+        refs[name] = (upstream, track, int(ctime) if ctime.isdigit() else None)
+    return refs
+
+
+def _unchanged_branches(branches, main_branch, fork_points):
+    """Branches still on the commit where they left main, or sitting exactly on main.
+
+    A freshly created worktree's branch is an ancestor of main and so shows up
+    in `git branch --merged`. fork_points: {branch: merge-base with main when
+    gwt created it} from wtindex; a branch checked out with commits of its own
+    (a PR from the remote) forked earlier than its tip, so once merged it is
+    not excluded. Branches without a record are only excluded on main's tip.
+    """
+    if not branches:
+        return set()
+    tips = (git_output(["rev-parse", main_branch] + [f"refs/heads/{b}" for b in branches]) or "").splitlines()
+    if len(tips) != len(branches) + 1:
+        return set()
+    return {branch for branch, tip in zip(branches, tips[1:]) if tip in (tips[0], fork_points.get(branch))}
+
+
+def _bulk_prune(args):
+    """`gwt prune --merged/--gone/--stale DAYS`: classify all worktrees, show the plan, remove concurrently."""
+    config = get_effective_config()
+    main_branch = config.get("mainBranch", "main")
+    main_worktree = get_main_worktree()
+    force = getattr(args, "force", False)
+    jobs = getattr(args, "jobs", None) or ASYNC_CMD_LIMIT
+    fast = bool(getattr(args, "fast", False) or (config.get("remove") or {}).get("fast"))
+
+    candidates = [
+        wt for wt in list_worktrees()
+        if wt["path"] != main_worktree and not wt["bare"] and not wt["prunable"] and not is_pool_worktree(wt["path"])
+    ]
+    merged_out = git_output(["branch", "--merged", main_branch, "--format=%(refname:short)"])
+    if getattr(args, "merged", False) and merged_out is None:
+        print_colored(t("worktree.bulk_main_missing", branch=main_branch), "31")
+        return
+    merged = set((merged_out or "").splitlines())
+    if getattr(args, "merged", False):
+        forks = _update_index(wtindex.fork_points) or {}
+        by_branch = {wt["branch"]: forks.get(os.path.normpath(wt["path"])) for wt in candidates if wt.get("branch") in merged}
+        unchanged = _unchanged_branches(sorted(by_branch), main_branch, by_branch)
+    else:
+        unchanged = set()
+
+    selected = classify_worktrees(
+        candidates,
+        _branch_refs(),
+        merged,
+        main_branch,
+        time.time(),
+        merged_flag=getattr(args, "merged", False),
+        gone_flag=getattr(args, "gone", False),
+        stale_days=getattr(args, "stale", None),
+        unchanged=unchanged,
+    )
+    if not selected:
+        print_colored(t("worktree.bulk_none"), "32")
         return
 
-    worktrees = [line.split()[0] for line in wt_output.splitlines()]
+    # Dirty checks fan out; a failed query counts as dirty.
+    statuses = git_outputs([["-C", wt["path"], "status", "--porcelain"] for wt, _ in selected], limit=jobs)
+    _update_index(wtindex.record_dirty, {wt["path"]: st is None or bool(st) for (wt, _), st in zip(selected, statuses)})
+    current = os.path.normcase(os.path.normpath(os.getcwd()))
+
+    plan, skipped = [], []
+    print_colored(t("worktree.bulk_plan_title", n=len(selected)), "36", bold=True)
+    for (wt, reasons), status in zip(selected, statuses):
+        path = wt["path"]
+        norm = os.path.normcase(os.path.normpath(path))
+        flags = []
+        if status is None or status:
+            flags.append("dirty")
+        if wt["locked"]:
+            flags.append("locked")
+        inside = current == norm or current.startswith(norm + os.sep)
+        if inside:
+            flags.append("current")
+        keep = inside or (flags and not force)
+        mark = "⏭️ " if keep else "🗑️ "
+        detail = ", ".join(reasons) + (f"  [{', '.join(flags)}]" if flags else "")
+        print(f"   {mark} {wt['branch']:<30} {detail}")
+        print_colored(f"       {path}", "90")
+        (skipped if keep else plan).append(wt)
+
+    if skipped:
+        print_colored(t("worktree.bulk_skipped", n=len(skipped)), "33")
+    if not plan:
+        return
+    if getattr(args, "dry_run", False):
+        return
+
+    auto_yes = bool(getattr(args, "yes", False))
+    if not auto_yes:
+        try:
+            confirm = input(t("worktree.bulk_confirm", n=len(plan)))
+        except EOFError:
+            confirm = "n"
+        if confirm.lower() != "y":
+            print(t("generic.cancelled"))
+            return
+
+    if main_worktree:
+        os.chdir(main_worktree)
+    locked = [["git", "worktree", "unlock", wt["path"]] for wt in plan if wt["locked"]]
+    gather_cmds(locked, capture_output=True, limit=jobs)
+
+    with maintenance.worktree_lock(on_wait=_wait_for_maintenance):
+        removed = 0
+        rest = plan
+        if fast:
+            common_dir = get_git_common_dir()
+            rest = []
+            for wt in plan:
+                if common_dir and trash_worktree(wt["path"], common_dir):
+                    removed += 1
+                else:
+                    rest.append(wt)
+            if removed:
+                spawn_gwt_background(["trash", "empty"], cwd=main_worktree)
 
+        results = gather_cmds(
+            [["git", "worktree", "remove", "--force", wt["path"]] for wt in rest], capture_output=True, limit=jobs
+        )
+        for wt, ok in zip(rest, results):
+            if ok is None:
+                print_colored(t("worktree.bulk_remove_failed", path=wt["path"]), "31")
+            else:
+                removed += 1
+    run_cmd(["git", "worktree", "prune"])
+    print_colored(t("worktree.bulk_done", n=removed, total=len(plan)), "32" if removed == len(plan) else "33")
+
+
+def _jump(args, target):
+    if getattr(args, "dry_run", False):
+        print_colored(t("generic.dry_run"), "33")
+        print_colored(t("generic.would_cd", path=target), "90")
+        return
+    request_cd(target)
+    found = find_git_dirs(target)
+    if found:
+        _update_index(wtindex.record_used, found[0], common_dir=found[2])
+
+
+def _pick_worktree(worktrees):
+    """fzf or numbered menu; returns the chosen path or None."""
     if shutil.which("fzf"):
         proc = subprocess.Popen(
             ["fzf", "--height", "40%", "--reverse", "--prompt", t("worktree.fzf_prompt_worktree")],
@@ -453,29 +1265,71 @@ def cmd_cd(args):
             text=True,
         )
         stdout, _ = proc.communicate(input="\n".join(worktrees))
-        target = stdout.strip()
-        if target:
-            if getattr(args, "dry_run", False):
-                print_colored(t("generic.dry_run"), "33")
-                print_colored(t("generic.would_cd", path=target), "90")
-            else:
-                request_cd(target)
-    else:
-        print(t("worktree.worktrees_title"))
-        for i, wt in enumerate(worktrees):
-            print(f"  {i+1}. {wt}")
-        print(f"\n{t('generic.tip_install_fzf')}")
-
+        return stdout.strip() or None
+
+    print(t("worktree.worktrees_title"))
+    for i, wt in enumerate(worktrees):
+        print(f"  {i+1}. {wt}")
+    print(f"\n{t('generic.tip_install_fzf')}")
+
+    try:
+        choice = input(t("worktree.cd_prompt", n=len(worktrees)))
+        idx = int(choice) - 1
+    except (ValueError, EOFError):
+        return None
+    if 0 <= idx < len(worktrees):
+        return worktrees[idx]
+    print(t("worktree.invalid_selection"))
+    return None
+
+
+def _refresh_frecency_index():
+    """Re-syncs this repository's worktrees into the frecency index (one git call)."""
+    common_dir = get_git_common_dir()
+    worktrees = _visible_worktrees()
+    if common_dir and worktrees:
         try:
-            choice = input(t("worktree.cd_prompt", n=len(worktrees)))
-            idx = int(choice) - 1
-            if 0 <= idx < len(worktrees):
-                if getattr(args, "dry_run", False):
-                    print_colored(t("generic.dry_run"), "33")
-                    print_colored(t("generic.would_cd", path=worktrees[idx]), "90")
-                else:
-                    request_cd(worktrees[idx])
-            else:
-                print(t("worktree.invalid_selection"))
-        except ValueError:
+            frecency.sync_worktrees(common_dir, [(wt["path"], wt["branch"]) for wt in worktrees])
+        except (sqlite3.Error, OSError):
             pass
+    return [wt["path"] for wt in worktrees]
+
+
+def cmd_cd(args):
+    terms = [term for term in (getattr(args, "query", None) or []) if term]
+    if terms:
+        found = find_git_dirs(os.getcwd())
+        common_dir = found[2] if found else None
+        try:
+            # Worktrees added or removed outside gwt (and a main worktree
+            # never cd'ed to) show up as a difference against the files on disk.
+            refreshed = bool(common_dir) and frecency.needs_sync(common_dir)
+            if refreshed:
+                _refresh_frecency_index()
+            matches = frecency.query(terms, common_dir)
+            if not matches and common_dir and not refreshed:
+                # Branch names may be stale (checkout inside a worktree): refresh once.
+                _refresh_frecency_index()
+                matches = frecency.query(terms, common_dir)
+        except (sqlite3.Error, OSError):
+            matches = []
+
+        target = frecency.pick_unambiguous(matches)
+        if target:
+            _jump(args, target)
+            return
+        if not matches:
+            print_colored(t("worktree.cd_no_match", query=" ".join(terms)), "31")
+            return 1
+        target = _pick_worktree([m[0] for m in matches])
+        if target:
+            _jump(args, target)
+        return
+
+    worktrees = _refresh_frecency_index()
+    if not worktrees:
+        return
+
+    target = _pick_worktree(worktrees)
+    if target:
+        _jump(args, target)
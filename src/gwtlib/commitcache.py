@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""HEAD-keyed commit cache for completion
+
+`gwt review -c <TAB>` offers recent commits with their subjects. The list is
+kept in `<git-dir>/gwt-commit-cache.json` together with a stat signature of
+`HEAD`, the current branch ref and `packed-refs`. While the signature is
+unchanged a completion reads only that file (no git process). When HEAD has
+moved forward, only the commits since the cached tip are fetched.
+"""
+
+import json
+import os
+
+from gwtlib.utils import find_git_dirs, git_output
+
+CACHE_FILE = "gwt-commit-cache.json"
+DEFAULT_DEPTH = 50
+
+
+def _stat_sig(path):
+    # Git rewrites refs through a lockfile rename, so the inode changes on every
+    # update even where mtime granularity is too coarse to notice.
+    try:
+        st = os.stat(path)
+        return [st.st_ino, st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def head_signature(git_dir, common_dir):
+    """Cheap fingerprint of everything that can move HEAD."""
+    sig = {"HEAD": _stat_sig(os.path.join(git_dir, "HEAD"))}
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        head = ""
+    if head.startswith("ref: "):
+        ref = head[5:]
+        sig["ref"] = [ref, _stat_sig(os.path.join(common_dir, *ref.split("/")))]
+        sig["packed"] = _stat_sig(os.path.join(common_dir, "packed-refs"))
+    return sig
+
+
+def _log(rev_args, depth):
+    out = git_output(["log", f"-n{depth}", "--format=%H%x00%h%x00%s"] + rev_args)
+    if out is None:
+        return None
+    commits = []
+    for line in out.splitlines():
+        parts = line.split("\0")
+        if len(parts) == 3:
+            commits.append(parts)
+    return commits
+
+
+def _load(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def recent_commits(depth=DEFAULT_DEPTH, cwd=None):
+    """Returns [(full_oid, short_oid, subject)] for the newest `depth` commits of HEAD."""
+    found = find_git_dirs(cwd or os.getcwd())
+    if not found:
+        return []
+    _, git_dir, common_dir = found
+    path = os.path.join(git_dir, CACHE_FILE)
+    sig = head_signature(git_dir, common_dir)
+    cached = _load(path)
+    # A cache holding fewer commits than requested is still complete when the history is that short.
+    deep_enough = cached and (cached.get("depth", 0) >= depth or cached.get("complete"))
+
+    if cached and deep_enough and cached.get("sig") == sig:
+        return [tuple(c) for c in cached["commits"][:depth]]
+
+    head = git_output(["rev-parse", "HEAD"])
+    if not head:
+        return []
+
+    commits = None
+    if cached and deep_enough and cached.get("commits"):
+        tip = cached["commits"][0][0]
+        if tip == head:
+            commits = cached["commits"]
+        elif git_output(["merge-base", "--is-ancestor", tip, head]) is not None:
+            new = _log([f"{tip}..{head}"], depth)
+            if new is not None:
+                commits = new + cached["commits"]
+
+    if commits is None:
+        commits = _log([head], depth) or []
+        complete = len(commits) < depth
+    else:
+        complete = bool(cached.get("complete")) and len(commits) <= depth
+    commits = commits[:depth]
+
+    _save(path, {"sig": sig, "depth": depth, "complete": complete, "commits": commits})
+    return [tuple(c) for c in commits]
@@ -4,9 +4,14 @@
 This module handles auto-completion requests for shell integration.
 """
 import os
+import re
+
+from gwtlib import review_jobs
+from gwtlib.commitcache import DEFAULT_DEPTH as DEFAULT_COMMIT_DEPTH, recent_commits
+from gwtlib.config import get_effective_config
 from gwtlib.i18n import t
 from gwtlib.registry import visible_commands
-from gwtlib.utils import git_output
+from gwtlib.utils import git_output, is_pool_worktree
 
 
 def _global_flags():
@@ -16,36 +21,85 @@ def _global_flags():
         f"-y:{t('completion.global.yes')}",
         f"--dry-run:{t('completion.global.dry_run')}",
         f"--debug:{t('completion.global.debug')}",
+        f"--cprofile:{t('completion.global.cprofile')}",
     ]
 
 
-def _complete_commits(limit=50):
-    out = git_output(["log", f"-n{limit}", "--pretty=format:%h"])
-    if not out:
-        return []
-    return [f"{sha}:{t('completion.review.commit')}" for sha in out.splitlines() if sha.strip()]
+def _complete_commits():
+    """Recent commits with their subjects, served from the HEAD-keyed cache."""
+    depth = (get_effective_config().get("completion") or {}).get("commitDepth", DEFAULT_COMMIT_DEPTH)
+    fallback = t("completion.review.commit")
+    return [f"{short}:{subject[:72] or fallback}" for _, short, subject in recent_commits(depth)]
+
+
+def _complete_review_jobs():
+    root = git_output(["rev-parse", "--show-toplevel"])
+    jobs = review_jobs.list_jobs(review_jobs.get_jobs_dir(root)) if root else []
+    return [f"{job['id']}:{job.get('status', '')} {job.get('branch') or ''} {job.get('mode', '')}".rstrip() for job in jobs]
+
+
+def _complete_sparse_profiles():
+    profiles = get_effective_config().get("sparseProfiles") or {}
+    return [f"{name}:{t('completion.sparse.profile')}" for name in profiles]
+
+
+# Completion answers are capped so a TAB stays fast in repos with huge ref counts.
+COMPLETION_LIMIT = 50
+# Ranking by commit date parses every matched commit; above this many matches
+# the (refname-ordered) answer is returned unranked.
+RANK_LIMIT = 1000
+
+
+def _glob_escape(text):
+    return re.sub(r"([*?\[\\])", r"\\\1", text)
+
+
+def _branch_patterns(prefix):
+    """for-each-ref patterns for branches starting with `prefix` (`*` never crosses '/')."""
+    p = _glob_escape(prefix)
+    patterns = []
+    for base in ("refs/heads/", "refs/remotes/*/", "refs/remotes/"):
+        patterns += [f"{base}{p}*", f"{base}{p}*/**"]
+    return patterns
+
 
+def _complete_branches(cur="", limit=COMPLETION_LIMIT):
+    """Local + remote branches starting with `cur`, most recently committed first.
 
-def _complete_branches():
-    out = git_output(["branch", "-a", "--format=%(refname:short)"])
+    The prefix is pushed into `for-each-ref`, so only matching refs are read;
+    remote branches are offered without their `origin/` part unless the user
+    is typing one. When there are more than `limit`, adds a ":message" line:
+    an empty value, so shells show it as a hint and never insert it.
+    """
+    fetch = limit * 2
+    patterns = _branch_patterns(cur)
+    out = git_output(["for-each-ref", f"--count={RANK_LIMIT + 1}", "--format=%(refname)"] + patterns)
+    if out and len(out.splitlines()) <= RANK_LIMIT:
+        out = git_output(
+            ["for-each-ref", "--sort=-committerdate", f"--count={fetch}", "--format=%(refname)"] + patterns
+        )
     if not out:
         return []
-    remotes_out = git_output(["remote"])
-    remotes = {r.strip() for r in (remotes_out.splitlines() if remotes_out else []) if r.strip()}
+    lines = out.splitlines()[:fetch]
+    desc = t("completion.branch")
     branches = []
     seen = set()
-    for raw in out.splitlines():
-        b = raw.strip()
-        if not b or b.endswith("/HEAD"):
+    for ref in lines:
+        if ref.endswith("/HEAD"):
             continue
-        if b.startswith("origin/"):
-            b = b[7:]
-        # Filter remote names like "origin"
-        if b in remotes:
+        if ref.startswith("refs/heads/"):
+            name = ref[len("refs/heads/"):]
+        else:
+            short = ref[len("refs/remotes/"):]
+            stripped = short.split("/", 1)[1] if "/" in short else short
+            name = stripped if stripped.startswith(cur) else short
+        if name in seen or not name.startswith(cur):
             continue
-        if b not in seen:
-            seen.add(b)
-            branches.append(f"{b}:{t('completion.branch')}")
+        seen.add(name)
+        branches.append(f"{name}:{desc}")
+    if len(branches) > limit or len(lines) >= fetch:
+        branches = branches[:limit]
+        branches.append(f":{t('completion.more', n=limit)}")
     return branches
 
 
@@ -99,14 +153,90 @@ def cmd_completion(args):
             options.extend(_global_flags())
         
     # 'new' command: complete branches (local + remote)
+    elif cmd in ["new", "add", "create", "remote", "rt"] and prev in ["-p", "--profile"]:
+        options = _complete_sparse_profiles()
+
     elif cmd in ["new", "add", "create", "remote", "rt"]:
-        # Get local and remote branches
-        out = git_output(["branch", "-a", "--format=%(refname:short)"])
-        if out:
-            for line in out.splitlines():
-                if not line.endswith("/HEAD"):
-                    options.append(f"{line}:{t('completion.branch')}")
+        # Local and remote branches matching the typed prefix
+        if not cur.startswith("-"):
+            options = _complete_branches(cur)
+
+        if cur.startswith("-"):
+            options.append(f"--profile:{t('completion.sparse.profile')}")
+            options.extend(f"{flag}:{t('completion.new.' + flag[2:])}" for flag in ("--base", "--from-file", "--jobs", "--cd"))
+            options.extend(_global_flags())
+
+    # 'sparse' command
+    elif cmd == "sparse":
+        if prev in ["-p", "--profile"]:
+            options = _complete_sparse_profiles()
+        elif prev == "sparse":
+            options = [f"{a}:{t('completion.sparse')}" for a in ("list", "add", "remove", "profiles")]
+        else:
+            options = [f"--profile:{t('completion.sparse.profile')}"]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'status' command
+    elif cmd in ["status", "st", "s"]:
+        options = [f"--watch:{t('completion.status.watch')}", f"-w:{t('completion.status.watch')}"]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'pool' command
+    elif cmd == "pool":
+        options = [f"{a}:{t('completion.pool')}" for a in ("status", "fill", "drain")]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'maintenance' command
+    elif cmd == "maintenance":
+        if prev == "schedule":
+            options = [f"{a}:{t('completion.maintenance.schedule')}" for a in ("hourly", "daily", "weekly", "off")]
+        else:
+            options = [f"{a}:{t('completion.maintenance.' + a)}" for a in ("status", "run", "schedule")]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'list' command
+    elif cmd in ["list", "ls"]:
+        options = [
+            f"--meta:{t('completion.list.meta')}",
+            f"--size:{t('completion.list.size')}",
+            f"--long:{t('completion.list.long')}",
+            f"--json:{t('completion.list.json')}",
+            f"--refresh:{t('completion.list.refresh')}",
+        ]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'prune' command
+    elif cmd == "prune":
+        options = [f"{flag}:{t('completion.prune.' + flag[2:])}" for flag in ("--merged", "--gone", "--stale", "--force", "--jobs", "--fast")]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'sync' command
+    elif cmd == "sync":
+        options = [f"{flag}:{t('completion.sync.' + flag[2:])}" for flag in ("--ff-only", "--rebase", "--fetch", "--no-fetch", "--jobs")]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'merge' command
+    elif cmd == "merge":
+        options = [f"{flag}:{t('completion.merge.' + flag[2:])}" for flag in ("--in-memory", "--checkout")]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
+
+    # 'conflicts' command
+    elif cmd == "conflicts":
+        options = [f"{flag}:{t('completion.conflicts.' + flag[2:])}" for flag in ("--pairwise", "--matrix", "--all", "--jobs")]
+        if cur.startswith("-"):
+            options.extend(_global_flags())
 
+    # 'trash' command
+    elif cmd == "trash":
+        options = [f"{a}:{t('completion.trash')}" for a in ("status", "empty")]
         if cur.startswith("-"):
             options.extend(_global_flags())
 
@@ -134,6 +264,7 @@ def cmd_completion(args):
             f"-i:{t('completion.setting.init')}",
             f"--reset:{t('completion.setting.reset')}",
             f"-r:{t('completion.setting.reset')}",
+            f"--perf:{t('completion.setting.perf')}",
         ]
         options = flags
         if cur.startswith("-"):
@@ -150,7 +281,9 @@ def cmd_completion(args):
         elif prev in ["-c", "--commit"]:
             options = _complete_commits()
         elif prev in ["-b", "--branch"]:
-            options = _complete_branches()
+            options = _complete_branches(cur)
+        elif prev == "--result":
+            options = _complete_review_jobs()
         else:
             flags = [
                 f"--staged:{t('completion.review.staged')}",
@@ -165,6 +298,10 @@ def cmd_completion(args):
                 f"-t:{t('completion.review.tool')}",
                 f"--model:{t('completion.review.model')}",
                 f"-m:{t('completion.review.model')}",
+                f"--since-last:{t('completion.review.since_last')}",
+                f"--async:{t('completion.review.async')}",
+                f"--jobs:{t('completion.review.jobs')}",
+                f"--result:{t('completion.review.result')}",
             ]
             options = flags
             if cur.startswith("-"):
@@ -178,6 +315,8 @@ def cmd_completion(args):
             for line in out.splitlines():
                 parts = line.split()
                 path = parts[0]
+                if is_pool_worktree(path):
+                    continue
                 branch = parts[2][1:-1] if len(parts) > 2 else "HEAD"
                 
                 # Full path
@@ -186,8 +325,10 @@ def cmd_completion(args):
                 options.append(f"{os.path.basename(path)}:{branch}")
 
         if cur.startswith("-"):
+            if cmd in ["remove", "rm", "del"]:
+                options.append(f"--fast:{t('completion.remove.fast')}")
             options.extend(_global_flags())
 
-    # Filter by current word prefix
-    matches = [opt for opt in options if opt.split(":")[0].startswith(cur)]
+    # Filter by current word prefix (":message" hints always pass)
+    matches = [opt for opt in options if opt.startswith(":") or opt.split(":")[0].startswith(cur)]
     print("\n".join(matches))
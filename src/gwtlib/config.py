@@ -20,6 +20,8 @@ from gwtlib.config_schema import LATEST_CONFIG_VERSION, migrate_config, validate
 
 # --- Constants ---
 GWT_CD_FILE_ENV = "GWT_CD_FILE"
+# Inherited pipe fd (POSIX) or handle (Windows) the shell wrapper reads cd targets from.
+GWT_CD_FD_ENV = "GWT_CD_FD"
 GWT_CONFIG_DIR = ".gwt"
 GWT_CONFIG_FILE = "setting.json"
 
@@ -34,17 +36,61 @@ DEFAULT_CONFIG = {
     "mainBranch": "main",
     "worktreeDir": "..{sep}{repo_name}_wt",
     "submodules": [],
+    # gwt remove: rename into trash and delete in the background
+    "remove": {
+        "fast": False
+    },
+    # Submodule init in new worktrees: clone from the main worktree's module repos
+    "submoduleUpdate": {
+        "jobs": 0,  # 0 = CPU count
+        "shareObjects": True
+    },
+    # Fetches by gwt new/sync/update: skipped if the last one succeeded within `freshness` seconds
+    "fetch": {
+        "freshness": 60  # 0 = always fetch
+    },
+    # gwt sync: how worktrees catch up with their upstream
+    "sync": {
+        "policy": "ff-only"  # ff-only, rebase
+    },
+    # Shell completion: number of recent commits offered for `review -c`
+    "completion": {
+        "commitDepth": 50
+    },
+    # Named cone-mode sparse-checkout profiles: {"web": ["apps/web", "libs/ui"]}
+    "sparseProfiles": {},
+    # Pre-warmed worktree pool for instant `gwt new` (size 0 = disabled)
+    "pool": {
+        "size": 0,
+        "refill": "background"  # background, manual
+    },
+    # Ignored build artifacts cloned into new worktrees (globs, e.g. "node_modules")
+    "artifacts": {
+        "patterns": [],
+        "source": "auto",  # auto (closest HEAD), main, or a worktree path
+        "mode": "auto",  # auto/reflink (reflink, else copy), hardlink (reflink, else hardlink), copy
+        "workers": 0  # 0 = auto
+    },
     "ui": {
         "lang": "auto"  # auto, zh, en
     },
     "review": {
         "defaultTool": "codex",
         "models": DEFAULT_MODELS.copy(),
-        "useWsl": False  # On Windows, use WSL to run review tools
+        "useWsl": False,  # On Windows, use WSL to run review tools
+        "asyncJobs": 2  # `review --async` jobs run concurrently
+    },
+    "maintenance": {
+        "interval": 0  # hours between background `gwt maintenance run`; 0 = off
+    },
+    "perf": {
+        "enabled": False,  # apply the git performance profile to worktrees created by `gwt new`
+        "scope": "worktree"  # worktree (git config --worktree) or local (whole repository)
     },
     "merge": {
         "tool": "lazygit",  # lazygit, cursor, code, p4merge, meld, kdiff3
-        "toolPriority": ["lazygit", "cursor", "code", "p4merge", "meld"]
+        "toolPriority": ["lazygit", "cursor", "code", "p4merge", "meld"],
+        "inMemory": False  # merge with `git merge-tree`, no checkout (conflicts fall back to a worktree)
     },
     "gitTool": "lazygit",  # lazygit, gitui, tig
     "availableTools": {
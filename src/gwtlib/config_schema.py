@@ -131,11 +131,48 @@ def validate_and_sanitize_config(cfg: Dict[str, Any], defaults: Dict[str, Any])
                     warnings.append("review.useWsl invalid; ignored")
                 else:
                     r_out["useWsl"] = b
+            async_jobs = review.get("asyncJobs")
+            if isinstance(async_jobs, int) and not isinstance(async_jobs, bool) and 1 <= async_jobs <= 16:
+                r_out["asyncJobs"] = async_jobs
+            elif async_jobs is not None:
+                warnings.append("review.asyncJobs invalid; ignored")
             if r_out:
                 out["review"] = r_out
         else:
             warnings.append("review invalid type; ignored")
 
+    # maintenance
+    maint_cfg = cfg.get("maintenance")
+    if maint_cfg is not None:
+        if isinstance(maint_cfg, dict):
+            interval = maint_cfg.get("interval")
+            if isinstance(interval, int) and not isinstance(interval, bool) and 0 <= interval <= 24 * 365:
+                out["maintenance"] = {"interval": interval}
+            elif interval is not None:
+                warnings.append("maintenance.interval invalid; ignored")
+        else:
+            warnings.append("maintenance invalid type; ignored")
+
+    # perf
+    perf_cfg = cfg.get("perf")
+    if perf_cfg is not None:
+        if isinstance(perf_cfg, dict):
+            p_out: Dict[str, Any] = {}
+            enabled = _as_bool(perf_cfg.get("enabled"))
+            if enabled is not None:
+                p_out["enabled"] = enabled
+            elif "enabled" in perf_cfg:
+                warnings.append("perf.enabled invalid; ignored")
+            scope = perf_cfg.get("scope")
+            if scope in ("worktree", "local"):
+                p_out["scope"] = scope
+            elif scope is not None:
+                warnings.append("perf.scope invalid; ignored")
+            if p_out:
+                out["perf"] = p_out
+        else:
+            warnings.append("perf invalid type; ignored")
+
     # merge
     merge = cfg.get("merge")
     if merge is not None:
@@ -147,6 +184,11 @@ def validate_and_sanitize_config(cfg: Dict[str, Any], defaults: Dict[str, Any])
             tp = merge.get("toolPriority")
             if isinstance(tp, list):
                 m_out["toolPriority"] = [x for x in tp if isinstance(x, str) and x]
+            in_memory = _as_bool(merge.get("inMemory"))
+            if in_memory is not None:
+                m_out["inMemory"] = in_memory
+            elif "inMemory" in merge:
+                warnings.append("merge.inMemory invalid; ignored")
             if m_out:
                 out["merge"] = m_out
         else:
@@ -168,6 +210,138 @@ def validate_and_sanitize_config(cfg: Dict[str, Any], defaults: Dict[str, Any])
         else:
             warnings.append("submodules invalid type; ignored")
 
+    # fetch
+    fetch_cfg = cfg.get("fetch")
+    if fetch_cfg is not None:
+        if isinstance(fetch_cfg, dict):
+            freshness = fetch_cfg.get("freshness")
+            if isinstance(freshness, int) and not isinstance(freshness, bool) and 0 <= freshness <= 86400:
+                out["fetch"] = {"freshness": freshness}
+            elif freshness is not None:
+                warnings.append("fetch.freshness invalid; ignored")
+        else:
+            warnings.append("fetch invalid type; ignored")
+
+    # sync
+    sync_cfg = cfg.get("sync")
+    if sync_cfg is not None:
+        if isinstance(sync_cfg, dict):
+            policy = sync_cfg.get("policy")
+            if policy in ("ff-only", "rebase"):
+                out["sync"] = {"policy": policy}
+            elif policy is not None:
+                warnings.append("sync.policy invalid; ignored")
+        else:
+            warnings.append("sync invalid type; ignored")
+
+    # completion
+    comp = cfg.get("completion")
+    if comp is not None:
+        if isinstance(comp, dict):
+            depth = comp.get("commitDepth")
+            if isinstance(depth, int) and not isinstance(depth, bool) and 1 <= depth <= 10000:
+                out["completion"] = {"commitDepth": depth}
+            elif depth is not None:
+                warnings.append("completion.commitDepth invalid; ignored")
+        else:
+            warnings.append("completion invalid type; ignored")
+
+    # remove
+    remove_cfg = cfg.get("remove")
+    if remove_cfg is not None:
+        if isinstance(remove_cfg, dict):
+            fast = _as_bool(remove_cfg.get("fast"))
+            if fast is not None:
+                out["remove"] = {"fast": fast}
+            elif "fast" in remove_cfg:
+                warnings.append("remove.fast invalid; ignored")
+        else:
+            warnings.append("remove invalid type; ignored")
+
+    # submoduleUpdate
+    sm_update = cfg.get("submoduleUpdate")
+    if sm_update is not None:
+        if isinstance(sm_update, dict):
+            su_out: Dict[str, Any] = {}
+            jobs = sm_update.get("jobs")
+            if isinstance(jobs, int) and not isinstance(jobs, bool) and jobs >= 0:
+                su_out["jobs"] = jobs
+            elif jobs is not None:
+                warnings.append("submoduleUpdate.jobs invalid; ignored")
+            share = sm_update.get("shareObjects")
+            if share is not None:
+                b = _as_bool(share)
+                if b is None:
+                    warnings.append("submoduleUpdate.shareObjects invalid; ignored")
+                else:
+                    su_out["shareObjects"] = b
+            if su_out:
+                out["submoduleUpdate"] = su_out
+        else:
+            warnings.append("submoduleUpdate invalid type; ignored")
+
+    # sparseProfiles: {name: [dir, ...]}
+    profiles = cfg.get("sparseProfiles")
+    if profiles is not None:
+        if isinstance(profiles, dict):
+            p_out: Dict[str, List[str]] = {}
+            for name, dirs in profiles.items():
+                if isinstance(name, str) and name and isinstance(dirs, list):
+                    p_out[name] = [d for d in dirs if isinstance(d, str) and d.strip()]
+                else:
+                    warnings.append(f"sparseProfiles.{name} invalid; ignored")
+            out["sparseProfiles"] = p_out
+        else:
+            warnings.append("sparseProfiles invalid type; ignored")
+
+    # pool
+    pool = cfg.get("pool")
+    if pool is not None:
+        if isinstance(pool, dict):
+            pool_out: Dict[str, Any] = {}
+            size = pool.get("size")
+            if isinstance(size, int) and not isinstance(size, bool) and size >= 0:
+                pool_out["size"] = size
+            elif size is not None:
+                warnings.append("pool.size invalid; ignored")
+            refill = pool.get("refill")
+            if refill in ("background", "manual"):
+                pool_out["refill"] = refill
+            elif refill is not None:
+                warnings.append("pool.refill invalid; ignored")
+            if pool_out:
+                out["pool"] = pool_out
+        else:
+            warnings.append("pool invalid type; ignored")
+
+    # artifacts
+    artifacts = cfg.get("artifacts")
+    if artifacts is not None:
+        if isinstance(artifacts, dict):
+            a_out: Dict[str, Any] = {}
+            patterns = artifacts.get("patterns")
+            if isinstance(patterns, list):
+                a_out["patterns"] = [p for p in patterns if isinstance(p, str) and p.strip()]
+            elif patterns is not None:
+                warnings.append("artifacts.patterns invalid; ignored")
+            source = artifacts.get("source")
+            if isinstance(source, str) and source:
+                a_out["source"] = source
+            mode = artifacts.get("mode")
+            if mode in ("auto", "reflink", "hardlink", "copy"):
+                a_out["mode"] = mode
+            elif mode is not None:
+                warnings.append("artifacts.mode invalid; ignored")
+            workers = artifacts.get("workers")
+            if isinstance(workers, int) and not isinstance(workers, bool) and workers >= 0:
+                a_out["workers"] = workers
+            elif workers is not None:
+                warnings.append("artifacts.workers invalid; ignored")
+            if a_out:
+                out["artifacts"] = a_out
+        else:
+            warnings.append("artifacts invalid type; ignored")
+
     # availableTools (usually auto-detected; keep only if sane)
     at = cfg.get("availableTools")
     if at is not None:
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Merge conflict prediction for `gwt conflicts`
+
+Each pair of commits is test-merged with
+`git merge-tree --write-tree --name-only --no-messages`, which touches
+neither the index nor any working tree. The merges run concurrently, one git
+process each, through the async command engine.
+
+Results are cached in `<common-dir>/gwt-conflicts.json` keyed by the sorted
+(oid, oid) pair, so a rerun only merges pairs where a branch has moved.
+"""
+
+import json
+import os
+import time
+
+from gwtlib.utils import git_outputs
+
+CACHE_FILE = "gwt-conflicts.json"
+# Pairs not looked at for this long are dropped from the cache.
+CACHE_TTL = 30 * 86400
+
+
+def pair_key(oid_a, oid_b):
+    return ":".join(sorted((oid_a, oid_b)))
+
+
+def parse_merge_tree(output):
+    """Conflicted paths from `merge-tree --write-tree --name-only --no-messages` output."""
+    lines = output.splitlines()
+    return sorted({line for line in lines[1:] if line})
+
+
+def _load(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def predict(pairs, common_dir=None, jobs=None, now=None):
+    """Test-merges every (oid, oid) pair.
+
+    Returns ({pair_key: [conflicted paths] or None on error}, number of pairs
+    actually merged). Cached pairs cost nothing.
+    """
+    now = now or time.time()
+    path = os.path.join(common_dir, CACHE_FILE) if common_dir else None
+    cache = _load(path) if path else {}
+
+    results = {}
+    todo = []
+    for oid_a, oid_b in pairs:
+        key = pair_key(oid_a, oid_b)
+        if key in results:
+            continue
+        entry = cache.get(key)
+        if isinstance(entry, dict) and isinstance(entry.get("paths"), list):
+            results[key] = entry["paths"]
+            entry["used"] = now
+        else:
+            results[key] = None
+            todo.append((key, oid_a, oid_b))
+
+    outputs = git_outputs(
+        [["merge-tree", "--write-tree", "--name-only", "--no-messages", a, b] for _, a, b in todo],
+        limit=jobs,
+        ok_codes=(0, 1),
+    )
+    for (key, _, _), out in zip(todo, outputs):
+        if out is None:
+            continue
+        results[key] = parse_merge_tree(out)
+        cache[key] = {"paths": results[key], "used": now}
+
+    if path:
+        cache = {k: v for k, v in cache.items() if isinstance(v, dict) and now - v.get("used", 0) < CACHE_TTL}
+        _save(path, cache)
+    return results, len(todo)
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""Parallel disk usage for `gwt list --size`
+
+Worktrees are walked by a pool of threads pulling directories from one shared
+queue, so a huge `node_modules` in one worktree is split across all idle
+workers. Hardlinked files are counted once (by device + inode).
+
+Every directory's direct file bytes and subdirectory names are cached in the
+repository index (`.git/gwt-index.sqlite`, table `dir_cache`) keyed by the
+directory's mtime: unchanged directories cost one `lstat` instead of a
+`scandir` plus a stat per entry. Directory mtimes do not change when a file is
+rewritten in place, so `--refresh` forces a full walk.
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+
+from gwtlib import wtindex
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dir_cache (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    subdirs TEXT NOT NULL,
+    links TEXT NOT NULL
+);
+"""
+
+
+class DirEntry:
+    __slots__ = ("bytes", "subdirs", "links")
+
+    def __init__(self, size, subdirs, links):
+        self.bytes = size
+        self.subdirs = subdirs
+        # [(dev, ino, size)] for files with more than one link; deduped at sum time.
+        self.links = links
+
+
+def _scan(path):
+    size = 0
+    subdirs = []
+    links = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if st.st_nlink > 1:
+                links.append((st.st_dev, st.st_ino, st.st_size))
+            else:
+                size += st.st_size
+    return DirEntry(size, subdirs, links)
+
+
+def _range_query(conn, root):
+    prefix = root.rstrip(os.sep) + os.sep
+    upper = prefix[:-1] + chr(ord(os.sep) + 1)
+    return conn.execute(
+        "SELECT path, mtime_ns, bytes, subdirs, links FROM dir_cache WHERE path = ? OR (path >= ? AND path < ?)",
+        (root, prefix, upper),
+    )
+
+
+class SizeWalker:
+    """Walks several roots at once; `skip` holds absolute paths never entered."""
+
+    def __init__(self, workers=0, skip=(), common_dir=None, refresh=False):
+        self.workers = workers or min(32, (os.cpu_count() or 4) * 4)
+        self.skip = {os.path.normpath(p) for p in skip}
+        self.common_dir = common_dir
+        self.refresh = refresh
+        self.dirs = {}
+        self.scanned = 0
+        self._cache = {}
+        self._updates = []
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+
+    def _load_cache(self, roots):
+        if not self.common_dir or self.refresh:
+            return
+        try:
+            conn = wtindex.connect(self.common_dir)
+            conn.executescript(_SCHEMA)
+            try:
+                for root in roots:
+                    for path, mtime_ns, size, subdirs, links in _range_query(conn, root):
+                        entry = DirEntry(size, subdirs.split("\0") if subdirs else [], [tuple(x) for x in json.loads(links)])
+                        self._cache[path] = (mtime_ns, entry)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError, ValueError):
+            self._cache = {}
+
+    def _save_cache(self, roots):
+        if not self.common_dir:
+            return
+        try:
+            conn = wtindex.connect(self.common_dir)
+            conn.executescript(_SCHEMA)
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO dir_cache (path, mtime_ns, bytes, subdirs, links) VALUES (?, ?, ?, ?, ?)",
+                        self._updates,
+                    )
+                    stale = [
+                        (path,)
+                        for root in roots
+                        for path, *_ in _range_query(conn, root)
+                        if path not in self.dirs
+                    ]
+                    conn.executemany("DELETE FROM dir_cache WHERE path = ?", stale)
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _visit(self, path):
+        try:
+            mtime_ns = os.lstat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            entry = _scan(path)
+        except OSError:
+            return None
+        with self._lock:
+            self._updates.append((path, mtime_ns, entry.bytes, "\0".join(entry.subdirs), json.dumps(entry.links)))
+        return entry
+
+    def _worker(self):
+        while True:
+            path = self._queue.get()
+            try:
+                if path is None:
+                    return
+                entry = self._visit(path)
+                if entry is None:
+                    continue
+                with self._lock:
+                    self.dirs[path] = entry
+                    self.scanned += 1
+                for name in entry.subdirs:
+                    child = os.path.join(path, name)
+                    if child not in self.skip:
+                        self._queue.put(child)
+            finally:
+                self._queue.task_done()
+
+    def walk(self, roots, on_progress=None):
+        """Fills self.dirs for every directory under `roots`."""
+        roots = [os.path.normpath(r) for r in roots]
+        self._load_cache(roots)
+        threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.workers)]
+        for th in threads:
+            th.start()
+        for root in roots:
+            self._queue.put(root)
+
+        done = threading.Event()
+
+        def _wait():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=_wait, daemon=True).start()
+        while not done.wait(0.1):
+            if on_progress:
+                on_progress(self.scanned)
+        for _ in threads:
+            self._queue.put(None)
+        self._save_cache(roots)
+
+    def subtree(self, path, seen=None):
+        """Bytes under `path` (walked dirs only); hardlinks deduped through `seen`."""
+        seen = set() if seen is None else seen
+        total = 0
+        stack = [os.path.normpath(path)]
+        while stack:
+            current = stack.pop()
+            entry = self.dirs.get(current)
+            if entry is None:
+                continue
+            total += entry.bytes
+            for dev, ino, size in entry.links:
+                if (dev, ino) not in seen:
+                    seen.add((dev, ino))
+                    total += size
+            stack.extend(os.path.join(current, name) for name in entry.subdirs)
+        return total
+
+
+def _file_size(path):
+    try:
+        return os.lstat(path).st_size
+    except OSError:
+        return 0
+
+
+def classify(walker, root, ignored, untracked):
+    """Splits a worktree's bytes into (total, tracked, ignored, untracked).
+
+    `ignored` / `untracked` are paths relative to root as printed by
+    `git ls-files --others [--ignored] --exclude-standard --directory`
+    (directories end with '/'). An untracked directory can contain ignored
+    paths, which are listed separately; those count as ignored only.
+    """
+    total = walker.subtree(root)
+
+    def _size(rel):
+        full = os.path.normpath(os.path.join(root, rel.rstrip("/")))
+        return walker.subtree(full) if rel.endswith("/") else _file_size(full)
+
+    ignored_sizes = {rel: _size(rel) for rel in ignored}
+    ignored_bytes = sum(ignored_sizes.values())
+    untracked_bytes = 0
+    for rel in untracked:
+        size = _size(rel)
+        if rel.endswith("/"):
+            size -= sum(n for path, n in ignored_sizes.items() if path.startswith(rel))
+        untracked_bytes += max(0, size)
+    tracked = max(0, total - ignored_bytes - untracked_bytes)
+    return total, tracked, ignored_bytes, untracked_bytes
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Fetch coordinator shared by every gwt process on a repository
+
+`git fetch --all --prune` is run by `gwt new` (interactive branch picker),
+`gwt sync` and `gwt update`. With many terminals on one repository these
+overlap and fight over `.git` lock files. All of them go through
+`coordinated_fetch()`:
+
+- a repo-level lock (`<common-dir>/gwt-fetch.lock`) admits one fetch at a time
+- a process that finds the lock taken waits, then reuses that fetch's result
+- the last successful fetch is recorded in `<common-dir>/gwt-fetch.json`;
+  inside the freshness window (`fetch.freshness` seconds) no fetch runs at all
+"""
+
+import json
+import os
+import time
+
+from gwtlib.i18n import t
+from gwtlib.locks import FileLock
+from gwtlib.maintenance import trigger_if_due
+from gwtlib.utils import get_git_common_dir, print_colored, run_cmd
+
+LOCK_FILE = "gwt-fetch.lock"
+STATE_FILE = "gwt-fetch.json"
+DEFAULT_FRESHNESS = 60
+# A waiter gives up after this long rather than fetch alongside a hung holder.
+WAIT_TIMEOUT = 300
+
+# Outcomes of coordinated_fetch()
+FETCHED = "fetched"
+FRESH = "fresh"
+SHARED = "shared"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+
+
+def _read_state(common_dir):
+    try:
+        with open(os.path.join(common_dir, STATE_FILE), "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(common_dir, state):
+    path = os.path.join(common_dir, STATE_FILE)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def last_fetch(common_dir):
+    """(finished_at, ok) of the last coordinated fetch, or (None, None)."""
+    state = _read_state(common_dir)
+    return state.get("at"), state.get("ok")
+
+
+def get_freshness(config):
+    value = (config.get("fetch") or {}).get("freshness", DEFAULT_FRESHNESS)
+    return value if isinstance(value, int) and value >= 0 else DEFAULT_FRESHNESS
+
+
+def coordinated_fetch(cwd=None, freshness=DEFAULT_FRESHNESS, jobs=None, force=False, on_wait=None, now=time.time):
+    """Runs `git fetch --all --prune` unless a recent or concurrent fetch covers it.
+
+    Returns FETCHED, FRESH (skipped: last success is within `freshness`
+    seconds), SHARED (waited for another process's fetch), TIMED_OUT (the
+    lock holder did not finish within WAIT_TIMEOUT) or FAILED.
+    `on_wait()` is called once if another process holds the fetch lock.
+    """
+    common_dir = get_git_common_dir(cwd)
+    cmd = ["git"] + (["-C", cwd] if cwd else []) + ["fetch", "--all", "--prune"]
+    if jobs:
+        cmd.append(f"--jobs={jobs}")
+    if not common_dir:
+        return FETCHED if run_cmd(cmd) else FAILED
+
+    def _fresh():
+        at, ok = last_fetch(common_dir)
+        return bool(ok) and at is not None and now() - at < freshness
+
+    if not force and freshness and _fresh():
+        return FRESH
+
+    lock = FileLock(os.path.join(common_dir, LOCK_FILE))
+    waited_from = None
+    if not lock.acquire(blocking=False):
+        if on_wait:
+            on_wait()
+        waited_from = now()
+        if not lock.acquire(timeout=WAIT_TIMEOUT):
+            return TIMED_OUT
+    try:
+        at, ok = last_fetch(common_dir)
+        if waited_from is not None and ok and at is not None and at >= waited_from:
+            return SHARED
+        if not force and freshness and _fresh():
+            return FRESH
+        ok = run_cmd(cmd)
+        _write_state(common_dir, {"at": now(), "ok": bool(ok), "pid": os.getpid()})
+        return FETCHED if ok else FAILED
+    finally:
+        lock.release()
+
+
+def fetch_remotes(config, cwd=None, jobs=None, force=False):
+    """coordinated_fetch() with the standard messages; returns False only when the fetch failed."""
+    outcome = coordinated_fetch(
+        cwd=cwd,
+        freshness=get_freshness(config),
+        jobs=jobs,
+        force=force,
+        on_wait=lambda: print_colored(t("fetch.waiting"), "90"),
+    )
+    if outcome == FRESH:
+        at, _ = last_fetch(get_git_common_dir(cwd))
+        print_colored(t("fetch.fresh", secs=int(time.time() - at)), "90")
+    elif outcome == SHARED:
+        print_colored(t("fetch.shared"), "90")
+    elif outcome == TIMED_OUT:
+        print_colored(t("fetch.timed_out", secs=WAIT_TIMEOUT), "31")
+    elif outcome == FETCHED:
+        # New objects arrived: a good moment for scheduled maintenance.
+        trigger_if_due(config, cwd)
+    return outcome not in (FAILED, TIMED_OUT)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""Frecency index for `gwt cd <query>`
+
+A small SQLite file (~/.gwt/frecency.db) keeps every known worktree with its
+repository, basename, branch and a zoxide-style score: each visit adds 1 to a
+score that decays exponentially (half-life HALF_LIFE_DAYS). Lookups only read
+this file and the `.git` files on disk, never run git.
+"""
+
+import math
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from gwtlib.config import GWT_CONFIG_DIR
+from gwtlib.utils import find_git_dirs, is_pool_worktree
+
+DB_FILE = "frecency.db"
+HALF_LIFE_DAYS = 7.0
+_DECAY = math.log(2) / (HALF_LIFE_DAYS * 86400)
+# A top match must beat the runner-up by this factor to jump without asking.
+LEAD_FACTOR = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS worktrees (
+    path TEXT PRIMARY KEY,
+    repo TEXT NOT NULL,
+    name TEXT NOT NULL,
+    branch TEXT,
+    score REAL NOT NULL DEFAULT 0,
+    last_access REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS worktrees_repo ON worktrees(repo);
+"""
+
+
+def get_db_path():
+    return Path.home() / GWT_CONFIG_DIR / DB_FILE
+
+
+def _connect(db_path=None):
+    db_path = Path(db_path or get_db_path())
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=2)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _norm(path):
+    return os.path.normpath(os.path.abspath(path))
+
+
+def _head_branch(git_dir):
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return None
+
+
+def frecency(score, last_access, now):
+    return score * math.exp(-_DECAY * max(0.0, now - last_access))
+
+
+def record_visit(path, db_path=None, now=None):
+    """Bumps the score of the worktree containing `path`."""
+    found = find_git_dirs(path)
+    if not found:
+        return
+    root, git_dir, common_dir = found
+    now = now or time.time()
+    conn = _connect(db_path)
+    try:
+        with conn:
+            row = conn.execute("SELECT score, last_access FROM worktrees WHERE path = ?", (root,)).fetchone()
+            score = frecency(row[0], row[1], now) + 1 if row else 1.0
+            conn.execute(
+                "INSERT OR REPLACE INTO worktrees (path, repo, name, branch, score, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (root, common_dir, os.path.basename(root), _head_branch(git_dir), score, now),
+            )
+    finally:
+        conn.close()
+
+
+def forget(path, db_path=None):
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM worktrees WHERE path = ?", (_norm(path),))
+    finally:
+        conn.close()
+
+
+def sync_worktrees(common_dir, worktrees, db_path=None):
+    """Replaces the indexed worktree set of one repository.
+
+    worktrees: [(path, branch)] e.g. from list_worktrees(). Scores of known
+    paths are kept; vanished paths are dropped.
+    """
+    common_dir = _norm(common_dir)
+    conn = _connect(db_path)
+    try:
+        with conn:
+            known = {row[0] for row in conn.execute("SELECT path FROM worktrees WHERE repo = ?", (common_dir,))}
+            current = set()
+            for path, branch in worktrees:
+                path = _norm(path)
+                current.add(path)
+                if path in known:
+                    conn.execute("UPDATE worktrees SET branch = ? WHERE path = ?", (branch, path))
+                else:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO worktrees (path, repo, name, branch) VALUES (?, ?, ?, ?)",
+                        (path, common_dir, os.path.basename(path), branch),
+                    )
+            for path in known - current:
+                conn.execute("DELETE FROM worktrees WHERE path = ?", (path,))
+    finally:
+        conn.close()
+
+
+def worktrees_on_disk(common_dir):
+    """Worktree roots registered in a repository, read from its files (no git).
+
+    The main worktree (for a `<root>/.git` common dir) plus every
+    `worktrees/<id>/gitdir`; idle pool slots are left out, like in the index.
+    """
+    common_dir = _norm(common_dir)
+    paths = set()
+    if os.path.basename(common_dir) == ".git":
+        paths.add(os.path.dirname(common_dir))
+    admin_root = os.path.join(common_dir, "worktrees")
+    try:
+        names = os.listdir(admin_root)
+    except OSError:
+        names = []
+    for name in names:
+        try:
+            with open(os.path.join(admin_root, name, "gitdir"), "r", encoding="utf-8") as f:
+                dot_git = f.read().strip()
+        except OSError:
+            continue
+        if dot_git:
+            paths.add(_norm(os.path.dirname(dot_git)))
+    return {path for path in paths if not is_pool_worktree(path)}
+
+
+def needs_sync(common_dir, db_path=None):
+    """True when the indexed worktrees of a repository differ from the ones on disk."""
+    conn = _connect(db_path)
+    try:
+        indexed = {row[0] for row in conn.execute("SELECT path FROM worktrees WHERE repo = ?", (_norm(common_dir),))}
+    finally:
+        conn.close()
+    return indexed != worktrees_on_disk(common_dir)
+
+
+def _search_roots(rows):
+    """{repo: directory} above all of a repository's worktrees, main included.
+
+    Terms are matched below it only: the directories every worktree shares
+    (e.g. /home/me/src) would otherwise match any query.
+    """
+    dirs = {}
+    for path, repo in rows:
+        dirs.setdefault(repo, set()).add(os.path.dirname(path))
+        if os.path.basename(repo) == ".git":
+            dirs[repo].add(os.path.dirname(os.path.dirname(repo)))
+    roots = {}
+    for repo, parents in dirs.items():
+        try:
+            roots[repo] = os.path.commonpath(sorted(parents))
+        except ValueError:
+            roots[repo] = None
+    return roots
+
+
+def _match_rank(terms, rel_path, name, branch):
+    """0 = no match, 2 = exact basename/branch match, 1 = every term is a substring.
+
+    `rel_path`: the worktree path below its repository's search root.
+    """
+    query = " ".join(terms).lower()
+    if query in (name.lower(), (branch or "").lower()):
+        return 2
+    haystack = f"{rel_path} {branch or ''}".lower().replace(os.sep, "/")
+    return 1 if all(term.lower() in haystack for term in terms) else 0
+
+
+def query(terms, common_dir=None, db_path=None, now=None):
+    """Matches `terms` against the index; returns [(path, branch, frecency, exact)] best first.
+
+    When `common_dir` is given only that repository's worktrees are searched.
+    Paths that no longer exist are skipped.
+    """
+    now = now or time.time()
+    conn = _connect(db_path)
+    try:
+        if common_dir:
+            rows = conn.execute(
+                "SELECT path, repo, name, branch, score, last_access FROM worktrees WHERE repo = ?", (_norm(common_dir),)
+            ).fetchall()
+        else:
+            rows = conn.execute("SELECT path, repo, name, branch, score, last_access FROM worktrees").fetchall()
+    finally:
+        conn.close()
+
+    roots = _search_roots([(row[0], row[1]) for row in rows])
+    matches = []
+    for path, repo, name, branch, score, last_access in rows:
+        root = roots.get(repo)
+        rel_path = os.path.relpath(path, root) if root else name
+        rank = _match_rank(terms, rel_path, name, branch)
+        if rank and os.path.isdir(path):
+            matches.append((path, branch, frecency(score, last_access, now), rank == 2))
+    matches.sort(key=lambda m: (m[3], m[2]), reverse=True)
+    return matches
+
+
+def pick_unambiguous(matches):
+    """Returns the path to jump to, or None when the user has to choose."""
+    if not matches:
+        return None
+    if len(matches) == 1:
+        return matches[0][0]
+    exact = [m for m in matches if m[3]]
+    if len(exact) == 1:
+        return exact[0][0]
+    if exact:
+        matches = exact
+    first, second = matches[0][2], matches[1][2]
+    if first > 0 and first >= second * LEAD_FACTOR:
+        return matches[0][0]
+    return None
@@ -48,6 +48,7 @@ def print_help():
     print(t("help.new_detail_1"))
     print(t("help.new_detail_2"))
     print(t("help.new_detail_3"))
+    print(t("help.new_detail_4"))
 
     print("")
     print_colored(t("help.setting_detail"), "33", bold=True)
@@ -72,7 +72,7 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "help.cmd.new": "新建 Worktree (无参数进入交互式选择，支持本地/远端分支)",
         "help.cmd.remove": "删除 Worktree (默认删当前，安全跳回主目录)",
         "help.cmd.prune": "清理已失效的 Worktree 记录",
-        "help.cmd.cd": "交互式跳转目录 (推荐安装 fzf)",
+        "help.cmd.cd": "跳转 Worktree：`cd <关键词>` 按常用度直接跳转，否则交互选择 (推荐安装 fzf)",
         "help.cmd.update": "更新 gwt 工具 (git pull --ff-only)",
         "help.cmd.setting": "配置 gwt 设置 (--global 全局配置)",
         "help.cmd.merge": "合并分支 (交互式选择，冲突处理)",
@@ -317,6 +317,250 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "setting.branch_available": "   可选分支:",
         "setting.branch_select_or_enter": "   > 选择 (1-{n}) 或输入分支名（回车保持不变）: ",
         "setting.branch_enter_name": "   > 输入分支名（当前: {branch}）: ",
+        # Sparse
+        "help.cmd.sparse": "稀疏检出：list/add/remove 调整当前 Worktree 的目录范围",
+        "help.new_detail_4": "  \u001b[36mgwt new <branch> -p <name>\u001b[0m 按稀疏检出配置 (sparseProfiles) 只检出部分目录",
+        "completion.sparse": "稀疏检出目录",
+        "completion.sparse.profile": "稀疏检出配置",
+        "worktree.sparse_applying": "🌱 应用稀疏检出配置 '{name}'（{n} 个目录）...",
+        "worktree.sparse_failed": "❌ 应用稀疏检出配置失败。",
+        "sparse.profile_unknown": "❌ 未找到稀疏检出配置 '{name}'。可用: {names}",
+        "sparse.no_profiles": "⚠️  setting.json 中未定义 sparseProfiles。",
+        "sparse.list_title": "🌱 稀疏检出目录:",
+        "sparse.not_sparse": "ℹ️  当前 worktree 是完整检出（未启用稀疏检出）。",
+        "sparse.add_full": "ℹ️  当前 worktree 是完整检出，所有目录均已存在。",
+        "sparse.no_paths": "❌ 请指定目录，或使用 --profile。",
+        "sparse.not_in_cone": "⚠️  '{path}' 不在稀疏检出范围内，已跳过。",
+        "sparse.updated": "✅ 稀疏检出已更新（{n} 个目录）。",
+        "sparse.failed": "❌ 更新稀疏检出失败。",
+        # Pool
+        "help.cmd.pool": "预热 Worktree 池：status/fill/drain (pool.size)",
+        "completion.pool": "预热 Worktree 池",
+        "worktree.pool_claimed": "⚡ 使用预热池中的 worktree...",
+        "worktree.pool_would_claim": "   将优先从预热池领取 worktree",
+        "pool.status_title": "🏊 Worktree 池:",
+        "pool.status_summary": "   {n}/{size} 个槽位，补充策略: {refill}，目录: {path}",
+        "pool.slot_ready": "就绪",
+        "pool.slot_busy": "处理中",
+        "pool.slot_stale": "(落后于主分支)",
+        "pool.disabled": "⚠️  预热池未启用，请在 setting.json 中设置 pool.size。",
+        "pool.main_missing": "❌ 未找到主分支 '{branch}'。",
+        "pool.fill_running": "⚠️  另一个进程正在补充预热池。",
+        "pool.creating": "⚙️  创建池槽位: {path}",
+        "pool.refreshing": "🔄 刷新池槽位到主分支: {path}",
+        "pool.removing": "🗑️  删除池槽位: {path}",
+        "pool.create_failed": "❌ 创建池槽位失败。",
+        "pool.fill_ok": "✅ 预热池已就绪（{n} 个槽位）。",
+        "pool.drain_ok": "✅ 已清空预热池（删除 {n} 个槽位）。",
+        # Artifacts
+        "worktree.would_seed": "   将从已有 worktree 克隆构建产物 (artifacts.patterns)",
+        "artifacts.none": "ℹ️  {source} 中没有匹配的构建产物。",
+        "artifacts.seeding": "📦 从 {source} 克隆 {n} 个构建产物目录...",
+        "artifacts.done": "✅ 已克隆 {files} 个文件 ({size}，其中 {saved} 通过 reflink/硬链接共享)，耗时 {secs}s",
+        # Submodule sharing
+        "worktree.submodules_shared": "🔗 {n} 个子模块复用了主 worktree 的对象库（本地克隆，无需网络）",
+        # Fast remove / trash
+        "help.cmd.trash": "查看/清空 `remove --fast` 的回收区：status/empty",
+        "completion.trash": "回收区",
+        "completion.remove.fast": "移入回收区，后台删除",
+        "worktree.would_trash": "将移动到回收区并在后台删除: {path}",
+        "worktree.trashed": "🗑️  已移入回收区，后台删除中: {path}",
+        "worktree.trash_fallback": "⚠️  无法快速删除 (worktree 被锁定或重命名失败)，改用 git worktree remove",
+        "trash.empty": "✅ 回收区为空",
+        "trash.would_delete": "将删除: {path}",
+        "trash.left": "⚠️  {n} 项未能删除，可稍后重试 `gwt trash empty`",
+        "trash.emptied": "✅ 已删除 {n} 项 ({secs}s)",
+        "trash.status_title": "🗑️  回收区",
+        "trash.entry_size": "({files} 个文件, {size})",
+        "trash.status_total": "共 {n} 项, {size}",
+        # Bulk prune
+        "completion.prune.merged": "删除分支已合并到主分支的 worktree",
+        "completion.prune.gone": "删除上游分支已删除的 worktree",
+        "completion.prune.stale": "删除 N 天无提交的 worktree",
+        "completion.prune.force": "同时删除有改动或已锁定的 worktree",
+        "completion.prune.jobs": "并行数",
+        "completion.prune.fast": "移入回收区，后台删除",
+        "worktree.bulk_main_missing": "❌ 找不到主分支 {branch}，无法判断是否已合并",
+        "worktree.bulk_none": "✅ 没有符合条件的 worktree",
+        "worktree.bulk_plan_title": "📋 符合条件的 worktree ({n}):",
+        "worktree.bulk_skipped": "⏭️  跳过 {n} 个 (有改动/已锁定/当前所在)，使用 --force 强制删除",
+        "worktree.bulk_confirm": "确认删除 {n} 个 worktree? (y/N): ",
+        "worktree.bulk_remove_failed": "❌ 删除失败: {path}",
+        "worktree.bulk_done": "✅ 已删除 {n}/{total} 个 worktree",
+        # cd frecency
+        "worktree.cd_no_match": "❌ 没有匹配 '{query}' 的 worktree",
+        # Worktree metadata index
+        "list.col.path": "路径",
+        "list.col.branch": "分支",
+        "list.col.base": "基于",
+        "list.col.age": "创建",
+        "list.col.used": "最近使用",
+        "list.col.size": "大小",
+        "list.col.dirty": "改动",
+        "list.dirty_hint": "💡 '?' 表示未知，使用 `gwt list --meta --refresh` 重新检查改动状态",
+        "completion.list.meta": "显示基准分支、创建时间、最近使用、大小、改动",
+        "completion.list.refresh": "重新检查改动状态 / 重新扫描目录",
+        # Disk usage
+        "list.col.tracked": "已跟踪",
+        "list.col.ignored": "已忽略",
+        "list.col.untracked": "未跟踪",
+        "list.size_scanning": "📏 正在统计磁盘占用... 已扫描 {n} 个目录",
+        "list.size_total": "合计 {size} ({n} 个 worktree，硬链接只计一次，不含 .git)",
+        "completion.list.size": "统计各 worktree 磁盘占用",
+        # gwt list --long
+        "list.col.main": "相对主分支",
+        "list.col.upstream": "上游",
+        "list.col.commit": "最近提交",
+        "list.col.subject": "提交说明",
+        "completion.list.long": "上游、相对主分支的领先/落后、最近提交",
+        "completion.list.json": "JSON 输出",
+        # Completion cap
+        "completion.more": "仅显示 {n} 项，请继续输入以缩小范围",
+        # Batch new
+        "worktree.batch_title": "📦 批量创建 {n} 个 worktree（并发 {jobs}）",
+        "worktree.batch_list_failed": "❌ 无法读取分支列表 {path}: {error}",
+        "worktree.batch_list_empty": "⚠️  {path} 中没有分支名",
+        "worktree.batch_created": "   ✅ {branch:<30} {path}  ({secs}s)",
+        "worktree.batch_failed": "   ❌ {branch:<30} 失败于 {step} 阶段",
+        "worktree.batch_summary": "完成：{ok}/{total} 个 worktree 已创建，用时 {secs}s",
+        "worktree.batch_cd_missing": "⚠️  --cd {branch} 未创建成功，改为跳转到第一个 worktree",
+        "completion.new.base": "新分支的起点",
+        "completion.new.from-file": "从文件读取分支列表（- 为 stdin）",
+        "completion.new.jobs": "并发创建数",
+        "completion.new.cd": "批量创建后跳转到该分支",
+        # Sync
+        "help.cmd.sync": "一次 fetch，并行快进/变基所有 worktree",
+        "completion.sync": "同步所有 worktree",
+        "completion.sync.ff-only": "只快进 (默认)",
+        "completion.sync.rebase": "已分叉的分支变基到上游",
+        "completion.sync.no-fetch": "不 fetch，直接使用现有远端分支",
+        "completion.sync.jobs": "并行数",
+        "sync.fetching": "📡 正在获取所有远端 (git fetch --all --prune)...",
+        "sync.fetch_failed": "⚠️  fetch 失败，使用本地已有的远端分支继续",
+        "sync.fetch_skipped": "⏭️  跳过 fetch",
+        "sync.title": "🔄 同步 {n} 个 worktree (策略: {policy})",
+        "sync.summary": "已更新 {updated} · 已是最新 {current} · 已分叉 {diverged} · 跳过 {skipped} · 失败 {failed}",
+        "sync.result.ff": "已快进 {behind} 个提交 ({upstream})",
+        "sync.result.rebase": "已变基到 {upstream} (本地 {ahead} 个提交)",
+        "sync.result.uptodate": "已是最新",
+        "sync.result.ahead": "已是最新，领先 {ahead} 个提交",
+        "sync.result.diverged": "已分叉 (领先 {ahead} / 落后 {behind})，使用 --rebase 变基",
+        "sync.result.conflict": "变基冲突，已中止，分支保持不变",
+        "sync.result.failed": "失败",
+        "sync.result.dirty": "跳过：有未提交改动",
+        "sync.result.no_upstream": "跳过：未设置上游",
+        "sync.result.gone": "跳过：上游分支已删除",
+        "sync.result.detached": "跳过：分离 HEAD",
+        "sync.would.ff": "将快进 {behind} 个提交 ({upstream})",
+        "sync.would.rebase": "将变基到 {upstream} (领先 {ahead} / 落后 {behind})",
+        # Fetch coordinator
+        "fetch.waiting": "⏳ 另一个 gwt 进程正在 fetch，等待其完成...",
+        "fetch.fresh": "⏭️  {secs}s 前已成功 fetch，跳过 (fetch.freshness)",
+        "fetch.shared": "✅ 复用另一个进程刚完成的 fetch",
+        "fetch.timed_out": "❌ 另一个 gwt 进程的 fetch 超过 {secs}s 仍未结束，放弃本次 fetch (可检查 .git/gwt-fetch.lock 的持有进程)",
+        "completion.sync.fetch": "忽略新鲜度窗口，强制 fetch",
+        # In-memory merge
+        "completion.merge.in-memory": "用 merge-tree 合并，不检出",
+        "completion.merge.checkout": "在当前目录检出目标分支再合并",
+        "merge.target_not_local": "❌ 目标分支 {branch} 不是本地分支，无法在内存中合并 (可用 --checkout)",
+        "merge.source_missing": "❌ 找不到源分支 {branch}",
+        "merge.target_dirty": "❌ 目标分支 {branch} 所在的 worktree 有未提交改动: {path}",
+        "merge.up_to_date": "✅ {target} 已包含 {source}，无需合并",
+        "merge.fast_forward": "⏩ 快进 {target} 到 {oid}",
+        "merge.in_memory": "🧮 在内存中合并 {source} → {target} (git merge-tree)...",
+        "merge.conflicts_predicted": "⚠️  合并有 {n} 个冲突文件，转到 worktree 中解决:",
+        "merge.updating_worktree": "   更新目标分支所在的 worktree: {path}",
+        "merge.temp_failed": "❌ 无法创建用于解决冲突的临时 worktree",
+        "merge.resolve_in": "📂 在 {path} 中合并",
+        "merge.advance_failed": "❌ 无法更新 {branch} (可能已被其他进程移动)，合并结果未应用",
+        "merge.ok_in_memory": "✅ 合并完成: {target} → {oid} (当前工作区未改动)",
+        # Conflict radar
+        "help.cmd.conflicts": "预测各分支与 mainBranch (及彼此之间) 的合并冲突",
+        "completion.conflicts": "预测合并冲突",
+        "completion.conflicts.pairwise": "分支两两之间也检测",
+        "completion.conflicts.matrix": "以矩阵显示两两结果",
+        "completion.conflicts.all": "所有本地/远端分支",
+        "completion.conflicts.jobs": "并行数",
+        "conflicts.main_missing": "❌ 找不到主分支 {branch} (mainBranch)",
+        "conflicts.no_branches": "没有需要检测的分支",
+        "conflicts.title_main": "🔮 {n} 个分支合并到 {branch} 的冲突预测",
+        "conflicts.title_pairwise": "🔮 分支之间的冲突",
+        "conflicts.pairwise_clean": "   ✅ 分支之间没有冲突",
+        "conflicts.clean": "无冲突",
+        "conflicts.files": "{n} 个冲突文件",
+        "conflicts.error": "无法计算 (无共同历史?)",
+        "conflicts.more_paths": "       … 另有 {n} 个",
+        "conflicts.matrix_title": "🔮 冲突矩阵 (数字 = 冲突文件数)",
+        "conflicts.matrix_legend": "   · 无冲突   ? 无法计算",
+        "conflicts.summary": "{conflicting}/{total} 组有冲突 · 本次计算 {computed} 组，缓存 {cached} 组 · {secs}s",
+        # Review watermarks
+        "completion.review.since_last": "只评审上次评审之后的改动",
+        "review.mode.since_last": "{mode}，仅上次评审 ({age} 前) 之后的改动",
+        "review.since_last_unsupported": "⚠️  --since-last 不适用于 --last / --commit，评审完整 diff。",
+        "review.since_last_full.none": "ℹ️  该分支在此模式下还没有评审记录，评审完整 diff。",
+        "review.since_last_full.gone": "ℹ️  上次评审的快照已被 git gc 清理，评审完整 diff。",
+        "review.since_last_full.rewritten": "ℹ️  上次评审后历史已被改写 (rebase/amend/reset)，评审完整 diff。",
+        "review.since_last_full.base_moved": "ℹ️  上次评审后对比的基准分支已变化，评审完整 diff。",
+        "review.nothing_new": "✅ 自上次评审以来没有新的改动。",
+        "review.same_as_last": "✅ 与上次评审的 diff 完全相同，已跳过。",
+        # Review job queue
+        "completion.review.async": "后台排队评审，立即返回",
+        "completion.review.jobs": "列出评审任务",
+        "completion.review.result": "查看评审任务的结果",
+        "review.job_queued": "📥 评审任务 {id} 已加入队列，将在后台运行。",
+        "review.job_duplicate": "♻️  相同的 diff 已有评审任务 {id} ({status})，不再重复排队。",
+        "review.job_result_hint": "💡 查看结果: gwt review --result {id}  |  全部任务: gwt review --jobs",
+        "review.jobs_none": "没有评审任务。",
+        "review.jobs_title": "📋 评审任务 ({n}):",
+        "review.jobs_hint": "💡 gwt review --result <ID> 查看输出 (ID 可只写前缀)",
+        "review.job_status.queued": "排队中",
+        "review.job_status.running": "运行中",
+        "review.job_status.done": "完成",
+        "review.job_status.failed": "失败",
+        "review.job_not_found": "❌ 找不到评审任务 '{id}' (或前缀不唯一)。",
+        "review.job_pending": "⏳ 评审任务 {id} 尚未完成 ({status})。",
+        "review.job_header": "📄 评审任务 {id} · {tool} · {mode}",
+        "review.job_failed": "❌ 评审工具以退出码 {rc} 结束。",
+        # Git performance profile
+        "completion.setting.perf": "为当前 worktree 应用 git 性能配置",
+        "perf.title": "⚡ Git 性能配置: {path}",
+        "perf.scope": "   写入范围: git config --{scope}",
+        "perf.unset": "未设置",
+        "perf.was": "原值: {value}",
+        "perf.not_effective": "未生效，可能被更高优先级的配置覆盖",
+        "perf.no_fsmonitor": "   ℹ️  当前 git 未编译内置 fsmonitor 守护进程，已跳过 core.fsmonitor。",
+        "perf.timing": "⏱️  git status: {before} → {after}",
+        "perf.not_applied": "⚠️  性能配置未生效: {keys}",
+        "perf.applied_new": "⚡ 已应用 git 性能配置 ({n} 项, --{scope})",
+        # Maintenance
+        "help.cmd.maintenance": "维护共享对象库: commit-graph、multi-pack-index、增量 repack",
+        "completion.maintenance": "维护 commit-graph / multi-pack-index",
+        "completion.maintenance.status": "查看维护状态",
+        "completion.maintenance.run": "立即运行维护",
+        "completion.maintenance.schedule": "设置后台维护频率",
+        "maintenance.title": "🧰 对象库维护: {path}",
+        "maintenance.waiting": "⏳ 等待其他 gwt 操作 (new/remove/维护) 结束...",
+        "maintenance.worktree_waiting": "⏳ 正在进行对象库维护，等待其完成...",
+        "maintenance.task_failed": "失败",
+        "maintenance.latency": "⏱️  {n} 条历史查询: {before} → {after} ({x}×)",
+        "maintenance.done": "✅ 维护完成，用时 {secs}s",
+        "maintenance.yes": "是",
+        "maintenance.no": "否",
+        "maintenance.last_run": "   上次维护: {age} 前 (成功: {result})",
+        "maintenance.last_latency": "   上次查询耗时: {before} → {after}",
+        "maintenance.never_run": "   ⚠️  尚未运行过 gwt maintenance run",
+        "maintenance.scheduled": "🗓️  后台维护: 每 {hours} 小时 (fetch 或创建 worktree 后触发)",
+        "maintenance.not_scheduled": "🗓️  后台维护: 关闭 (gwt maintenance schedule daily 开启)",
+        "maintenance.would_schedule": "将设置 maintenance.interval: {name}",
+        # Status watch
+        "completion.status.watch": "文件变化时自动刷新",
+        "status.watch_header": "👀 监视 {n} 个仓库 ({backend}) · {time} · 刷新 {secs}s · Ctrl-C 退出",
+        # Profiling
+        "completion.global.cprofile": "用 cProfile 分析本次运行 (--cprofile=FILE 指定输出)",
+        "profile.saved": "📊 性能分析结果已保存: {path}",
+        "profile.write_failed": "❌ 无法写入性能分析结果 {path}: {error}",
+        # Legacy new <branch> <base>
+        "worktree.legacy_base_hint": "ℹ️  按旧写法解析：从 {base} 创建 {branch}。该写法已弃用，请改用 `gwt new {branch} --base {base}`；如需批量创建两个 worktree，请显式指定 --base。",
     },
     "en": {
         # Generic
@@ -371,7 +615,7 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "help.cmd.new": "Create worktree (interactive if no args, local/remote branches)",
         "help.cmd.remove": "Remove worktree (default: current; safely jumps back)",
         "help.cmd.prune": "Prune stale worktree records",
-        "help.cmd.cd": "Interactive jump (fzf recommended)",
+        "help.cmd.cd": "Jump to a worktree: `cd <query>` jumps by frecency, else interactive (fzf recommended)",
         "help.cmd.update": "Update gwt (git pull --ff-only)",
         "help.cmd.setting": "Configure gwt settings (--global for global)",
         "help.cmd.merge": "Merge branches (interactive, conflict handling)",
@@ -616,6 +860,250 @@ Context:
         "setting.branch_available": "   Available branches:",
         "setting.branch_select_or_enter": "   > Select (1-{n}) or enter branch name, Enter to keep: ",
         "setting.branch_enter_name": "   > Enter branch name (current: {branch}): ",
+        # Sparse
+        "help.cmd.sparse": "Sparse checkout: list/add/remove directories of the current worktree",
+        "help.new_detail_4": "  \u001b[36mgwt new <branch> -p <name>\u001b[0m Check out only the dirs of a sparse profile (sparseProfiles)",
+        "completion.sparse": "Sparse checkout dirs",
+        "completion.sparse.profile": "Sparse profile",
+        "worktree.sparse_applying": "🌱 Applying sparse profile '{name}' ({n} dirs)...",
+        "worktree.sparse_failed": "❌ Failed to apply sparse profile.",
+        "sparse.profile_unknown": "❌ Unknown sparse profile '{name}'. Available: {names}",
+        "sparse.no_profiles": "⚠️  No sparseProfiles defined in setting.json.",
+        "sparse.list_title": "🌱 Sparse checkout directories:",
+        "sparse.not_sparse": "ℹ️  This worktree is a full checkout (sparse checkout disabled).",
+        "sparse.add_full": "ℹ️  This worktree is a full checkout; every directory is already present.",
+        "sparse.no_paths": "❌ No directories given (pass paths or --profile).",
+        "sparse.not_in_cone": "⚠️  '{path}' is not in the sparse checkout; skipped.",
+        "sparse.updated": "✅ Sparse checkout updated ({n} dirs).",
+        "sparse.failed": "❌ Failed to update sparse checkout.",
+        # Pool
+        "help.cmd.pool": "Pre-warmed worktree pool: status/fill/drain (pool.size)",
+        "completion.pool": "Worktree pool",
+        "worktree.pool_claimed": "⚡ Claimed a pre-warmed worktree from the pool...",
+        "worktree.pool_would_claim": "   Would claim a pre-warmed worktree from the pool first",
+        "pool.status_title": "🏊 Worktree Pool:",
+        "pool.status_summary": "   {n}/{size} slot(s), refill: {refill}, dir: {path}",
+        "pool.slot_ready": "ready",
+        "pool.slot_busy": "busy",
+        "pool.slot_stale": "(behind main branch)",
+        "pool.disabled": "⚠️  Pool is disabled. Set pool.size in setting.json.",
+        "pool.main_missing": "❌ Main branch '{branch}' not found.",
+        "pool.fill_running": "⚠️  Another process is already filling the pool.",
+        "pool.creating": "⚙️  Creating pool slot: {path}",
+        "pool.refreshing": "🔄 Refreshing pool slot to main branch: {path}",
+        "pool.removing": "🗑️  Removing pool slot: {path}",
+        "pool.create_failed": "❌ Failed to create pool slot.",
+        "pool.fill_ok": "✅ Pool is ready ({n} slot(s)).",
+        "pool.drain_ok": "✅ Pool drained ({n} slot(s) removed).",
+        # Artifacts
+        "worktree.would_seed": "   Would seed build artifacts from an existing worktree (artifacts.patterns)",
+        "artifacts.none": "ℹ️  No matching build artifacts in {source}.",
+        "artifacts.seeding": "📦 Seeding {n} artifact path(s) from {source}...",
+        "artifacts.done": "✅ Seeded {files} file(s) ({size}, {saved} shared via reflink/hardlink) in {secs}s",
+        # Submodule sharing
+        "worktree.submodules_shared": "🔗 {n} submodule(s) reused the main worktree's object store (local clone, no network)",
+        # Fast remove / trash
+        "help.cmd.trash": "Inspect/empty the `remove --fast` trash: status/empty",
+        "completion.trash": "Trash",
+        "completion.remove.fast": "Move to trash, delete in background",
+        "worktree.would_trash": "Would move to trash and delete in background: {path}",
+        "worktree.trashed": "🗑️  Moved to trash, deleting in background: {path}",
+        "worktree.trash_fallback": "⚠️  Fast removal not possible (locked worktree or rename refused); using git worktree remove",
+        "trash.empty": "✅ Trash is empty",
+        "trash.would_delete": "Would delete: {path}",
+        "trash.left": "⚠️  {n} entr(ies) could not be deleted; retry `gwt trash empty` later",
+        "trash.emptied": "✅ Deleted {n} entr(ies) ({secs}s)",
+        "trash.status_title": "🗑️  Trash",
+        "trash.entry_size": "({files} files, {size})",
+        "trash.status_total": "{n} entr(ies), {size} total",
+        # Bulk prune
+        "completion.prune.merged": "Remove worktrees merged into main",
+        "completion.prune.gone": "Remove worktrees whose upstream is gone",
+        "completion.prune.stale": "Remove worktrees idle for N days",
+        "completion.prune.force": "Also remove dirty/locked worktrees",
+        "completion.prune.jobs": "Parallel workers",
+        "completion.prune.fast": "Move to trash, delete in background",
+        "worktree.bulk_main_missing": "❌ Main branch {branch} not found; cannot check merged state",
+        "worktree.bulk_none": "✅ No worktrees match",
+        "worktree.bulk_plan_title": "📋 Matching worktrees ({n}):",
+        "worktree.bulk_skipped": "⏭️  Skipping {n} (dirty/locked/current); use --force to include dirty or locked",
+        "worktree.bulk_confirm": "Remove {n} worktree(s)? (y/N): ",
+        "worktree.bulk_remove_failed": "❌ Failed to remove: {path}",
+        "worktree.bulk_done": "✅ Removed {n}/{total} worktree(s)",
+        # cd frecency
+        "worktree.cd_no_match": "❌ No worktree matches '{query}'",
+        # Worktree metadata index
+        "list.col.path": "PATH",
+        "list.col.branch": "BRANCH",
+        "list.col.base": "BASE",
+        "list.col.age": "AGE",
+        "list.col.used": "USED",
+        "list.col.size": "SIZE",
+        "list.col.dirty": "DIRTY",
+        "list.dirty_hint": "💡 '?' = unknown; run `gwt list --meta --refresh` to re-check dirty state",
+        "completion.list.meta": "Show base, age, last use, size, dirty",
+        "completion.list.refresh": "Re-check dirty state / re-walk directories",
+        # Disk usage
+        "list.col.tracked": "TRACKED",
+        "list.col.ignored": "IGNORED",
+        "list.col.untracked": "UNTRACKED",
+        "list.size_scanning": "📏 Measuring disk usage... {n} directories scanned",
+        "list.size_total": "Total {size} across {n} worktree(s) (hardlinks counted once, .git excluded)",
+        "completion.list.size": "Disk usage per worktree",
+        # gwt list --long
+        "list.col.main": "VS MAIN",
+        "list.col.upstream": "UPSTREAM",
+        "list.col.commit": "COMMITTED",
+        "list.col.subject": "SUBJECT",
+        "completion.list.long": "Upstream, ahead/behind main, last commit",
+        "completion.list.json": "JSON output",
+        # Completion cap
+        "completion.more": "showing {n} only; keep typing to narrow",
+        # Batch new
+        "worktree.batch_title": "📦 Creating {n} worktrees ({jobs} at a time)",
+        "worktree.batch_list_failed": "❌ Cannot read branch list {path}: {error}",
+        "worktree.batch_list_empty": "⚠️  No branch names in {path}",
+        "worktree.batch_created": "   ✅ {branch:<30} {path}  ({secs}s)",
+        "worktree.batch_failed": "   ❌ {branch:<30} failed at {step}",
+        "worktree.batch_summary": "Done: {ok}/{total} worktrees created in {secs}s",
+        "worktree.batch_cd_missing": "⚠️  --cd {branch} was not created; jumping to the first worktree",
+        "completion.new.base": "Start point for new branches",
+        "completion.new.from-file": "Read branch names from a file (- = stdin)",
+        "completion.new.jobs": "Worktrees created concurrently",
+        "completion.new.cd": "Branch to cd into after a batch",
+        # Sync
+        "help.cmd.sync": "Fetch once, fast-forward/rebase all worktrees in parallel",
+        "completion.sync": "Sync all worktrees",
+        "completion.sync.ff-only": "Fast-forward only (default)",
+        "completion.sync.rebase": "Rebase diverged branches onto upstream",
+        "completion.sync.no-fetch": "Skip the fetch",
+        "completion.sync.jobs": "Parallel workers",
+        "sync.fetching": "📡 Fetching all remotes (git fetch --all --prune)...",
+        "sync.fetch_failed": "⚠️  Fetch failed; continuing with the remote-tracking refs on disk",
+        "sync.fetch_skipped": "⏭️  Skipping fetch",
+        "sync.title": "🔄 Syncing {n} worktrees (policy: {policy})",
+        "sync.summary": "updated {updated} · up to date {current} · diverged {diverged} · skipped {skipped} · failed {failed}",
+        "sync.result.ff": "fast-forwarded {behind} commits ({upstream})",
+        "sync.result.rebase": "rebased {ahead} commits onto {upstream}",
+        "sync.result.uptodate": "up to date",
+        "sync.result.ahead": "up to date, {ahead} ahead",
+        "sync.result.diverged": "diverged ({ahead} ahead / {behind} behind); use --rebase",
+        "sync.result.conflict": "rebase conflict; aborted, branch unchanged",
+        "sync.result.failed": "failed",
+        "sync.result.dirty": "skipped: uncommitted changes",
+        "sync.result.no_upstream": "skipped: no upstream",
+        "sync.result.gone": "skipped: upstream is gone",
+        "sync.result.detached": "skipped: detached HEAD",
+        "sync.would.ff": "would fast-forward {behind} commits ({upstream})",
+        "sync.would.rebase": "would rebase onto {upstream} ({ahead} ahead / {behind} behind)",
+        # Fetch coordinator
+        "fetch.waiting": "⏳ Another gwt process is fetching; waiting for it...",
+        "fetch.fresh": "⏭️  Fetched {secs}s ago; skipping (fetch.freshness)",
+        "fetch.shared": "✅ Reusing the fetch another process just finished",
+        "fetch.timed_out": "❌ Another gwt process has been fetching for over {secs}s; giving up (check who holds .git/gwt-fetch.lock)",
+        "completion.sync.fetch": "Fetch even if recently fetched",
+        # In-memory merge
+        "completion.merge.in-memory": "Merge with merge-tree, no checkout",
+        "completion.merge.checkout": "Check out the target here, then merge",
+        "merge.target_not_local": "❌ Target {branch} is not a local branch; cannot merge in memory (use --checkout)",
+        "merge.source_missing": "❌ Source branch {branch} not found",
+        "merge.target_dirty": "❌ The worktree holding {branch} has uncommitted changes: {path}",
+        "merge.up_to_date": "✅ {target} already contains {source}; nothing to merge",
+        "merge.fast_forward": "⏩ Fast-forwarding {target} to {oid}",
+        "merge.in_memory": "🧮 Merging {source} → {target} in memory (git merge-tree)...",
+        "merge.conflicts_predicted": "⚠️  The merge has {n} conflicted files; resolving in a worktree:",
+        "merge.updating_worktree": "   Updating the worktree holding the target: {path}",
+        "merge.temp_failed": "❌ Could not create a temporary worktree for conflict resolution",
+        "merge.resolve_in": "📂 Merging in {path}",
+        "merge.advance_failed": "❌ Could not update {branch} (it may have moved meanwhile); merge not applied",
+        "merge.ok_in_memory": "✅ Merged: {target} → {oid} (your working tree was not touched)",
+        # Conflict radar
+        "help.cmd.conflicts": "Predict merge conflicts against mainBranch (and between branches)",
+        "completion.conflicts": "Predict merge conflicts",
+        "completion.conflicts.pairwise": "Also test branch against branch",
+        "completion.conflicts.matrix": "Pairwise results as a grid",
+        "completion.conflicts.all": "All local/remote branches",
+        "completion.conflicts.jobs": "Parallel merges",
+        "conflicts.main_missing": "❌ Main branch {branch} not found (mainBranch)",
+        "conflicts.no_branches": "No branches to check",
+        "conflicts.title_main": "🔮 Conflict forecast for {n} branches into {branch}",
+        "conflicts.title_pairwise": "🔮 Conflicts between branches",
+        "conflicts.pairwise_clean": "   ✅ No conflicts between branches",
+        "conflicts.clean": "clean",
+        "conflicts.files": "{n} conflicted files",
+        "conflicts.error": "could not merge (unrelated histories?)",
+        "conflicts.more_paths": "       … {n} more",
+        "conflicts.matrix_title": "🔮 Conflict matrix (number = conflicted files)",
+        "conflicts.matrix_legend": "   · clean   ? could not merge",
+        "conflicts.summary": "{conflicting}/{total} pairs conflict · {computed} merged, {cached} cached · {secs}s",
+        # Review watermarks
+        "completion.review.since_last": "Only review what changed since the last review",
+        "review.mode.since_last": "{mode}, only changes since the last review ({age} ago)",
+        "review.since_last_unsupported": "⚠️  --since-last does not apply to --last / --commit; reviewing the full diff.",
+        "review.since_last_full.none": "ℹ️  No previous review recorded for this branch and mode; reviewing the full diff.",
+        "review.since_last_full.gone": "ℹ️  The last reviewed snapshot was garbage-collected; reviewing the full diff.",
+        "review.since_last_full.rewritten": "ℹ️  History was rewritten since the last review (rebase/amend/reset); reviewing the full diff.",
+        "review.since_last_full.base_moved": "ℹ️  The base branch moved since the last review; reviewing the full diff.",
+        "review.nothing_new": "✅ Nothing new since the last review.",
+        "review.same_as_last": "✅ Identical to the diff reviewed last time; skipped.",
+        # Review job queue
+        "completion.review.async": "Queue the review in the background and return",
+        "completion.review.jobs": "List review jobs",
+        "completion.review.result": "Print a review job's output",
+        "review.job_queued": "📥 Review job {id} queued; it runs in the background.",
+        "review.job_duplicate": "♻️  The same diff is already job {id} ({status}); not queued again.",
+        "review.job_result_hint": "💡 Result: gwt review --result {id}  |  All jobs: gwt review --jobs",
+        "review.jobs_none": "No review jobs.",
+        "review.jobs_title": "📋 Review jobs ({n}):",
+        "review.jobs_hint": "💡 gwt review --result <ID> prints the output (an ID prefix is enough)",
+        "review.job_status.queued": "queued",
+        "review.job_status.running": "running",
+        "review.job_status.done": "done",
+        "review.job_status.failed": "failed",
+        "review.job_not_found": "❌ No review job '{id}' (or the prefix is ambiguous).",
+        "review.job_pending": "⏳ Review job {id} is not finished yet ({status}).",
+        "review.job_header": "📄 Review job {id} · {tool} · {mode}",
+        "review.job_failed": "❌ The review tool exited with code {rc}.",
+        # Git performance profile
+        "completion.setting.perf": "Apply the git performance profile to this worktree",
+        "perf.title": "⚡ Git performance profile: {path}",
+        "perf.scope": "   Written with: git config --{scope}",
+        "perf.unset": "unset",
+        "perf.was": "was: {value}",
+        "perf.not_effective": "not in effect; overridden by a higher-priority config?",
+        "perf.no_fsmonitor": "   ℹ️  This git has no built-in fsmonitor daemon; core.fsmonitor skipped.",
+        "perf.timing": "⏱️  git status: {before} → {after}",
+        "perf.not_applied": "⚠️  Performance settings not in effect: {keys}",
+        "perf.applied_new": "⚡ Git performance profile applied ({n} settings, --{scope})",
+        # Maintenance
+        "help.cmd.maintenance": "Maintain the shared object store: commit-graph, multi-pack-index, incremental repack",
+        "completion.maintenance": "Maintain commit-graph / multi-pack-index",
+        "completion.maintenance.status": "Show maintenance status",
+        "completion.maintenance.run": "Run maintenance now",
+        "completion.maintenance.schedule": "Set how often maintenance runs in the background",
+        "maintenance.title": "🧰 Object store maintenance: {path}",
+        "maintenance.waiting": "⏳ Waiting for other gwt operations (new/remove/maintenance) to finish...",
+        "maintenance.worktree_waiting": "⏳ Object store maintenance is running; waiting for it to finish...",
+        "maintenance.task_failed": "failed",
+        "maintenance.latency": "⏱️  {n} history queries: {before} → {after} ({x}×)",
+        "maintenance.done": "✅ Maintenance finished in {secs}s",
+        "maintenance.yes": "yes",
+        "maintenance.no": "no",
+        "maintenance.last_run": "   Last run: {age} ago (succeeded: {result})",
+        "maintenance.last_latency": "   Query latency last run: {before} → {after}",
+        "maintenance.never_run": "   ⚠️  gwt maintenance run has not been run yet",
+        "maintenance.scheduled": "🗓️  Background maintenance: every {hours}h (triggered after fetches and worktree creation)",
+        "maintenance.not_scheduled": "🗓️  Background maintenance: off (enable with gwt maintenance schedule daily)",
+        "maintenance.would_schedule": "Would set maintenance.interval: {name}",
+        # Status watch
+        "completion.status.watch": "Refresh as files change",
+        "status.watch_header": "👀 Watching {n} repos ({backend}) · {time} · refreshed in {secs}s · Ctrl-C to quit",
+        # Profiling
+        "completion.global.cprofile": "Profile this run with cProfile (--cprofile=FILE to choose the output)",
+        "profile.saved": "📊 Profile saved to {path}",
+        "profile.write_failed": "❌ Could not write the profile {path}: {error}",
+        # Legacy new <branch> <base>
+        "worktree.legacy_base_hint": "ℹ️  Read as the old form: creating {branch} from {base}. This form is deprecated; use `gwt new {branch} --base {base}`, and pass --base explicitly to create two worktrees.",
     },
 }
 
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Advisory file locks shared by concurrent gwt processes
+
+`FileLock` wraps `fcntl.flock` (POSIX) or `msvcrt.locking` (Windows). Locks
+are released by the OS when the process exits, so a crashed gwt never leaves
+a stale lock behind. Windows has no shared byte-range mode here, so shared
+locks are exclusive there.
+"""
+
+import os
+import time
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Exclusive (or, on POSIX, shared) lock on `path`; the file is created if missing."""
+
+    def __init__(self, path, shared=False):
+        self.path = path
+        self.shared = shared
+        self._fd = None
+
+    def _try_lock(self):
+        try:
+            if os.name == "nt":
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(self._fd, (fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self, blocking=True, timeout=None, poll=0.1):
+        """Returns True once the lock is held; False when not blocking or timed out."""
+        if self._fd is not None:
+            return True
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._try_lock():
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                os.close(self._fd)
+                self._fd = None
+                return False
+            time.sleep(poll)
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if os.name == "nt":
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except OSError:
+            pass
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    @property
+    def locked(self):
+        return self._fd is not None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Object store upkeep for `gwt maintenance`
+
+All worktrees of a repository share one object store, and the queries gwt
+runs all the time (ahead/behind counts, merge-base checks, `git log` for
+completion) walk commit history. `gwt maintenance run` keeps the structures
+that make those walks cheap up to date:
+
+- loose-objects: pack loose objects into a new pack
+- incremental-repack: expire packs superseded by the multi-pack-index and
+  repack small ones (`git maintenance run --task=incremental-repack`)
+- multi-pack-index: one index over every pack
+- commit-graph: split commit-graph with changed-path Bloom filters, so
+  path-limited `git log` skips most trees
+
+Maintenance holds `<common-dir>/gwt-maintenance.lock` exclusively; `gwt new`
+and `gwt remove` hold it shared (`worktree_lock()`), so they wait for a
+running maintenance instead of racing its ref and pack updates, and
+maintenance waits for them.
+
+The last run is recorded in `<common-dir>/gwt-maintenance.json`. With
+`maintenance.interval` set (`gwt maintenance schedule`), gwt starts a
+background `gwt maintenance run --auto` after fetches and worktree creation
+once the interval has elapsed.
+"""
+
+import contextlib
+import json
+import os
+import subprocess
+import time
+
+from gwtlib.locks import FileLock
+from gwtlib.utils import get_git_common_dir, git_output, run_cmd, spawn_gwt_background
+
+LOCK_FILE = "gwt-maintenance.lock"
+STATE_FILE = "gwt-maintenance.json"
+# `gwt maintenance schedule <name>` -> maintenance.interval (hours)
+INTERVALS = {"hourly": 1, "daily": 24, "weekly": 168, "off": 0}
+# Worktree operations give up waiting for maintenance after this long.
+WAIT_TIMEOUT = 600
+BENCH_RUNS = 3
+# Branches sampled for the ahead/behind part of the benchmark.
+BENCH_BRANCHES = 8
+
+TASKS = (
+    ("loose-objects", ["maintenance", "run", "--task=loose-objects", "--quiet"]),
+    ("incremental-repack", ["maintenance", "run", "--task=incremental-repack", "--quiet"]),
+    ("multi-pack-index", ["multi-pack-index", "write", "--no-progress"]),
+    ("commit-graph", ["commit-graph", "write", "--reachable", "--changed-paths", "--split", "--no-progress"]),
+)
+
+
+def _lock_path(common_dir):
+    return os.path.join(common_dir, LOCK_FILE)
+
+
+@contextlib.contextmanager
+def worktree_lock(cwd=None, on_wait=None):
+    """Shared maintenance lock held while a worktree is created or removed.
+
+    `on_wait()` is called once if a maintenance run holds the lock. After
+    WAIT_TIMEOUT the operation proceeds anyway rather than hang.
+    """
+    common_dir = get_git_common_dir(cwd)
+    if not common_dir:
+        yield
+        return
+    lock = FileLock(_lock_path(common_dir), shared=True)
+    if not lock.acquire(blocking=False):
+        if on_wait:
+            on_wait()
+        lock.acquire(timeout=WAIT_TIMEOUT)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def maintenance_lock(common_dir):
+    return FileLock(_lock_path(common_dir))
+
+
+def read_state(common_dir):
+    try:
+        with open(os.path.join(common_dir, STATE_FILE), "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def write_state(common_dir, state):
+    path = os.path.join(common_dir, STATE_FILE)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def get_interval(config):
+    """maintenance.interval in hours; 0 = not scheduled."""
+    value = (config.get("maintenance") or {}).get("interval", 0)
+    return value if isinstance(value, int) and value > 0 else 0
+
+
+def is_due(common_dir, config, now=None):
+    interval = get_interval(config)
+    if not interval:
+        return False
+    last = read_state(common_dir).get("at")
+    return not last or (now or time.time()) - last >= interval * 3600
+
+
+def trigger_if_due(config, cwd=None):
+    """Starts a background `gwt maintenance run --auto` when the schedule says so."""
+    common_dir = get_git_common_dir(cwd)
+    if common_dir and is_due(common_dir, config):
+        spawn_gwt_background(["maintenance", "run", "--auto"], cwd=cwd)
+
+
+def run_tasks(cwd=None, on_task=None):
+    """Runs every task in order; returns [(task, ok, seconds)]."""
+    results = []
+    for name, args in TASKS:
+        start = time.monotonic()
+        ok = run_cmd(["git"] + (["-C", cwd] if cwd else []) + args, capture_output=True) is not None
+        results.append((name, ok, time.monotonic() - start))
+        if on_task:
+            on_task(name, ok, results[-1][2])
+    return results
+
+
+def bench_queries(cwd=None, main_branch="main"):
+    """The history queries gwt leans on: ahead/behind, merge-base, path-limited log."""
+    base = ["git"] + (["-C", cwd] if cwd else [])
+    branches = (git_output(base[1:] + ["for-each-ref", "--format=%(refname:short)", "refs/heads"]) or "").splitlines()
+    branches = [b for b in branches if b != main_branch][:BENCH_BRANCHES]
+    queries = []
+    for branch in branches:
+        queries.append(base + ["rev-list", "--left-right", "--count", f"{main_branch}...{branch}"])
+        queries.append(base + ["merge-base", main_branch, branch])
+    path = (git_output(base[1:] + ["ls-tree", "--name-only", "HEAD"]) or "").splitlines()
+    if path:
+        queries.append(base + ["log", "-n", "20", "--format=%H", "HEAD", "--", path[0]])
+    queries.append(base + ["rev-list", "--count", "HEAD"])
+    return queries
+
+
+def time_queries(queries, runs=BENCH_RUNS):
+    """Best total wall time (seconds) of running `queries` once each."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        for cmd in queries:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best or 0.0
+
+
+def object_stats(common_dir):
+    """What is in place: commit-graph, multi-pack-index, pack count."""
+    objects = os.path.join(common_dir, "objects")
+    info = os.path.join(objects, "info")
+    pack_dir = os.path.join(objects, "pack")
+    try:
+        packs = [n for n in os.listdir(pack_dir) if n.endswith(".pack")]
+    except OSError:
+        packs = []
+    graph = os.path.exists(os.path.join(info, "commit-graph")) or os.path.isdir(os.path.join(info, "commit-graphs"))
+    return {
+        "commit_graph": graph,
+        "multi_pack_index": os.path.exists(os.path.join(pack_dir, "multi-pack-index")),
+        "packs": len(packs),
+    }
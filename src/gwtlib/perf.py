@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Git performance profile for large worktrees
+
+`gwt setting --perf` (and `gwt new` with perf.enabled) configures a worktree
+so `git status` / `git diff` stay fast on huge checkouts:
+
+- core.fsmonitor=true: built-in file system monitor daemon, only where git
+  was built with it (`git version --build-options` lists fsmonitor--daemon)
+- core.untrackedCache=true: cache untracked directory listings in the index
+- index.threads / checkout.workers: one per CPU
+- feature.manyFiles=true: index v4 and friends
+
+Settings are written with `git config --worktree` so every worktree can
+have its own profile. That needs extensions.worktreeConfig (which
+`git sparse-checkout` enables as well); when the repository has core.bare or
+core.worktree in its shared config, turning the extension on would change
+what other worktrees see, so the profile falls back to the repository-wide
+local config instead.
+"""
+
+import os
+import subprocess
+import time
+
+from gwtlib.utils import run_cmd
+
+SCOPES = ("worktree", "local")
+STATUS_RUNS = 3
+
+
+def _git(path, args):
+    return run_cmd(["git", "-C", path] + args, capture_output=True)
+
+
+def fsmonitor_supported():
+    out = run_cmd(["git", "version", "--build-options"], capture_output=True) or ""
+    return "fsmonitor--daemon" in out
+
+
+def profile_settings(cpus=None, fsmonitor=None):
+    """[(key, value)] of the profile for this machine."""
+    cpus = str(max(1, cpus or os.cpu_count() or 1))
+    settings = []
+    if fsmonitor_supported() if fsmonitor is None else fsmonitor:
+        settings.append(("core.fsmonitor", "true"))
+    settings.extend(
+        [
+            ("core.untrackedCache", "true"),
+            ("index.threads", cpus),
+            ("checkout.workers", cpus),
+            ("feature.manyFiles", "true"),
+        ]
+    )
+    return settings
+
+
+def resolve_scope(path, scope="worktree"):
+    """Config scope actually usable for `path` ("worktree" or "local")."""
+    if scope != "worktree":
+        return "local"
+    if _git(path, ["config", "--bool", "extensions.worktreeConfig"]) == "true":
+        return "worktree"
+    # Enabling the extension moves core.bare/core.worktree semantics to per-worktree config.
+    shared = _git(path, ["config", "--local", "--get-regexp", r"^core\.(bare|worktree)$"]) or ""
+    for line in shared.splitlines():
+        key, _, value = line.partition(" ")
+        if key == "core.worktree" or value.strip().lower() == "true":
+            return "local"
+    if _git(path, ["config", "--local", "extensions.worktreeConfig", "true"]) is None:
+        return "local"
+    return "worktree"
+
+
+def current_values(path, keys):
+    """{key: effective value or None} as git sees it in `path`."""
+    return {key: _git(path, ["config", "--get", key]) for key in keys}
+
+
+def apply_profile(path, settings, scope="worktree"):
+    """Writes `settings`; returns (scope used, [keys whose effective value differs])."""
+    scope = resolve_scope(path, scope)
+    for key, value in settings:
+        _git(path, ["config", f"--{scope}", key, value])
+    effective = current_values(path, [key for key, _ in settings])
+    mismatched = [key for key, value in settings if (effective.get(key) or "").lower() != value.lower()]
+    return scope, mismatched
+
+
+def time_status(path, runs=STATUS_RUNS, warmup=False):
+    """Best wall time (seconds) of `git status` in `path`; None if it fails.
+
+    warmup runs it once untimed first so caches (untracked cache, fsmonitor
+    token) are populated, as they are for every status after the first.
+    """
+    cmd = ["git", "-C", path, "status", "--porcelain"]
+    best = None
+    for i in range(runs + (1 if warmup else 0)):
+        start = time.perf_counter()
+        rc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+        elapsed = time.perf_counter() - start
+        if rc != 0:
+            return None
+        if warmup and i == 0:
+            continue
+        best = elapsed if best is None else min(best, elapsed)
+    return best
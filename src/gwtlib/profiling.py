@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Reporting for `gwt --cprofile[=FILE]`
+
+gwt.py starts cProfile before importing gwtlib (so startup imports are
+included) when `--cprofile` is on the command line; `report()` is called
+on the way out. It prints the top entries by cumulative time to stderr
+(stdout belongs to the command, e.g. completion output) and saves the
+profile:
+
+- FILE ending in .folded or .collapsed: collapsed stacks
+  ("a;b;c <microseconds>" per line) for flamegraph.pl / speedscope / inferno
+- any other FILE: pstats dump (`python -m pstats FILE`, snakeviz, ...)
+- no FILE: gwt-<command>-<timestamp>.pstats in the temp directory
+
+cProfile records caller/callee edges, not full stacks, so collapsed stacks
+are reconstructed bottom-up: each function's own time is split across its
+callers in proportion to the time each caller spent in it, and so on up to
+functions entered from outside the profile. Exact for trees, an
+approximation where a function is reached through several paths; a
+recursion cycle ends the stack. All self time lands in some stack,
+so the folded total matches the profile's.
+"""
+
+import os
+import pstats
+import sys
+import tempfile
+import time
+
+from gwtlib.i18n import t
+
+TOP_N = 25
+FOLDED_SUFFIXES = (".folded", ".collapsed")
+# Stacks deeper than this are cut; shares of less than MIN_US stay with the
+# callee instead of being followed further up.
+MAX_DEPTH = 128
+MIN_US = 10
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == "~":
+        return name.strip("<>").replace(" ", "_") or "builtin"
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def collapsed_stacks(stats):
+    """{"a;b;c": microseconds of self time} from a pstats.Stats."""
+    raw = stats.stats
+    stacks = {}
+
+    def climb(func, us, path, seen):
+        # `path` runs from the function owning the time up to `func`.
+        callers = raw[func][4]
+        denom = max(raw[func][3], sum(edge[3] for edge in callers.values()))
+        rest = us
+        if len(path) < MAX_DEPTH and denom > 0:
+            for caller, edge in callers.items():
+                part = us * edge[3] / denom
+                # Recursion: the caller is already below on this stack.
+                if caller in seen or part < MIN_US:
+                    continue
+                rest -= part
+                climb(caller, part, path + [caller], seen | {caller})
+        if rest > 0:
+            key = ";".join(_label(f) for f in reversed(path))
+            stacks[key] = stacks.get(key, 0) + rest
+
+    for func, (_cc, _nc, tt, _ct, _callers) in raw.items():
+        if tt > 0:
+            climb(func, tt * 1e6, [func], {func})
+    return {key: round(us) for key, us in stacks.items() if round(us) > 0}
+
+
+def default_path(command):
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    return os.path.join(tempfile.gettempdir(), f"gwt-{command or 'gwt'}-{stamp}.pstats")
+
+
+def report(profiler, path=None, command=None, stream=None):
+    """Stops `profiler`, prints the top cumulative entries and saves the profile; returns the path."""
+    profiler.disable()
+    stream = stream or sys.stderr
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats("cumulative").print_stats(TOP_N)
+
+    path = path or default_path(command)
+    try:
+        if path.endswith(FOLDED_SUFFIXES):
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, us in sorted(collapsed_stacks(stats).items()):
+                    f.write(f"{stack} {us}\n")
+        else:
+            stats.dump_stats(path)
+    except OSError as e:
+        stream.write(t("profile.write_failed", path=path, error=e) + "\n")
+        return None
+    stream.write(t("profile.saved", path=path) + "\n")
+    return path
@@ -12,13 +12,20 @@ Goal: keep `src/gwt.py`, help, and completion in sync by generating from registr
 
 from __future__ import annotations
 
+import argparse
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from gwtlib.commands.merge import cmd_commit, cmd_merge
 from gwtlib.commands.init import cmd_init
+from gwtlib.commands.pool import cmd_pool
+from gwtlib.commands.conflicts import cmd_conflicts
+from gwtlib.commands.maintenance import cmd_maintenance
+from gwtlib.commands.sync import cmd_sync
+from gwtlib.commands.trash import cmd_trash
 from gwtlib.commands.review import cmd_review
 from gwtlib.commands.setting import cmd_setting
+from gwtlib.commands.sparse import cmd_sparse
 from gwtlib.commands.status import cmd_status
 from gwtlib.commands.update import cmd_update
 from gwtlib.commands.worktree import cmd_cd, cmd_list, cmd_new, cmd_prune, cmd_remove
@@ -62,6 +69,13 @@ def iter_commands() -> List[CommandSpec]:
             func=cmd_list,
             help_key="help.cmd.list",
             completion_key="completion.list",
+            args=(
+                ArgSpec(("--meta", "-m"), {"action": "store_true", "help": "Show base, age, last use, cached size and dirty flag"}),
+                ArgSpec(("--long", "-l"), {"action": "store_true", "help": "Upstream, ahead/behind mainBranch, last commit"}),
+                ArgSpec(("--json",), {"action": "store_true", "help": "Machine-readable output"}),
+                ArgSpec(("--size", "-s"), {"action": "store_true", "help": "Disk usage per worktree (tracked/ignored/untracked)"}),
+                ArgSpec(("--refresh",), {"action": "store_true", "help": "Re-check dirty state / re-walk all directories"}),
+            ),
         ),
         CommandSpec(
             name="status",
@@ -69,6 +83,7 @@ def iter_commands() -> List[CommandSpec]:
             func=cmd_status,
             help_key="help.cmd.status",
             completion_key="completion.status",
+            args=(ArgSpec(("--watch", "-w"), {"action": "store_true", "help": "Keep the view up to date as files change"}),),
         ),
         CommandSpec(
             name="new",
@@ -77,8 +92,36 @@ def iter_commands() -> List[CommandSpec]:
             help_key="help.cmd.new",
             completion_key="completion.new",
             args=(
-                ArgSpec(("branch",), {"nargs": "?", "help": "Branch name (optional, interactive if omitted)"}),
-                ArgSpec(("base",), {"nargs": "?", "help": "Base branch to create from (default: HEAD)"}),
+                ArgSpec(
+                    ("branch",),
+                    {"nargs": "*", "help": "Branch name(s); interactive if omitted. Two names where the second is an existing ref: `new <branch> <base>` (deprecated, use --base)"},
+                ),
+                ArgSpec(("--base",), {"metavar": "REF", "help": "Base to create new branches from (default: HEAD)"}),
+                ArgSpec(("--from-file", "-f"), {"metavar": "FILE", "help": "Read branch names from FILE ('-' = stdin)"}),
+                ArgSpec(("--jobs", "-j"), {"type": int, "metavar": "N", "help": "Worktrees created concurrently in batch mode"}),
+                ArgSpec(("--cd",), {"metavar": "BRANCH", "help": "Batch mode: cd into this branch's worktree (default: first)"}),
+                ArgSpec(("--profile", "-p"), {"metavar": "NAME", "help": "Sparse-checkout profile from setting.json"}),
+                ArgSpec(("--no-seed",), {"action": "store_true", "help": "Skip cloning build artifacts"}),
+            ),
+        ),
+        CommandSpec(
+            name="sparse",
+            func=cmd_sparse,
+            help_key="help.cmd.sparse",
+            completion_key="completion.sparse",
+            args=(
+                ArgSpec(("action",), {"nargs": "?", "choices": ["list", "add", "remove", "profiles"], "default": "list"}),
+                ArgSpec(("paths",), {"nargs": "*", "help": "Directories to add/remove"}),
+                ArgSpec(("--profile", "-p"), {"metavar": "NAME", "help": "Use the directories of a sparse profile"}),
+            ),
+        ),
+        CommandSpec(
+            name="pool",
+            func=cmd_pool,
+            help_key="help.cmd.pool",
+            completion_key="completion.pool",
+            args=(
+                ArgSpec(("action",), {"nargs": "?", "choices": ["status", "fill", "drain"], "default": "status"}),
             ),
         ),
         CommandSpec(
@@ -87,13 +130,46 @@ def iter_commands() -> List[CommandSpec]:
             func=cmd_remove,
             help_key="help.cmd.remove",
             completion_key="completion.remove",
-            args=(ArgSpec(("target",), {"nargs": "?"}),),
+            args=(
+                ArgSpec(("target",), {"nargs": "?"}),
+                ArgSpec(("--fast",), {"action": "store_true", "help": "Rename into trash and delete in the background"}),
+            ),
+        ),
+        CommandSpec(
+            name="trash",
+            func=cmd_trash,
+            help_key="help.cmd.trash",
+            completion_key="completion.trash",
+            args=(
+                ArgSpec(("action",), {"nargs": "?", "choices": ["status", "empty"], "default": "status"}),
+            ),
         ),
         CommandSpec(
             name="prune",
             func=cmd_prune,
             help_key="help.cmd.prune",
             completion_key="completion.prune",
+            args=(
+                ArgSpec(("--merged",), {"action": "store_true", "help": "Remove worktrees whose branch is merged into mainBranch"}),
+                ArgSpec(("--gone",), {"action": "store_true", "help": "Remove worktrees whose upstream branch was deleted"}),
+                ArgSpec(("--stale",), {"type": int, "metavar": "DAYS", "help": "Remove worktrees with no commit for DAYS days"}),
+                ArgSpec(("--force", "-f"), {"action": "store_true", "help": "Also remove dirty or locked worktrees"}),
+                ArgSpec(("--jobs", "-j"), {"type": int, "help": "Parallel workers"}),
+                ArgSpec(("--fast",), {"action": "store_true", "help": "Rename into trash and delete in the background"}),
+            ),
+        ),
+        CommandSpec(
+            name="sync",
+            func=cmd_sync,
+            help_key="help.cmd.sync",
+            completion_key="completion.sync",
+            args=(
+                ArgSpec(("--ff-only",), {"dest": "policy", "action": "store_const", "const": "ff-only", "help": "Only fast-forward (default)"}),
+                ArgSpec(("--rebase",), {"dest": "policy", "action": "store_const", "const": "rebase", "help": "Rebase diverged branches onto their upstream"}),
+                ArgSpec(("--no-fetch",), {"action": "store_true", "help": "Use the remote-tracking refs as they are"}),
+                ArgSpec(("--fetch",), {"action": "store_true", "help": "Fetch even if the last fetch is still fresh"}),
+                ArgSpec(("--jobs", "-j"), {"type": int, "help": "Parallel workers"}),
+            ),
         ),
         CommandSpec(
             name="cd",
@@ -101,6 +177,7 @@ def iter_commands() -> List[CommandSpec]:
             func=cmd_cd,
             help_key="help.cmd.cd",
             completion_key="completion.cd",
+            args=(ArgSpec(("query",), {"nargs": "*", "help": "Worktree name/branch keywords (frecency ranked)"}),),
         ),
         CommandSpec(
             name="update",
@@ -115,8 +192,13 @@ def iter_commands() -> List[CommandSpec]:
             func=cmd_new,
             hidden=True,
             args=(
-                ArgSpec(("branch",), {"nargs": "?", "help": "Branch name (optional)"}),
-                ArgSpec(("base",), {"nargs": "?", "help": "Base branch to create from (default: HEAD)"}),
+                ArgSpec(("branch",), {"nargs": "*", "help": "Branch name(s) (optional)"}),
+                ArgSpec(("--base",), {"metavar": "REF", "help": "Base to create new branches from (default: HEAD)"}),
+                ArgSpec(("--from-file", "-f"), {"metavar": "FILE", "help": "Read branch names from FILE ('-' = stdin)"}),
+                ArgSpec(("--jobs", "-j"), {"type": int, "metavar": "N", "help": "Worktrees created concurrently in batch mode"}),
+                ArgSpec(("--cd",), {"metavar": "BRANCH", "help": "Batch mode: cd into this branch's worktree (default: first)"}),
+                ArgSpec(("--profile", "-p"), {"metavar": "NAME", "help": "Sparse-checkout profile from setting.json"}),
+                ArgSpec(("--no-seed",), {"action": "store_true", "help": "Skip cloning build artifacts"}),
             ),
         ),
         CommandSpec(
@@ -124,6 +206,39 @@ def iter_commands() -> List[CommandSpec]:
             func=cmd_merge,
             help_key="help.cmd.merge",
             completion_key="completion.merge",
+            args=(
+                ArgSpec(
+                    ("--in-memory",),
+                    {"dest": "in_memory", "action": "store_true", "default": None, "help": "Merge with git merge-tree, no checkout"},
+                ),
+                ArgSpec(
+                    ("--checkout",),
+                    {"dest": "in_memory", "action": "store_false", "help": "Check out the target here and run git merge"},
+                ),
+            ),
+        ),
+        CommandSpec(
+            name="conflicts",
+            func=cmd_conflicts,
+            help_key="help.cmd.conflicts",
+            completion_key="completion.conflicts",
+            args=(
+                ArgSpec(("--pairwise",), {"action": "store_true", "help": "Also test every branch against every other"}),
+                ArgSpec(("--matrix",), {"action": "store_true", "help": "Show pairwise results as a grid"}),
+                ArgSpec(("--all", "-a"), {"action": "store_true", "help": "All local/remote branches, not just worktree branches"}),
+                ArgSpec(("--jobs", "-j"), {"type": int, "help": "Parallel merges"}),
+            ),
+        ),
+        CommandSpec(
+            name="maintenance",
+            func=cmd_maintenance,
+            help_key="help.cmd.maintenance",
+            completion_key="completion.maintenance",
+            args=(
+                ArgSpec(("action",), {"nargs": "?", "choices": ["status", "run", "schedule"], "default": "status"}),
+                ArgSpec(("interval",), {"nargs": "?", "choices": ["hourly", "daily", "weekly", "off"], "help": "schedule: how often"}),
+                ArgSpec(("--auto",), {"action": "store_true", "help": "run: only when due; skip if the lock is taken"}),
+            ),
         ),
         CommandSpec(
             name="commit",
@@ -143,6 +258,7 @@ def iter_commands() -> List[CommandSpec]:
                 ArgSpec(("--show", "-s"), {"action": "store_true", "help": "Show current config"}),
                 ArgSpec(("--init", "-i"), {"action": "store_true", "help": "Initialize config with detection"}),
                 ArgSpec(("--reset", "-r"), {"action": "store_true", "help": "Reset config to defaults"}),
+                ArgSpec(("--perf",), {"action": "store_true", "help": "Apply the git performance profile to this worktree"}),
             ),
         ),
         CommandSpec(
@@ -154,6 +270,12 @@ def iter_commands() -> List[CommandSpec]:
             args=(
                 ArgSpec(("--tool", "-t"), {"default": "codex", "help": "AI Tool (claude, codex, gemini)"}),
                 ArgSpec(("--model", "-m"), {"help": "Specific model override"}),
+                ArgSpec(("--since-last",), {"action": "store_true", "help": "Only what changed since the last review"}),
+                ArgSpec(("--async",), {"dest": "run_async", "action": "store_true", "help": "Queue the review and return; a background worker runs it"}),
+                ArgSpec(("--jobs",), {"dest": "list_jobs", "action": "store_true", "help": "List queued/finished review jobs"}),
+                ArgSpec(("--result",), {"metavar": "ID", "help": "Print the output of a review job"}),
+                # Background worker draining the job queue (spawned by --async).
+                ArgSpec(("--worker",), {"action": "store_true", "help": argparse.SUPPRESS}),
                 # review target flags (mutually exclusive group is handled in gwt.py)
             ),
         ),
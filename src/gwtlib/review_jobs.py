@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""Local job queue for `gwt review --async`
+
+A job is a captured diff plus the review settings, stored under
+`<worktree>/.gwt/review_jobs/`:
+
+- `<id>.diff`: the diff handed to the AI tool
+- `<id>.json`: metadata and status (queued, running, done, failed)
+- `<id>.out`: the tool's output once it ran
+
+The id is derived from the diff hash, tool and model, so enqueuing the same
+diff twice returns the existing job instead of reviewing it again (failed
+jobs are requeued).
+
+Jobs are run by `gwt review --worker`, spawned in the background on enqueue.
+Concurrency is bounded by slot locks (`slot-<n>.lock`, n < review.asyncJobs):
+a worker only runs while holding a slot, and exits when none is free since
+the busy workers drain the queue anyway. Each job is claimed under its own
+lock, so two workers never run the same job.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+
+from gwtlib.config import GWT_CONFIG_DIR
+from gwtlib.locks import FileLock
+
+JOBS_DIR = "review_jobs"
+DEFAULT_CONCURRENCY = 2
+# Finished jobs kept on disk; older ones are pruned on enqueue.
+KEEP_FINISHED = 50
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def get_jobs_dir(root):
+    return os.path.join(root, GWT_CONFIG_DIR, JOBS_DIR)
+
+
+def get_concurrency(config):
+    try:
+        n = int(config.get("review", {}).get("asyncJobs", DEFAULT_CONCURRENCY))
+    except (TypeError, ValueError):
+        return DEFAULT_CONCURRENCY
+    return max(1, n)
+
+
+def job_id(diff_hash, tool, model):
+    return hashlib.sha256(f"{diff_hash}|{tool}|{model}".encode("utf-8")).hexdigest()[:12]
+
+
+def _meta_path(jobs_dir, jid):
+    return os.path.join(jobs_dir, f"{jid}.json")
+
+
+def load_job(jobs_dir, jid):
+    try:
+        with open(_meta_path(jobs_dir, jid), "r", encoding="utf-8") as f:
+            job = json.load(f)
+        return job if isinstance(job, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_job(jobs_dir, job):
+    path = _meta_path(jobs_dir, job["id"])
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(job, f, indent=2)
+    os.replace(tmp, path)
+
+
+def list_jobs(jobs_dir):
+    """All jobs, newest first."""
+    try:
+        names = os.listdir(jobs_dir)
+    except OSError:
+        return []
+    jobs = [load_job(jobs_dir, name[:-5]) for name in names if name.endswith(".json")]
+    return sorted((j for j in jobs if j), key=lambda j: j.get("created", 0), reverse=True)
+
+
+def find_job(jobs_dir, prefix):
+    """Job whose id starts with `prefix`; None if there is no or more than one match."""
+    matches = [j for j in list_jobs(jobs_dir) if j["id"].startswith(prefix)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def effective_status(jobs_dir, job):
+    """Status with crashed workers accounted for: a running job whose lock is free failed."""
+    status = job.get("status")
+    if status != RUNNING:
+        return status
+    lock = FileLock(os.path.join(jobs_dir, f"{job['id']}.lock"))
+    if lock.acquire(blocking=False):
+        lock.release()
+        return FAILED
+    return RUNNING
+
+
+def output_path(jobs_dir, jid):
+    return os.path.join(jobs_dir, f"{jid}.out")
+
+
+def diff_path(jobs_dir, jid):
+    return os.path.join(jobs_dir, f"{jid}.diff")
+
+
+def enqueue(jobs_dir, diff_file, diff_hash, fields, now=None):
+    """Queues the review of `diff_file` (moved into the queue).
+
+    Returns (job, created). An existing queued, running or done job for the
+    same diff, tool and model is returned as is and `diff_file` is dropped.
+    """
+    os.makedirs(jobs_dir, exist_ok=True)
+    jid = job_id(diff_hash, fields.get("tool"), fields.get("model"))
+    existing = load_job(jobs_dir, jid)
+    if existing and effective_status(jobs_dir, existing) != FAILED:
+        os.remove(diff_file)
+        return existing, False
+
+    os.replace(diff_file, diff_path(jobs_dir, jid))
+    job = dict(fields, id=jid, diff_hash=diff_hash, status=QUEUED, created=now or time.time())
+    save_job(jobs_dir, job)
+    _prune(jobs_dir)
+    return job, True
+
+
+def _prune(jobs_dir):
+    finished = [j for j in list_jobs(jobs_dir) if j.get("status") in (DONE, FAILED)]
+    for job in finished[KEEP_FINISHED:]:
+        jid = job["id"]
+        for path in (_meta_path(jobs_dir, jid), diff_path(jobs_dir, jid), output_path(jobs_dir, jid), os.path.join(jobs_dir, f"{jid}.lock")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _acquire_slot(jobs_dir, concurrency):
+    for n in range(concurrency):
+        lock = FileLock(os.path.join(jobs_dir, f"slot-{n}.lock"))
+        if lock.acquire(blocking=False):
+            return lock
+    return None
+
+
+def _claim_next(jobs_dir):
+    """Oldest queued job, marked running; returns (job, job lock) or (None, None)."""
+    for job in reversed(list_jobs(jobs_dir)):
+        if job.get("status") != QUEUED:
+            continue
+        lock = FileLock(os.path.join(jobs_dir, f"{job['id']}.lock"))
+        if not lock.acquire(blocking=False):
+            continue
+        job = load_job(jobs_dir, job["id"])
+        if job and job.get("status") == QUEUED:
+            job.update(status=RUNNING, started=time.time(), pid=os.getpid())
+            save_job(jobs_dir, job)
+            return job, lock
+        lock.release()
+    return None, None
+
+
+def _has_queued(jobs_dir):
+    return any(j.get("status") == QUEUED for j in list_jobs(jobs_dir))
+
+
+def run_worker(jobs_dir, concurrency, build_cmd, on_done=None):
+    """Drains the queue while holding a slot; returns the number of jobs run.
+
+    build_cmd(job) -> argv of the non-interactive review command.
+    on_done(job) is called after a job succeeded.
+    """
+    ran = 0
+    while True:
+        slot = _acquire_slot(jobs_dir, concurrency)
+        if slot is None:
+            return ran
+        try:
+            while True:
+                job, lock = _claim_next(jobs_dir)
+                if job is None:
+                    break
+                try:
+                    _run_job(jobs_dir, job, build_cmd)
+                    ran += 1
+                    if job["status"] == DONE and on_done:
+                        on_done(job)
+                finally:
+                    lock.release()
+        finally:
+            slot.release()
+        # A job enqueued while this worker was about to leave finds no
+        # free slot for its own worker; pick it up instead.
+        if not _has_queued(jobs_dir):
+            return ran
+
+
+def _run_job(jobs_dir, job, build_cmd):
+    rc = None
+    try:
+        with open(output_path(jobs_dir, job["id"]), "wb") as out:
+            rc = subprocess.run(
+                build_cmd(job),
+                cwd=job.get("cwd") or None,
+                stdin=subprocess.DEVNULL,
+                stdout=out,
+                stderr=subprocess.STDOUT,
+            ).returncode
+    except OSError as e:
+        with open(output_path(jobs_dir, job["id"]), "a", encoding="utf-8") as out:
+            out.write(f"\n{e}\n")
+    job.update(status=DONE if rc == 0 else FAILED, returncode=rc, finished=time.time())
+    job.pop("pid", None)
+    save_job(jobs_dir, job)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Tests for artifact seeding helpers."""
+import errno
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestMatchArtifact(unittest.TestCase):
+    def test_basename_and_path_globs(self):
+        from gwtlib.artifacts import match_artifact
+
+        self.assertTrue(match_artifact("node_modules/", ["node_modules"]))
+        self.assertTrue(match_artifact("packages/web/node_modules/", ["node_modules"]))
+        self.assertTrue(match_artifact("crates/core/target", ["crates/*/target"]))
+        self.assertFalse(match_artifact("build/", ["node_modules", ".venv"]))
+
+
+class TestCloneTree(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.tmp.name, "src")
+        os.makedirs(os.path.join(self.src, "pkg", "bin"))
+        with open(os.path.join(self.src, "pkg", "index.js"), "w") as f:
+            f.write("module.exports = 1;\n")
+        if os.name != "nt":
+            os.symlink("../index.js", os.path.join(self.src, "pkg", "bin", "cli"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _clone(self, mode):
+        from gwtlib.artifacts import _Cloner, clone_tree
+
+        dst = os.path.join(self.tmp.name, mode)
+        cloner = _Cloner(mode)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in clone_tree(self.src, dst, cloner, executor):
+                future.result()
+        return dst, cloner
+
+    def test_copy_mode(self):
+        dst, cloner = self._clone("copy")
+        with open(os.path.join(dst, "pkg", "index.js")) as f:
+            self.assertEqual(f.read(), "module.exports = 1;\n")
+        self.assertEqual(cloner.files, 1)
+        self.assertEqual(cloner.saved, 0)
+        if os.name != "nt":
+            self.assertEqual(os.readlink(os.path.join(dst, "pkg", "bin", "cli")), "../index.js")
+
+    def test_hardlink_mode_shares_inode(self):
+        probe = os.path.join(self.tmp.name, "probe")
+        try:
+            os.link(os.path.join(self.src, "pkg", "index.js"), probe)
+        except OSError:
+            self.skipTest("hardlinks not supported here")
+        os.remove(probe)
+
+        # Without reflink support, hardlink mode falls back to a link, not a copy.
+        unsupported = OSError(errno.EOPNOTSUPP, "reflink unsupported")
+        with patch("gwtlib.artifacts._reflink", side_effect=unsupported):
+            dst, cloner = self._clone("hardlink")
+        src_stat = os.stat(os.path.join(self.src, "pkg", "index.js"))
+        dst_stat = os.stat(os.path.join(dst, "pkg", "index.js"))
+        self.assertEqual(src_stat.st_ino, dst_stat.st_ino)
+        self.assertEqual(cloner.saved, src_stat.st_size)
+        self.assertFalse(cloner.reflink_ok)
+
+    def test_existing_files_are_kept(self):
+        dst = os.path.join(self.tmp.name, "copy")
+        os.makedirs(os.path.join(dst, "pkg"))
+        with open(os.path.join(dst, "pkg", "index.js"), "w") as f:
+            f.write("local\n")
+        dst, cloner = self._clone("copy")
+        with open(os.path.join(dst, "pkg", "index.js")) as f:
+            self.assertEqual(f.read(), "local\n")
+        self.assertEqual(cloner.files, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
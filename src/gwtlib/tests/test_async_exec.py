@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Tests for the asyncio command engine in gwtlib.utils."""
+import sys
+import time
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def _py(code):
+    return [sys.executable, "-c", code]
+
+
+class TestGatherCmds(unittest.TestCase):
+    def test_results_keep_input_order(self):
+        from gwtlib.utils import gather_cmds
+
+        cmds = [_py(f"import time; time.sleep({0.2 - i * 0.05}); print({i})") for i in range(4)]
+        self.assertEqual(gather_cmds(cmds), ["0", "1", "2", "3"])
+
+    def test_failure_maps_to_none_or_false(self):
+        from gwtlib.utils import gather_cmds
+
+        self.assertEqual(gather_cmds([_py("import sys; sys.exit(3)")]), [None])
+        self.assertEqual(gather_cmds([_py("pass"), _py("raise SystemExit(1)")], capture_output=False), [True, False])
+
+    def test_timeout_kills_command(self):
+        from gwtlib.utils import gather_cmds
+
+        start = time.monotonic()
+        result = gather_cmds([_py("import time; time.sleep(30)")], timeout=0.5)
+        self.assertEqual(result, [None])
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_missing_executable(self):
+        from gwtlib.utils import gather_cmds
+
+        self.assertEqual(gather_cmds([["gwt-definitely-missing-binary"]]), [None])
+
+    def test_empty(self):
+        from gwtlib.utils import git_outputs
+
+        self.assertEqual(git_outputs([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
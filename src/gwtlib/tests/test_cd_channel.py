@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shell wrapper cd channel (GWT_CD_FD / GWT_CD_FILE)."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+@unittest.skipIf(os.name == "nt", "POSIX pipe fd protocol")
+class TestRequestCd(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cd_file = os.path.join(self.tmp.name, "cd_target")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_writes_to_pipe_without_creating_file(self):
+        from gwtlib.utils import request_cd
+
+        r, w = os.pipe()
+        try:
+            with mock.patch.dict(os.environ, {"GWT_CD_FD": str(w), "GWT_CD_FILE": self.cd_file}):
+                request_cd(self.tmp.name)
+            self.assertEqual(os.read(r, 4096).decode(), self.tmp.name + "\n")
+            self.assertFalse(os.path.exists(self.cd_file))
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def test_falls_back_to_file_when_fd_unusable(self):
+        from gwtlib.utils import request_cd
+
+        with open(os.path.join(self.tmp.name, "regular"), "w") as regular:
+            env = {"GWT_CD_FD": str(regular.fileno()), "GWT_CD_FILE": self.cd_file}
+            with mock.patch.dict(os.environ, env):
+                request_cd(self.tmp.name)
+        with open(self.cd_file) as f:
+            self.assertEqual(f.read(), self.tmp.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
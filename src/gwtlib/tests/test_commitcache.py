@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Tests for the HEAD-keyed commit completion cache."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestCommitCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = self.tmp.name
+        self._git("init", "-q")
+        for i in range(3):
+            self._commit(f"commit {i}")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _git(self, *args):
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=self.repo, check=True, stdout=subprocess.DEVNULL,
+        )
+
+    def _commit(self, msg):
+        self._git("commit", "-q", "--allow-empty", "-m", msg)
+
+    def _recent(self, depth=10):
+        from gwtlib.commitcache import recent_commits
+
+        cwd = os.getcwd()
+        os.chdir(self.repo)
+        try:
+            return recent_commits(depth)
+        finally:
+            os.chdir(cwd)
+
+    def test_cache_hit_runs_no_git(self):
+        first = self._recent()
+        self.assertEqual([c[2] for c in first], ["commit 2", "commit 1", "commit 0"])
+        with patch("gwtlib.commitcache.git_output", side_effect=AssertionError("git called")):
+            self.assertEqual(self._recent(), first)
+
+    def test_new_commits_extend_incrementally(self):
+        import gwtlib.commitcache as cc
+
+        self._recent()
+        self._commit("commit 3")
+        calls = []
+        real = cc.git_output
+
+        def _spy(args):
+            calls.append(args)
+            return real(args)
+
+        with patch("gwtlib.commitcache.git_output", side_effect=_spy):
+            commits = self._recent()
+        self.assertEqual([c[2] for c in commits][:2], ["commit 3", "commit 2"])
+        self.assertEqual(len(commits), 4)
+        self.assertTrue(any(".." in a[-1] for a in calls if a[0] == "log"))
+
+
+if __name__ == "__main__":
+    unittest.main()
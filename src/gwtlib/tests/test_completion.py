@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Tests for prefix-filtered, capped branch completion."""
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestBranchCompletion(unittest.TestCase):
+    def test_patterns_escape_glob_chars(self):
+        from gwtlib.completion import _branch_patterns
+
+        patterns = _branch_patterns("fe[1]*")
+        self.assertIn("refs/heads/fe\\[1]\\**", patterns)
+        self.assertIn("refs/remotes/*/fe\\[1]\\**/**", patterns)
+
+    def test_remote_names_stripped_and_deduped(self):
+        from gwtlib.completion import _complete_branches
+
+        refs = "\n".join(["refs/heads/feat", "refs/remotes/origin/feat", "refs/remotes/origin/fix", "refs/remotes/origin/HEAD"])
+        with patch("gwtlib.completion.git_output", return_value=refs):
+            values = [opt.split(":")[0] for opt in _complete_branches("f")]
+        self.assertEqual(values, ["feat", "fix"])
+
+    def test_results_capped_with_hint(self):
+        from gwtlib.completion import _complete_branches
+
+        refs = "\n".join(f"refs/heads/fe-{i}" for i in range(30))
+        with patch("gwtlib.completion.git_output", return_value=refs):
+            values = [opt.split(":")[0] for opt in _complete_branches("fe", limit=5)]
+        self.assertEqual(values, ["fe-0", "fe-1", "fe-2", "fe-3", "fe-4", ""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests for config validation of newer config sections."""
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def _sanitize(cfg):
+    from gwtlib.config import DEFAULT_CONFIG
+    from gwtlib.config_schema import validate_and_sanitize_config
+
+    return validate_and_sanitize_config(cfg, DEFAULT_CONFIG)
+
+
+class TestSparseProfiles(unittest.TestCase):
+    def test_valid_profiles_kept(self):
+        out, warnings = _sanitize({"sparseProfiles": {"web": ["apps/web", "libs/ui"]}})
+        self.assertEqual(out["sparseProfiles"], {"web": ["apps/web", "libs/ui"]})
+        self.assertEqual(warnings, [])
+
+    def test_invalid_entries_dropped(self):
+        out, warnings = _sanitize({"sparseProfiles": {"web": ["apps/web", 3, ""], "bad": "apps"}})
+        self.assertEqual(out["sparseProfiles"], {"web": ["apps/web"]})
+        self.assertTrue(warnings)
+
+    def test_wrong_type_ignored(self):
+        out, warnings = _sanitize({"sparseProfiles": ["web"]})
+        self.assertNotIn("sparseProfiles", out)
+        self.assertTrue(warnings)
+
+
+class TestSubmoduleUpdate(unittest.TestCase):
+    def test_valid_values_kept(self):
+        out, _ = _sanitize({"submoduleUpdate": {"jobs": 8, "shareObjects": "false"}})
+        self.assertEqual(out["submoduleUpdate"], {"jobs": 8, "shareObjects": False})
+
+    def test_invalid_jobs_dropped(self):
+        out, warnings = _sanitize({"submoduleUpdate": {"jobs": -1}})
+        self.assertNotIn("submoduleUpdate", out)
+        self.assertTrue(warnings)
+
+
+class TestMergeInMemory(unittest.TestCase):
+    def test_in_memory_flag_kept(self):
+        out, _ = _sanitize({"merge": {"tool": "meld", "inMemory": "yes"}})
+        self.assertEqual(out["merge"], {"tool": "meld", "inMemory": True})
+
+
+class TestFetch(unittest.TestCase):
+    def test_freshness_kept(self):
+        out, _ = _sanitize({"fetch": {"freshness": 0}})
+        self.assertEqual(out["fetch"], {"freshness": 0})
+
+    def test_negative_freshness_dropped(self):
+        out, warnings = _sanitize({"fetch": {"freshness": -5}})
+        self.assertNotIn("fetch", out)
+        self.assertTrue(warnings)
+
+
+class TestReview(unittest.TestCase):
+    def test_async_jobs_kept(self):
+        out, _ = _sanitize({"review": {"asyncJobs": 4}})
+        self.assertEqual(out["review"]["asyncJobs"], 4)
+
+    def test_zero_async_jobs_dropped(self):
+        out, warnings = _sanitize({"review": {"asyncJobs": 0}})
+        self.assertNotIn("review", out)
+        self.assertTrue(warnings)
+
+
+class TestMaintenance(unittest.TestCase):
+    def test_interval_kept(self):
+        out, _ = _sanitize({"maintenance": {"interval": 24}})
+        self.assertEqual(out["maintenance"], {"interval": 24})
+
+    def test_string_interval_dropped(self):
+        out, warnings = _sanitize({"maintenance": {"interval": "daily"}})
+        self.assertNotIn("maintenance", out)
+        self.assertTrue(warnings)
+
+
+class TestPerf(unittest.TestCase):
+    def test_perf_kept(self):
+        out, _ = _sanitize({"perf": {"enabled": "yes", "scope": "local"}})
+        self.assertEqual(out["perf"], {"enabled": True, "scope": "local"})
+
+    def test_unknown_scope_dropped(self):
+        out, warnings = _sanitize({"perf": {"scope": "global"}})
+        self.assertNotIn("perf", out)
+        self.assertTrue(warnings)
+
+
+class TestSync(unittest.TestCase):
+    def test_policy_kept(self):
+        out, _ = _sanitize({"sync": {"policy": "rebase"}})
+        self.assertEqual(out["sync"], {"policy": "rebase"})
+
+    def test_unknown_policy_dropped(self):
+        out, warnings = _sanitize({"sync": {"policy": "merge"}})
+        self.assertNotIn("sync", out)
+        self.assertTrue(warnings)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests for merge conflict prediction and its (oid, oid) cache."""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestParseMergeTree(unittest.TestCase):
+    def test_clean_and_conflicted(self):
+        from gwtlib.conflicts import parse_merge_tree
+
+        self.assertEqual(parse_merge_tree("a" * 40), [])
+        self.assertEqual(parse_merge_tree("a" * 40 + "\nsrc/x.py\ndocs/y.md\nsrc/x.py\n"), ["docs/y.md", "src/x.py"])
+
+
+class TestPredict(unittest.TestCase):
+    def test_only_new_pairs_are_merged(self):
+        from gwtlib import conflicts
+
+        calls = []
+
+        def fake_outputs(arg_lists, limit=None, ok_codes=(0,)):
+            calls.append(arg_lists)
+            return ["tree\nf.txt" if "c2" in args else "tree" for args in arg_lists]
+
+        with tempfile.TemporaryDirectory() as common_dir, patch.object(conflicts, "git_outputs", side_effect=fake_outputs):
+            first, computed = conflicts.predict([("m", "a1"), ("m", "c2")], common_dir, now=1000)
+            self.assertEqual(computed, 2)
+            self.assertEqual(first[conflicts.pair_key("m", "c2")], ["f.txt"])
+
+            # Same pairs in the other order, plus one moved branch.
+            second, computed = conflicts.predict([("a1", "m"), ("c2", "m"), ("m", "a2")], common_dir, now=2000)
+            self.assertEqual(computed, 1)
+            self.assertEqual(calls[-1], [["merge-tree", "--write-tree", "--name-only", "--no-messages", "m", "a2"]])
+            self.assertEqual(second[conflicts.pair_key("m", "c2")], ["f.txt"])
+
+    def test_failed_merge_not_cached(self):
+        from gwtlib import conflicts
+
+        with tempfile.TemporaryDirectory() as common_dir:
+            with patch.object(conflicts, "git_outputs", return_value=[None]):
+                results, _ = conflicts.predict([("x", "y")], common_dir)
+            self.assertIsNone(results[conflicts.pair_key("x", "y")])
+            with patch.object(conflicts, "git_outputs", return_value=["tree"]) as outputs:
+                _, computed = conflicts.predict([("x", "y")], common_dir)
+            self.assertEqual(computed, 1)
+            outputs.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
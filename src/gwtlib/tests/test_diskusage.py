@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Tests for the parallel disk usage walker."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+class TestSizeWalker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, "wt")
+        self.common = os.path.join(self.tmp.name, "git")
+        os.makedirs(self.common)
+        _write(os.path.join(self.root, "src", "a.py"), 100)
+        _write(os.path.join(self.root, "build", "out.bin"), 1000)
+        _write(os.path.join(self.root, "notes.txt"), 10)
+        _write(os.path.join(self.root, "nested", "inner.txt"), 5000)
+        if hasattr(os, "link"):
+            os.link(os.path.join(self.root, "build", "out.bin"), os.path.join(self.root, "build", "copy.bin"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _walk(self, **kwargs):
+        from gwtlib.diskusage import SizeWalker
+
+        walker = SizeWalker(workers=4, skip=[os.path.join(self.root, "nested")], common_dir=self.common, **kwargs)
+        walker.walk([self.root])
+        return walker
+
+    def test_breakdown_dedupes_hardlinks_and_skips(self):
+        from gwtlib.diskusage import classify
+
+        walker = self._walk()
+        total, tracked, ignored, untracked = classify(walker, self.root, ["build/"], ["notes.txt"])
+        self.assertEqual((total, tracked, ignored, untracked), (1110, 100, 1000, 10))
+
+    def test_ignored_inside_untracked_dir_counted_once(self):
+        from gwtlib.diskusage import classify
+
+        _write(os.path.join(self.root, "new", "a.txt"), 20)
+        _write(os.path.join(self.root, "new", "build", "out.o"), 300)
+        walker = self._walk()
+        result = classify(walker, self.root, ["build/", "new/build/"], ["new/", "notes.txt"])
+        self.assertEqual(result, (1430, 100, 1300, 30))
+
+    def test_unchanged_dirs_come_from_cache(self):
+        first = self._walk()
+        self.assertTrue(first._updates)
+        # Adding a file only changes (and re-scans) its own directory.
+        _write(os.path.join(self.root, "src", "b.py"), 50)
+        second = self._walk()
+        rescanned = {row[0] for row in second._updates}
+        self.assertEqual(rescanned, {os.path.join(self.root, "src")})
+        self.assertEqual(second.subtree(self.root), 1160)
+        self.assertEqual(len(self._walk(refresh=True)._updates), len(first._updates))
+
+
+if __name__ == "__main__":
+    unittest.main()
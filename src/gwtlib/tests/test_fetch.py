@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Tests for the cross-process fetch coordinator and file locks."""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestFileLock(unittest.TestCase):
+    def test_second_exclusive_lock_fails(self):
+        from gwtlib.locks import FileLock
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "x.lock")
+            with FileLock(path):
+                self.assertFalse(FileLock(path).acquire(blocking=False))
+            other = FileLock(path)
+            self.assertTrue(other.acquire(blocking=False))
+            other.release()
+
+    @unittest.skipIf(os.name == "nt", "shared locks are exclusive on Windows")
+    def test_shared_locks_coexist(self):
+        from gwtlib.locks import FileLock
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "x.lock")
+            with FileLock(path, shared=True):
+                second = FileLock(path, shared=True)
+                self.assertTrue(second.acquire(blocking=False))
+                self.assertFalse(FileLock(path).acquire(blocking=False))
+                second.release()
+
+
+class TestCoordinatedFetch(unittest.TestCase):
+    def setUp(self):
+        from gwtlib import fetch
+
+        self.fetch = fetch
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(fetch, "get_git_common_dir", return_value=self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _state(self, at, ok=True):
+        with open(os.path.join(self.tmp.name, self.fetch.STATE_FILE), "w", encoding="utf-8") as f:
+            json.dump({"at": at, "ok": ok}, f)
+
+    def test_fresh_fetch_skipped(self):
+        self._state(time.time() - 10)
+        with mock.patch.object(self.fetch, "run_cmd") as run:
+            self.assertEqual(self.fetch.coordinated_fetch(freshness=60), self.fetch.FRESH)
+        run.assert_not_called()
+
+    def test_stale_or_failed_fetch_runs(self):
+        for at, ok in ((time.time() - 600, True), (time.time() - 10, False)):
+            self._state(at, ok)
+            with mock.patch.object(self.fetch, "run_cmd", return_value=True) as run:
+                self.assertEqual(self.fetch.coordinated_fetch(freshness=60), self.fetch.FETCHED)
+            run.assert_called_once()
+
+    def test_waiter_reuses_concurrent_fetch(self):
+        from gwtlib.locks import FileLock
+
+        holder = FileLock(os.path.join(self.tmp.name, self.fetch.LOCK_FILE))
+        holder.acquire()
+
+        def _finish():
+            time.sleep(0.3)
+            self._state(time.time())
+            holder.release()
+
+        threading.Thread(target=_finish).start()
+        waits = []
+        with mock.patch.object(self.fetch, "run_cmd") as run:
+            outcome = self.fetch.coordinated_fetch(freshness=0, on_wait=lambda: waits.append(1))
+        self.assertEqual(outcome, self.fetch.SHARED)
+        self.assertEqual(waits, [1])
+        run.assert_not_called()
+
+    def test_wait_timeout_does_not_fetch(self):
+        from gwtlib.locks import FileLock
+
+        holder = FileLock(os.path.join(self.tmp.name, self.fetch.LOCK_FILE))
+        holder.acquire()
+        self.addCleanup(holder.release)
+        with mock.patch.object(self.fetch, "WAIT_TIMEOUT", 0.2), mock.patch.object(self.fetch, "run_cmd") as run:
+            self.assertEqual(self.fetch.coordinated_fetch(freshness=0), self.fetch.TIMED_OUT)
+        run.assert_not_called()
+        self.assertTrue(holder.locked)
+
+
+if __name__ == "__main__":
+    unittest.main()
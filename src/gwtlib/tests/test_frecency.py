@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Tests for the frecency index behind `gwt cd <query>`."""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+DAY = 86400
+
+
+class TestFrecency(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        self.db = os.path.join(root, "frecency.db")
+        self.common = os.path.join(root, "repo", ".git")
+        os.makedirs(self.common)
+        with open(os.path.join(self.common, "HEAD"), "w") as f:
+            f.write("ref: refs/heads/main\n")
+        self.paths = {}
+        for name in ("api-v2", "api-v3", "web"):
+            admin = os.path.join(self.common, "worktrees", name)
+            path = os.path.join(root, "wt", name)
+            os.makedirs(admin)
+            os.makedirs(os.path.join(path, "src"))
+            with open(os.path.join(admin, "commondir"), "w") as f:
+                f.write("../..\n")
+            with open(os.path.join(admin, "HEAD"), "w") as f:
+                f.write(f"ref: refs/heads/feature/{name}\n")
+            with open(os.path.join(path, ".git"), "w") as f:
+                f.write(f"gitdir: {admin}\n")
+            with open(os.path.join(admin, "gitdir"), "w") as f:
+                f.write(os.path.join(path, ".git") + "\n")
+            self.paths[name] = path
+        self.main = os.path.dirname(self.common)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_git_dirs_without_git(self):
+        from gwtlib.utils import find_git_dirs
+
+        root, git_dir, common = find_git_dirs(os.path.join(self.paths["web"], "src"))
+        self.assertEqual(root, self.paths["web"])
+        self.assertEqual(common, os.path.normpath(self.common))
+
+    def test_decay_and_ranking(self):
+        from gwtlib import frecency
+
+        now = 100 * DAY
+        for _ in range(3):
+            frecency.record_visit(self.paths["api-v2"], db_path=self.db, now=now - 30 * DAY)
+        frecency.record_visit(self.paths["api-v3"], db_path=self.db, now=now)
+
+        matches = frecency.query(["api"], self.common, db_path=self.db, now=now)
+        self.assertEqual(matches[0][0], self.paths["api-v3"])
+        self.assertEqual(matches[0][1], "feature/api-v3")
+        self.assertEqual(frecency.pick_unambiguous(matches), self.paths["api-v3"])
+
+    def test_exact_branch_wins_and_ties_are_ambiguous(self):
+        from gwtlib import frecency
+
+        frecency.sync_worktrees(self.common, [(p, f"feature/{n}") for n, p in self.paths.items()], db_path=self.db)
+        self.assertIsNone(frecency.pick_unambiguous(frecency.query(["api"], self.common, db_path=self.db)))
+        exact = frecency.query(["feature/web"], self.common, db_path=self.db)
+        self.assertEqual(frecency.pick_unambiguous(exact), self.paths["web"])
+
+    def test_sync_drops_vanished_paths(self):
+        from gwtlib import frecency
+
+        frecency.record_visit(self.paths["web"], db_path=self.db)
+        frecency.sync_worktrees(self.common, [(self.paths["api-v2"], "feature/api-v2")], db_path=self.db)
+        self.assertEqual(frecency.query(["web"], self.common, db_path=self.db), [])
+
+    def _sync_all(self):
+        from gwtlib import frecency
+
+        worktrees = [(self.main, "main")] + [(p, f"feature/{n}") for n, p in self.paths.items()]
+        frecency.sync_worktrees(self.common, worktrees, db_path=self.db)
+
+    def test_shared_parent_dirs_do_not_match(self):
+        from gwtlib import frecency
+
+        self._sync_all()
+        # The temp dir holds every worktree; its name must not match them all.
+        outer = os.path.basename(self.tmp.name)
+        self.assertEqual(frecency.query([outer], self.common, db_path=self.db), [])
+        repo = frecency.query(["repo"], self.common, db_path=self.db)
+        self.assertEqual(frecency.pick_unambiguous(repo), self.main)
+
+    def test_needs_sync_follows_worktrees_on_disk(self):
+        from gwtlib import frecency
+
+        self.assertTrue(frecency.needs_sync(self.common, db_path=self.db))
+        self._sync_all()
+        self.assertFalse(frecency.needs_sync(self.common, db_path=self.db))
+        shutil.rmtree(os.path.join(self.common, "worktrees", "web"))
+        self.assertTrue(frecency.needs_sync(self.common, db_path=self.db))
+
+
+if __name__ == "__main__":
+    unittest.main()
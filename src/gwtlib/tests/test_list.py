@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Tests for `gwt list --long` parsing."""
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestParseRefDetails(unittest.TestCase):
+    def test_with_ahead_behind(self):
+        from gwtlib.commands.worktree import parse_ref_details
+
+        out = "\n".join([
+            "feat\0origin/feat\0ahead 2, behind 1\0001700000000\0Add feature: x\0003 5",
+            "old\0origin/old\0gone\0001600000000\0Old work\0000 0",
+        ])
+        details = parse_ref_details(out, True)
+        self.assertEqual(details["feat"]["track"], "ahead 2, behind 1")
+        self.assertEqual((details["feat"]["ahead"], details["feat"]["behind"]), (3, 5))
+        self.assertEqual(details["feat"]["subject"], "Add feature: x")
+        self.assertEqual(details["old"]["date"], 1600000000)
+
+    def test_without_ahead_behind(self):
+        from gwtlib.commands.worktree import parse_ref_details
+
+        details = parse_ref_details("local\0\0\0001700000000\0WIP", False)
+        self.assertEqual(details["local"]["upstream"], "")
+        self.assertNotIn("ahead", details["local"])
+        self.assertEqual(parse_ref_details(None, False), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Tests for `gwt maintenance`: scheduling, the shared lock and the tasks."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+IDENTITY = {
+    "GIT_AUTHOR_NAME": "t",
+    "GIT_AUTHOR_EMAIL": "t@t",
+    "GIT_COMMITTER_NAME": "t",
+    "GIT_COMMITTER_EMAIL": "t@t",
+}
+
+
+class TestSchedule(unittest.TestCase):
+    def test_due_after_interval(self):
+        from gwtlib import maintenance
+
+        config = {"maintenance": {"interval": 24}}
+        with tempfile.TemporaryDirectory() as common_dir:
+            self.assertTrue(maintenance.is_due(common_dir, config, now=1000))
+            maintenance.write_state(common_dir, {"at": 1000})
+            self.assertFalse(maintenance.is_due(common_dir, config, now=1000 + 3600))
+            self.assertTrue(maintenance.is_due(common_dir, config, now=1000 + 24 * 3600))
+            self.assertFalse(maintenance.is_due(common_dir, {}, now=10 ** 10))
+
+
+class TestWorktreeLock(unittest.TestCase):
+    def test_waits_for_running_maintenance(self):
+        from gwtlib import maintenance
+
+        with tempfile.TemporaryDirectory() as common_dir:
+            waited = []
+            with patch.object(maintenance, "get_git_common_dir", return_value=common_dir), patch.object(
+                maintenance, "WAIT_TIMEOUT", 0.2
+            ):
+                with maintenance.worktree_lock(on_wait=lambda: waited.append(1)):
+                    with maintenance.worktree_lock(on_wait=lambda: waited.append(2)):
+                        pass
+                self.assertEqual(waited, [])
+
+                lock = maintenance.maintenance_lock(common_dir)
+                self.assertTrue(lock.acquire(blocking=False))
+                try:
+                    with maintenance.worktree_lock(on_wait=lambda: waited.append(3)):
+                        pass
+                finally:
+                    lock.release()
+            self.assertEqual(waited, [3])
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestRunTasks(unittest.TestCase):
+    def test_writes_commit_graph_and_midx(self):
+        from gwtlib import maintenance
+
+        with tempfile.TemporaryDirectory() as repo, patch.dict(os.environ, IDENTITY):
+            def git(*args):
+                subprocess.run(["git", "-C", repo, *args], check=True, stdout=subprocess.DEVNULL)
+
+            git("init", "-q", "-b", "main")
+            for i in range(3):
+                Path(repo, "f.txt").write_text(str(i))
+                git("add", ".")
+                git("commit", "-q", "-m", str(i))
+            git("branch", "topic", "HEAD~1")
+
+            results = maintenance.run_tasks(cwd=repo)
+            self.assertTrue(all(ok for _, ok, _ in results), results)
+            stats = maintenance.object_stats(os.path.join(repo, ".git"))
+            self.assertTrue(stats["commit_graph"])
+            self.assertTrue(stats["multi_pack_index"])
+
+            queries = maintenance.bench_queries(cwd=repo)
+            self.assertIn(["git", "-C", repo, "rev-list", "--left-right", "--count", "main...topic"], queries)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Tests for checkout-free merges (`gwt merge --in-memory`)."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+IDENTITY = {
+    "GIT_AUTHOR_NAME": "t",
+    "GIT_AUTHOR_EMAIL": "t@t",
+    "GIT_COMMITTER_NAME": "t",
+    "GIT_COMMITTER_EMAIL": "t@t",
+}
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestMergeInMemory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = self.tmp.name
+        env = patch.dict(os.environ, IDENTITY)
+        env.start()
+        self.addCleanup(env.stop)
+        self._git("init", "-q", "-b", "main")
+        self._write("a.txt", "base\n")
+        self._git("add", ".")
+        self._git("commit", "-q", "-m", "base")
+        self._git("branch", "target")
+        self._git("branch", "feature")
+        self._git("switch", "-q", "feature")
+        self._write("b.txt", "feature\n")
+        self._git("add", ".")
+        self._git("commit", "-q", "-m", "feature")
+        self._git("switch", "-q", "target")
+        self._write("c.txt", "target\n")
+        self._git("add", ".")
+        self._git("commit", "-q", "-m", "target")
+        self._git("switch", "-q", "main")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _git(self, *args):
+        return subprocess.run(
+            ["git", *args], cwd=self.repo, check=True, stdout=subprocess.PIPE, text=True
+        ).stdout.strip()
+
+    def _write(self, name, text):
+        with open(os.path.join(self.repo, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _merge(self, source, target):
+        from gwtlib.commands.merge import _merge_in_memory
+
+        cwd = os.getcwd()
+        os.chdir(self.repo)
+        try:
+            _merge_in_memory(source, target, {})
+        finally:
+            os.chdir(cwd)
+
+    def test_clean_merge_moves_ref_without_checkout(self):
+        old_target = self._git("rev-parse", "target")
+        self._merge("feature", "target")
+
+        parents = self._git("rev-list", "--parents", "-n1", "target").split()[1:]
+        self.assertEqual(parents, [old_target, self._git("rev-parse", "feature")])
+        self.assertEqual(self._git("ls-tree", "--name-only", "target").split(), ["a.txt", "b.txt", "c.txt"])
+        # The worktree we stand in (main) is untouched.
+        self.assertEqual(self._git("branch", "--show-current"), "main")
+        self.assertFalse(os.path.exists(os.path.join(self.repo, "b.txt")))
+        self.assertEqual(self._git("status", "--porcelain"), "")
+
+    def test_conflicts_reported_by_merge_tree(self):
+        from gwtlib.commands.merge import merge_tree
+
+        self._git("switch", "-q", "feature")
+        self._write("a.txt", "feature\n")
+        self._git("commit", "-q", "-am", "edit a")
+        self._git("switch", "-q", "target")
+        self._write("a.txt", "target\n")
+        self._git("commit", "-q", "-am", "edit a")
+
+        cwd = os.getcwd()
+        os.chdir(self.repo)
+        try:
+            tree, conflicts = merge_tree(self._git("rev-parse", "target"), self._git("rev-parse", "feature"))
+        finally:
+            os.chdir(cwd)
+        self.assertTrue(tree)
+        self.assertEqual(conflicts, ["a.txt"])
+
+    def test_temp_worktree_replaces_stale_one(self):
+        from gwtlib.commands import merge
+
+        temp = os.path.join(os.path.realpath(self.repo), ".worktree", ".gwt-merge-target")
+        # A crashed run: still registered, holding the target branch.
+        self._git("worktree", "add", "-q", temp, "target")
+        seen = []
+        cwd = os.getcwd()
+        os.chdir(self.repo)
+        try:
+            with patch.object(merge, "_merge_here", lambda *a: seen.append(os.getcwd())):
+                merge._merge_in_worktree("feature", "target", None, {})
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual(seen, [temp])
+        self.assertFalse(os.path.exists(temp))
+        self.assertNotIn(".gwt-merge-target", self._git("worktree", "list"))
+        self.assertFalse(os.path.exists(os.path.join(self.repo, ".gitignore")))
+
+
+if __name__ == "__main__":
+    unittest.main()
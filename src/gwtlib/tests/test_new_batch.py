@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Tests for batch `gwt new`."""
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestReadBranchList(unittest.TestCase):
+    def test_comments_and_blank_lines(self):
+        from gwtlib.commands.worktree import _read_branch_list
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "branches.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("# release\nfeat/a\n\n  feat/b  # triage\n#feat/c\n")
+            self.assertEqual(_read_branch_list(path), ["feat/a", "feat/b"])
+
+
+class TestSplitLegacyBase(unittest.TestCase):
+    def _split(self, names, base=None, existing=()):
+        from gwtlib.commands import worktree
+
+        def fake_git_output(args):
+            return "abc123" if args[-1].split("^")[0] in existing else None
+
+        with mock.patch.object(worktree, "git_output", side_effect=fake_git_output):
+            return worktree._split_legacy_base(names, base)
+
+    def test_second_name_is_existing_ref(self):
+        self.assertEqual(self._split(["x", "main"], existing={"main"}), (["x"], "main", True))
+
+    def test_two_new_branches_are_a_batch(self):
+        self.assertEqual(self._split(["a", "b"]), (["a", "b"], None, False))
+
+    def test_explicit_base_is_a_batch(self):
+        self.assertEqual(self._split(["a", "main"], "dev", existing={"main"}), (["a", "main"], "dev", False))
+
+
+class TestCreateBatchWorktree(unittest.TestCase):
+    def test_worktree_add_is_serialised(self):
+        from gwtlib.commands import worktree
+
+        lock = threading.Lock()
+        state = {"adding": 0, "overlap": False, "checkouts": 0, "peak": 0}
+
+        def fake_run_cmd(cmd, capture_output=False):
+            if cmd[:3] == ["git", "worktree", "add"]:
+                with lock:
+                    state["adding"] += 1
+                    state["overlap"] |= state["adding"] > 1
+                time.sleep(0.02)
+                with lock:
+                    state["adding"] -= 1
+            else:
+                with lock:
+                    state["checkouts"] += 1
+                    state["peak"] = max(state["peak"], state["checkouts"])
+                time.sleep(0.05)
+                with lock:
+                    state["checkouts"] -= 1
+            return ""
+
+        plans = [
+            {"branch": f"b{i}", "path": f"/nonexistent/b{i}", "cmd": ["git", "worktree", "add", f"/nonexistent/b{i}"]}
+            for i in range(4)
+        ]
+        with mock.patch.object(worktree, "run_cmd", side_effect=fake_run_cmd):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda p: worktree._create_batch_worktree(p, {}, None, False), plans))
+
+        self.assertTrue(all(failed is None for failed, _ in results))
+        self.assertFalse(state["overlap"])
+        self.assertGreater(state["peak"], 1)
+
+    def test_failed_checkout_removes_worktree(self):
+        from gwtlib.commands import worktree
+
+        calls = []
+
+        def fake_run_cmd(cmd, capture_output=False):
+            calls.append(cmd)
+            return None if "read-tree" in cmd else ""
+
+        plan = {"branch": "b", "path": "/nonexistent/b", "cmd": ["git", "worktree", "add", "/nonexistent/b"]}
+        with mock.patch.object(worktree, "run_cmd", side_effect=fake_run_cmd):
+            failed, _ = worktree._create_batch_worktree(plan, {}, None, False)
+
+        self.assertEqual(failed, "checkout")
+        self.assertEqual(calls[-1], ["git", "worktree", "remove", "--force", "/nonexistent/b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Tests for the per-worktree git performance profile."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestProfileSettings(unittest.TestCase):
+    def test_sized_to_cpus(self):
+        from gwtlib import perf
+
+        settings = dict(perf.profile_settings(cpus=12, fsmonitor=False))
+        self.assertEqual(settings["index.threads"], "12")
+        self.assertEqual(settings["checkout.workers"], "12")
+        self.assertNotIn("core.fsmonitor", settings)
+        self.assertEqual(dict(perf.profile_settings(cpus=2, fsmonitor=True))["core.fsmonitor"], "true")
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestApplyProfile(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.repo = self.tmp.name
+        self._git("init", "-q")
+
+    def _git(self, *args):
+        return subprocess.run(
+            ["git", *args], cwd=self.repo, check=True, stdout=subprocess.PIPE, text=True
+        ).stdout.strip()
+
+    def test_written_per_worktree_and_verified(self):
+        from gwtlib import perf
+
+        settings = perf.profile_settings(cpus=3, fsmonitor=False)
+        scope, mismatched = perf.apply_profile(self.repo, settings)
+        self.assertEqual((scope, mismatched), ("worktree", []))
+        self.assertEqual(self._git("config", "--worktree", "checkout.workers"), "3")
+        self.assertEqual(self._git("config", "--local", "--get", "extensions.worktreeConfig"), "true")
+        self.assertIsNotNone(perf.time_status(self.repo, runs=1, warmup=True))
+
+    def test_core_worktree_falls_back_to_local(self):
+        from gwtlib import perf
+
+        self._git("config", "core.worktree", self.repo)
+        self.assertEqual(perf.resolve_scope(self.repo), "local")
+        self.assertEqual(self._git("config", "--bool", "--default", "false", "extensions.worktreeConfig"), "false")
+
+    def test_overridden_setting_reported(self):
+        from gwtlib import perf
+
+        override = {"GIT_CONFIG_COUNT": "1", "GIT_CONFIG_KEY_0": "index.threads", "GIT_CONFIG_VALUE_0": "7"}
+        with patch.dict(os.environ, override):
+            _, mismatched = perf.apply_profile(self.repo, [("index.threads", "3")], scope="local")
+        self.assertEqual(mismatched, ["index.threads"])
+
+
+if __name__ == "__main__":
+    unittest.main()
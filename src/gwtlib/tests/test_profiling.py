@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Tests for `gwt --cprofile` reporting."""
+import cProfile
+import contextlib
+import io
+import os
+import pstats
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def _leaf():
+    end = time.perf_counter() + 0.01
+    while time.perf_counter() < end:
+        pass
+
+
+def _middle():
+    _leaf()
+
+
+def _top():
+    _middle()
+    _leaf()
+
+
+def _ping(n):
+    if n:
+        _pong(n)
+    else:
+        _leaf()
+
+
+def _pong(n):
+    _ping(n - 1)
+
+
+def _profile():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _top()
+    profiler.disable()
+    return profiler
+
+
+def _frame(name):
+    return f"test_profiling.py:{globals()[name].__code__.co_firstlineno}({name})"
+
+
+class TestCollapsedStacks(unittest.TestCase):
+    def test_time_split_across_callers(self):
+        from gwtlib.profiling import collapsed_stacks
+
+        stacks = collapsed_stacks(pstats.Stats(_profile()))
+        leaf_via_middle = [us for s, us in stacks.items() if s.endswith("(_top);" + _frame("_middle") + ";" + _frame("_leaf"))]
+        leaf_direct = [us for s, us in stacks.items() if s.endswith("(_top);" + _frame("_leaf"))]
+        self.assertEqual(len(leaf_via_middle), 1)
+        self.assertEqual(len(leaf_direct), 1)
+        # Each path gets about half of _leaf's time.
+        self.assertGreater(leaf_via_middle[0], 5000)
+        self.assertGreater(leaf_direct[0], 5000)
+
+    def test_total_matches_profile(self):
+        from gwtlib.profiling import collapsed_stacks
+
+        # Mutual recursion entered from outside the profile (like nested
+        # imports): every function has a caller, yet the time must show up.
+        profiler = cProfile.Profile()
+        profiler.enable()
+        _ping(4)
+        _ping(2)
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        total_us = sum(collapsed_stacks(stats).values())
+        self.assertAlmostEqual(total_us / 1e6, stats.total_tt, delta=stats.total_tt * 0.05)
+
+
+class TestReport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_pstats_and_folded(self):
+        from gwtlib.profiling import report
+
+        for name in ("run.pstats", "run.folded"):
+            path = os.path.join(self.tmp.name, name)
+            stream = io.StringIO()
+            self.assertEqual(report(_profile(), path, stream=stream), path)
+            self.assertIn("cumulative", stream.getvalue())
+            self.assertIn(path, stream.getvalue())
+
+        stats = pstats.Stats(os.path.join(self.tmp.name, "run.pstats"))
+        self.assertTrue(any(func[2] == "_top" for func in stats.stats))
+        lines = Path(self.tmp.name, "run.folded").read_text(encoding="utf-8").splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, us = line.rsplit(" ", 1)
+            self.assertTrue(stack and int(us) > 0)
+
+    def test_unwritable_path(self):
+        from gwtlib.profiling import report
+
+        path = os.path.join(self.tmp.name, "missing", "run.pstats")
+        self.assertIsNone(report(_profile(), path, stream=io.StringIO()))
+
+
+
+class TestEntryPoint(unittest.TestCase):
+    def test_main_reports(self):
+        # The console script imports gwt, then calls main().
+        import gwt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "run.folded")
+            err = io.StringIO()
+            with patch.object(sys, "argv", ["gwt", f"--cprofile={path}", "--lang", "en"]), \
+                    contextlib.redirect_stdout(io.StringIO()), patch.object(sys, "stderr", err):
+                gwt.main()
+            self.assertTrue(os.path.getsize(path) > 0)
+            self.assertIn(path, err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
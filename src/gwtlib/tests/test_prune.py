@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests for bulk prune classification."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+DAY = 86400
+
+
+def _wt(branch, path=None):
+    return {"path": path or f"/wt/{branch}", "branch": branch, "locked": False}
+
+
+class TestClassifyWorktrees(unittest.TestCase):
+    def setUp(self):
+        self.now = 1_000 * DAY
+        self.refs = {
+            "done": ("refs/remotes/origin/done", "", self.now - DAY),
+            "deleted": ("refs/remotes/origin/deleted", "[gone]", self.now - DAY),
+            "old": ("", "", self.now - 90 * DAY),
+            "active": ("refs/remotes/origin/active", "[ahead 2]", self.now),
+        }
+        self.worktrees = [_wt(b) for b in ("done", "deleted", "old", "active", "main")] + [_wt(None, "/wt/detached")]
+
+    def _classify(self, **kwargs):
+        from gwtlib.commands.worktree import classify_worktrees
+
+        result = classify_worktrees(self.worktrees, self.refs, {"done", "main"}, "main", self.now, **kwargs)
+        return {wt["branch"]: reasons for wt, reasons in result}
+
+    def test_merged_only(self):
+        self.assertEqual(self._classify(merged_flag=True, gone_flag=False), {"done": ["merged"]})
+
+    def test_unchanged_branch_not_merged(self):
+        from gwtlib.commands.worktree import classify_worktrees
+
+        result = classify_worktrees(self.worktrees, self.refs, {"done", "main"}, "main", self.now, gone_flag=False,
+                                    unchanged={"done"})
+        self.assertEqual(result, [])
+
+    def test_gone_and_stale(self):
+        result = self._classify(merged_flag=False, gone_flag=True, stale_days=30)
+        self.assertEqual(result, {"deleted": ["gone"], "old": ["stale"]})
+
+    def test_main_and_detached_never_selected(self):
+        result = self._classify(merged_flag=True, gone_flag=True, stale_days=0)
+        self.assertNotIn("main", result)
+        self.assertNotIn(None, result)
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestUnchangedBranches(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cwd = os.getcwd()
+        self.addCleanup(os.chdir, self.cwd)
+        os.chdir(self.tmp.name)
+        self._git("init", "-q", "-b", "main")
+        self._git("config", "user.email", "t@example.com")
+        self._git("config", "user.name", "t")
+        self._git("commit", "-q", "--allow-empty", "-m", "one")
+
+    def _git(self, *args):
+        subprocess.run(["git"] + list(args), check=True, stdout=subprocess.DEVNULL)
+
+    def _rev(self, rev):
+        return subprocess.run(["git", "rev-parse", rev], check=True, stdout=subprocess.PIPE, text=True).stdout.strip()
+
+    def test_fresh_branches_are_unchanged(self):
+        from gwtlib.commands.worktree import _unchanged_branches
+
+        one = self._rev("HEAD")
+        self._git("branch", "fresh")
+        self._git("checkout", "-q", "-b", "done")
+        self._git("commit", "-q", "--allow-empty", "-m", "work")
+        self._git("checkout", "-q", "main")
+        self._git("merge", "-q", "--ff-only", "done")
+        self._git("commit", "-q", "--allow-empty", "-m", "two")
+        # Behind main, never moved: still not "merged".
+        self._git("branch", "behind", "HEAD~1")
+        forks = {"fresh": one, "done": one, "behind": self._rev("HEAD~1")}
+        self.assertEqual(_unchanged_branches(["behind", "done", "fresh"], "main", forks), {"behind", "fresh"})
+
+    def test_checked_out_pr_branch_is_merged(self):
+        from gwtlib.commands.worktree import _unchanged_branches
+
+        # Fetched with its commits and checked out in one go: a single reflog entry.
+        self._git("checkout", "-q", "-b", "pr")
+        self._git("commit", "-q", "--allow-empty", "-m", "pr")
+        self._git("checkout", "-q", "main")
+        self._git("branch", "-q", "-f", "local-pr", "pr")
+        fork = self._rev("main")
+        self._git("merge", "-q", "--ff-only", "pr")
+        self._git("commit", "-q", "--allow-empty", "-m", "two")
+        # Created outside gwt (no recorded fork point) and behind main: merged too.
+        self.assertEqual(_unchanged_branches(["local-pr", "pr"], "main", {"local-pr": fork}), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
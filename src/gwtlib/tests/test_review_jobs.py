@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Tests for the `gwt review --async` job queue."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestReviewJobs(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.jobs_dir = os.path.join(self.tmp.name, "jobs")
+
+    def _diff(self, text="diff\n"):
+        path = os.path.join(self.tmp.name, f"ctx-{len(os.listdir(self.tmp.name))}.diff")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_same_diff_is_deduplicated(self):
+        from gwtlib import review_jobs
+
+        fields = {"tool": "codex", "model": "m"}
+        job, created = review_jobs.enqueue(self.jobs_dir, self._diff(), "h1", fields, now=1)
+        self.assertTrue(created)
+        self.assertTrue(os.path.exists(review_jobs.diff_path(self.jobs_dir, job["id"])))
+
+        again, created = review_jobs.enqueue(self.jobs_dir, self._diff(), "h1", fields, now=2)
+        self.assertFalse(created)
+        self.assertEqual(again["id"], job["id"])
+
+        other, created = review_jobs.enqueue(self.jobs_dir, self._diff(), "h1", dict(fields, model="m2"), now=3)
+        self.assertTrue(created)
+        self.assertNotEqual(other["id"], job["id"])
+        self.assertEqual([j["id"] for j in review_jobs.list_jobs(self.jobs_dir)], [other["id"], job["id"]])
+
+    def test_worker_runs_queue_and_failed_jobs_requeue(self):
+        from gwtlib import review_jobs
+
+        ok, _ = review_jobs.enqueue(self.jobs_dir, self._diff(), "ok", {"tool": "t", "model": "m"}, now=1)
+        bad, _ = review_jobs.enqueue(self.jobs_dir, self._diff(), "bad", {"tool": "t", "model": "m"}, now=2)
+
+        def build_cmd(job):
+            code = "print('reviewed')" if job["diff_hash"] == "ok" else "raise SystemExit(3)"
+            return [sys.executable, "-c", code]
+
+        done = []
+        ran = review_jobs.run_worker(self.jobs_dir, 2, build_cmd, on_done=done.append)
+        self.assertEqual(ran, 2)
+        self.assertEqual([j["id"] for j in done], [ok["id"]])
+        with open(review_jobs.output_path(self.jobs_dir, ok["id"]), encoding="utf-8") as f:
+            self.assertEqual(f.read().strip(), "reviewed")
+        failed = review_jobs.load_job(self.jobs_dir, bad["id"])
+        self.assertEqual((failed["status"], failed["returncode"]), (review_jobs.FAILED, 3))
+
+        _, created = review_jobs.enqueue(self.jobs_dir, self._diff(), "bad", {"tool": "t", "model": "m"})
+        self.assertTrue(created)
+        self.assertEqual(review_jobs.load_job(self.jobs_dir, bad["id"])["status"], review_jobs.QUEUED)
+
+    def test_running_job_without_worker_counts_as_failed(self):
+        from gwtlib import review_jobs
+
+        job, _ = review_jobs.enqueue(self.jobs_dir, self._diff(), "h", {"tool": "t", "model": "m"})
+        job["status"] = review_jobs.RUNNING
+        review_jobs.save_job(self.jobs_dir, job)
+        self.assertEqual(review_jobs.effective_status(self.jobs_dir, job), review_jobs.FAILED)
+        self.assertEqual(review_jobs.find_job(self.jobs_dir, job["id"][:4])["id"], job["id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Tests for initialising submodules from the main worktree's object store."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+# Nothing listens here: a clone that goes to the network fails.
+UNREACHABLE = "git://127.0.0.1:9/sub.git"
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestSharedSubmoduleClone(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        base = os.path.realpath(self.tmp.name)
+        # Git's own defaults: protocol.file.allow=user, no global overrides.
+        env = patch.dict(os.environ, {
+            "GIT_CONFIG_GLOBAL": os.devnull,
+            "GIT_CONFIG_NOSYSTEM": "1",
+            "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t",
+            "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t",
+        })
+        env.start()
+        self.addCleanup(env.stop)
+
+        sub = os.path.join(base, "sub")
+        self._git("init", "-q", "-b", "main", sub)
+        Path(sub, "s.txt").write_text("s\n")
+        self._git("-C", sub, "add", ".")
+        self._git("-C", sub, "commit", "-q", "-m", "sub")
+
+        self.main = os.path.join(base, "main")
+        self._git("init", "-q", "-b", "main", self.main)
+        self._git("-C", self.main, "-c", "protocol.file.allow=always", "submodule", "add", "-q", sub, "sub")
+        # The recorded remote is unreachable: only the local copy can serve the clone.
+        self._git("-C", self.main, "config", "-f", ".gitmodules", "submodule.sub.url", UNREACHABLE)
+        self._git("-C", self.main, "config", "submodule.sub.url", UNREACHABLE)
+        self._git("-C", self.main, "add", ".gitmodules")
+        self._git("-C", self.main, "commit", "-q", "-m", "add sub")
+
+        self.wt = os.path.join(base, "wt")
+        self._git("-C", self.main, "worktree", "add", "-q", "-b", "feat", self.wt)
+
+    def _git(self, *args):
+        subprocess.run(["git"] + list(args), check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def test_submodule_cloned_from_main_object_store(self):
+        from gwtlib.commands.worktree import _update_submodules
+
+        ok = _update_submodules(self.wt, {"submoduleUpdate": {"jobs": 1, "shareObjects": True}}, quiet=True)
+        self.assertTrue(ok)
+        self.assertTrue(os.path.exists(os.path.join(self.wt, "sub", "s.txt")))
+        url = subprocess.run(
+            ["git", "-C", os.path.join(self.wt, "sub"), "remote", "get-url", "origin"],
+            stdout=subprocess.PIPE, text=True,
+        ).stdout.strip()
+        self.assertEqual(url, UNREACHABLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Tests for `gwt sync` planning."""
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+def _wt(branch, path=None):
+    return {"path": path or f"/wt/{branch}", "branch": branch}
+
+
+class TestPlanSync(unittest.TestCase):
+    def setUp(self):
+        self.worktrees = [_wt(b) for b in ("behind", "ahead", "even", "both", "dirty", "local", "gone")]
+        self.worktrees.append(_wt(None, "/wt/detached"))
+        self.upstreams = {
+            b: (f"refs/remotes/origin/{b}", f"origin/{b}", b == "gone")
+            for b in ("behind", "ahead", "even", "both", "dirty", "gone")
+        }
+        self.dirty = {wt["path"]: wt["branch"] == "dirty" for wt in self.worktrees}
+        self.counts = {"/wt/behind": (0, 3), "/wt/ahead": (2, 0), "/wt/even": (0, 0), "/wt/both": (1, 4)}
+
+    def _plan(self, policy):
+        from gwtlib.commands.sync import plan_sync
+
+        rows = plan_sync(self.worktrees, self.upstreams, self.dirty, self.counts, policy)
+        return {row["wt"]["path"]: row["action"] for row in rows}
+
+    def test_ff_only(self):
+        self.assertEqual(
+            self._plan("ff-only"),
+            {
+                "/wt/behind": "ff",
+                "/wt/ahead": "ahead",
+                "/wt/even": "uptodate",
+                "/wt/both": "diverged",
+                "/wt/dirty": "dirty",
+                "/wt/local": "no_upstream",
+                "/wt/gone": "gone",
+                "/wt/detached": "detached",
+            },
+        )
+
+    def test_rebase_policy_only_changes_diverged(self):
+        plan = self._plan("rebase")
+        self.assertEqual(plan["/wt/both"], "rebase")
+        self.assertEqual(plan["/wt/behind"], "ff")
+
+    def test_missing_counts_fail(self):
+        del self.counts["/wt/behind"]
+        self.assertEqual(self._plan("ff-only")["/wt/behind"], "failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
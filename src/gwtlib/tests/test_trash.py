@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tests for fast worktree removal helpers."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestTrashWorktree(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        self.common_dir = os.path.join(root, "repo", ".git")
+        self.admin_dir = os.path.join(self.common_dir, "worktrees", "feat")
+        self.worktree = os.path.join(root, "wt", "feat")
+        os.makedirs(self.admin_dir)
+        os.makedirs(os.path.join(self.worktree, "build", "a", "b"))
+        with open(os.path.join(self.worktree, ".git"), "w") as f:
+            f.write(f"gitdir: {self.admin_dir}\n")
+        for i in range(20):
+            with open(os.path.join(self.worktree, "build", "a", "b", f"f{i}"), "w") as f:
+                f.write("x")
+        if os.name != "nt":
+            outside = os.path.join(root, "keep.txt")
+            with open(outside, "w") as f:
+                f.write("keep")
+            os.symlink(outside, os.path.join(self.worktree, "link"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_trash_then_empty(self):
+        from gwtlib.trash import empty_trash, trash_entries, trash_worktree
+
+        trashed = trash_worktree(self.worktree, self.common_dir)
+        self.assertIsNotNone(trashed)
+        self.assertFalse(os.path.exists(self.worktree))
+        self.assertFalse(os.path.exists(self.admin_dir))
+        self.assertEqual(len(trash_entries(self.common_dir)), 2)
+
+        self.assertEqual(empty_trash(self.common_dir), 0)
+        self.assertEqual(trash_entries(self.common_dir), [])
+        # Symlinks are removed, never followed.
+        if os.name != "nt":
+            self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "keep.txt")))
+
+    def test_locked_worktree_is_not_trashed(self):
+        from gwtlib.trash import trash_worktree
+
+        with open(os.path.join(self.admin_dir, "locked"), "w") as f:
+            f.write("busy")
+        self.assertIsNone(trash_worktree(self.worktree, self.common_dir))
+        self.assertTrue(os.path.isdir(self.worktree))
+
+
+if __name__ == "__main__":
+    unittest.main()
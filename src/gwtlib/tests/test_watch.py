@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Tests for the file system watcher behind `gwt status --watch`."""
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestParseEvents(unittest.TestCase):
+    def test_padded_names(self):
+        from gwtlib.watch import IN_CREATE, IN_ISDIR, parse_events
+
+        buf = struct.pack("iIII", 1, IN_CREATE, 0, 8) + b"a.txt\0\0\0"
+        buf += struct.pack("iIII", 2, IN_CREATE | IN_ISDIR, 0, 0)
+        self.assertEqual(parse_events(buf), [(1, IN_CREATE, "a.txt"), (2, IN_CREATE | IN_ISDIR, "")])
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestRepoWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.realpath(self.tmp.name)
+        self.sub = os.path.join(self.root, "sub")
+        for repo in (self.root, self.sub):
+            os.makedirs(repo, exist_ok=True)
+            subprocess.run(["git", "init", "-q", repo], check=True)
+        os.makedirs(os.path.join(self.root, "src"))
+        Path(self.root, ".gitignore").write_text("build/\n")
+        os.makedirs(os.path.join(self.root, "build"))
+        Path(self.root, "build", "keep").write_text("")
+
+    def _watcher(self, **kwargs):
+        from gwtlib.watch import RepoWatcher
+
+        repos = {repo: os.path.join(repo, ".git") for repo in (self.root, self.sub)}
+        watcher = RepoWatcher(repos, **kwargs)
+        self.addCleanup(watcher.close)
+        return watcher
+
+    def test_events_attributed_to_innermost_repo(self):
+        watcher = self._watcher()
+        if watcher.backend != "inotify":
+            self.skipTest("inotify not available")
+
+        Path(self.sub, "x.txt").write_text("x")
+        self.assertEqual(watcher.wait(timeout=2), {self.sub})
+        Path(self.root, "src", "y.txt").write_text("y")
+        self.assertEqual(watcher.wait(timeout=2), {self.root})
+        # Ignored directories are not watched.
+        Path(self.root, "build", "out.o").write_text("o")
+        self.assertEqual(watcher.wait(timeout=0.3), set())
+        # Directories created later are picked up.
+        os.makedirs(os.path.join(self.root, "src", "new"))
+        self.assertEqual(watcher.wait(timeout=2), {self.root})
+        Path(self.root, "src", "new", "z.txt").write_text("z")
+        self.assertEqual(watcher.wait(timeout=2), {self.root})
+
+    def test_new_ignored_dirs_not_watched(self):
+        watcher = self._watcher()
+        if watcher.backend != "inotify":
+            self.skipTest("inotify not available")
+
+        watches = len(watcher._inotify.paths)
+        # `build/` is ignored anywhere: creating it is not a change, nor is what lands in it.
+        os.makedirs(os.path.join(self.root, "src", "build", "deep"))
+        Path(self.root, "src", "build", "deep", "out.o").write_text("o")
+        self.assertEqual(watcher.wait(timeout=0.5), set())
+        self.assertEqual(len(watcher._inotify.paths), watches)
+        Path(self.root, "src", "a.py").write_text("a")
+        self.assertEqual(watcher.wait(timeout=2), {self.root})
+
+    def test_watch_limit_switches_to_polling(self):
+        import errno
+
+        watcher = self._watcher(poll_interval=0.05)
+        if watcher.backend != "inotify":
+            self.skipTest("inotify not available")
+
+        def no_space(path, mask):
+            raise OSError(errno.ENOSPC, "no space", path)
+
+        watcher._inotify.add = no_space
+        os.makedirs(os.path.join(self.root, "src", "pkg"))
+        self.assertEqual(watcher.wait(timeout=2), {self.root, self.sub})
+        self.assertEqual(watcher.backend, "polling")
+        Path(self.sub, "x.txt").write_text("x")
+        self.assertEqual(watcher.wait(timeout=2), {self.sub})
+
+    def test_shared_git_dir_stays_with_first_repo(self):
+        from gwtlib.watch import RepoWatcher
+
+        # An uninitialized submodule resolves to the superproject's git dir.
+        empty = os.path.join(self.root, "uninit")
+        os.makedirs(empty)
+        git_dir = os.path.join(self.root, ".git")
+        watcher = RepoWatcher({self.root: git_dir, empty: git_dir})
+        self.addCleanup(watcher.close)
+        if watcher.backend != "inotify":
+            self.skipTest("inotify not available")
+
+        Path(self.root, "a.txt").write_text("a")
+        watcher.wait(timeout=2)
+        subprocess.run(["git", "-C", self.root, "add", "a.txt"], check=True)
+        self.assertEqual(watcher.wait(timeout=2), {self.root})
+
+    def test_polling_fallback(self):
+        watcher = self._watcher(use_inotify=False, poll_interval=0.05)
+        self.assertEqual(watcher.backend, "polling")
+        self.assertEqual(watcher.wait(timeout=0.2), set())
+        Path(self.sub, "x.txt").write_text("x")
+        self.assertEqual(watcher.wait(timeout=2), {self.sub})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Tests for review watermarks (`gwt review --since-last`)."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+IDENTITY = {
+    "GIT_AUTHOR_NAME": "t",
+    "GIT_AUTHOR_EMAIL": "t@t",
+    "GIT_COMMITTER_NAME": "t",
+    "GIT_COMMITTER_EMAIL": "t@t",
+}
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestWatermarks(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = self.tmp.name
+        env = patch.dict(os.environ, IDENTITY)
+        env.start()
+        self.addCleanup(env.stop)
+        cwd = os.getcwd()
+        os.chdir(self.repo)
+        self.addCleanup(os.chdir, cwd)
+        self._git("init", "-q", "-b", "main")
+        self._write("a.txt", "one\n")
+        self._git("add", ".")
+        self._git("commit", "-q", "-m", "base")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _git(self, *args):
+        return subprocess.run(
+            ["git", *args], cwd=self.repo, check=True, stdout=subprocess.PIPE, text=True
+        ).stdout.strip()
+
+    def _write(self, name, text):
+        with open(os.path.join(self.repo, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_interdiff_covers_only_new_changes(self):
+        from gwtlib import watermarks
+
+        self._write("a.txt", "two\n")
+        first = watermarks.snapshot("uncommitted")
+        key = watermarks.watermark_key("main", "uncommitted")
+        watermarks.record(self.repo, key, first, "h1", now=100)
+
+        self._write("b.txt", "new\n")
+        self._git("add", "b.txt")
+        current = watermarks.snapshot("uncommitted")
+        mark = watermarks.load(self.repo)[key]
+        self.assertEqual(mark["at"], 100)
+
+        tree, reason = watermarks.interdiff_base(mark, current)
+        self.assertIsNone(reason)
+        names = self._git("diff", "--name-only", tree, current["tree"]).splitlines()
+        self.assertEqual(names, ["b.txt"])
+
+    def test_rewritten_history_falls_back(self):
+        from gwtlib import watermarks
+
+        self._write("a.txt", "two\n")
+        self._git("commit", "-qam", "two")
+        mark = watermarks.snapshot("uncommitted")
+        self._git("commit", "-q", "--amend", "-m", "two, amended")
+
+        self.assertEqual(watermarks.interdiff_base(mark, watermarks.snapshot("uncommitted")), (None, "rewritten"))
+        self.assertEqual(watermarks.interdiff_base(None, mark), (None, "none"))
+        gone = dict(mark, tree="0" * 40)
+        self.assertEqual(watermarks.interdiff_base(gone, mark), (None, "gone"))
+
+    def test_moved_base_falls_back(self):
+        from gwtlib import watermarks
+
+        self._git("checkout", "-q", "-b", "feat")
+        self._write("b.txt", "feat\n")
+        self._git("add", "b.txt")
+        self._git("commit", "-q", "-m", "feat")
+        mark = watermarks.snapshot("branch", "main")
+        self.assertEqual(watermarks.interdiff_base(mark, watermarks.snapshot("branch", "main")), (mark["tree"], None))
+
+        self._git("checkout", "-q", "main")
+        self._write("c.txt", "main\n")
+        self._git("add", "c.txt")
+        self._git("commit", "-q", "-m", "main moved")
+        self._git("checkout", "-q", "feat")
+        self._git("merge", "-q", "--no-edit", "main")
+        current = watermarks.snapshot("branch", "main")
+        self.assertEqual(watermarks.interdiff_base(mark, current), (None, "base_moved"))
+
+    def test_staged_snapshot_ignores_worktree(self):
+        from gwtlib import watermarks
+
+        self._write("a.txt", "staged\n")
+        self._git("add", "a.txt")
+        staged = watermarks.snapshot("staged")
+        self._write("a.txt", "unstaged\n")
+        self.assertEqual(watermarks.snapshot("staged")["tree"], staged["tree"])
+        self.assertNotEqual(watermarks.snapshot("uncommitted")["tree"], staged["tree"])
+
+
+if __name__ == "__main__":
+    unittest.main()
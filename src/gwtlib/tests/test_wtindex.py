@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Tests for the worktree metadata index."""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+
+class TestWorktreeIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.common = self.tmp.name
+        self.main = os.path.join(self.tmp.name, "main")
+        self.feat = os.path.join(self.tmp.name, "wt", "feat")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _wt(self, path, branch, head="a" * 40):
+        return {"path": path, "branch": branch, "head": head}
+
+    def test_created_then_reconciled(self):
+        from gwtlib import wtindex
+
+        wtindex.record_created(self.common, self.feat, "feat", "main", now=100.0)
+        wtindex.record_size(self.common, self.feat, 2048)
+        rows = wtindex.reconcile(self.common, [self._wt(self.main, "main"), self._wt(self.feat, "feat", "b" * 40)])
+
+        self.assertEqual(list(rows), [os.path.normpath(self.main), os.path.normpath(self.feat)])
+        feat = rows[os.path.normpath(self.feat)]
+        self.assertEqual((feat["base"], feat["created_at"], feat["size_bytes"]), ("main", 100.0, 2048))
+        self.assertEqual(feat["head"], "b" * 40)
+        self.assertIsNone(rows[os.path.normpath(self.main)]["base"])
+
+    def test_reconcile_drops_removed_worktrees(self):
+        from gwtlib import wtindex
+
+        wtindex.record_created(self.common, self.feat, "feat", "main")
+        wtindex.record_dirty(self.common, {self.feat: True})
+        rows = wtindex.reconcile(self.common, [self._wt(self.main, "main")])
+        self.assertNotIn(os.path.normpath(self.feat), rows)
+
+        wtindex.record_created(self.common, self.feat, "feat", "main")
+        wtindex.record_removed(self.common, self.feat)
+        self.assertEqual(list(wtindex.reconcile(self.common, [])), [])
+
+    def test_fork_point_dropped_on_branch_switch(self):
+        from gwtlib import wtindex
+
+        wtindex.record_created(self.common, self.feat, "feat", "main", "c" * 40)
+        wtindex.reconcile(self.common, [self._wt(self.feat, "feat")])
+        self.assertEqual(wtindex.fork_points(self.common), {os.path.normpath(self.feat): "c" * 40})
+        wtindex.reconcile(self.common, [self._wt(self.feat, "other")])
+        self.assertEqual(wtindex.fork_points(self.common), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Fast worktree removal
+
+`gwt remove --fast` renames the worktree directory into a `.gwt-trash/`
+folder next to it (same filesystem, so the rename is atomic) and moves git's
+admin dir (`.git/worktrees/<name>`) into `<common-dir>/gwt-trash/`. Git forgets
+the worktree immediately and its branch is free again; a detached
+`gwt trash empty` then deletes the trees with parallel unlink workers.
+"""
+
+import os
+import stat
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+TRASH_DIR_NAME = ".gwt-trash"
+ADMIN_TRASH_NAME = "gwt-trash"
+ROOTS_FILE = "roots"
+
+
+def _admin_trash(common_dir):
+    return os.path.join(common_dir, ADMIN_TRASH_NAME)
+
+
+def read_worktree_gitdir(path):
+    """Returns the admin dir a linked worktree's `.git` file points at, or None."""
+    dot_git = os.path.join(path, ".git")
+    if not os.path.isfile(dot_git):
+        return None
+    try:
+        with open(dot_git, "r", encoding="utf-8") as f:
+            line = f.readline().strip()
+    except OSError:
+        return None
+    if not line.startswith("gitdir:"):
+        return None
+    gitdir = line[len("gitdir:"):].strip()
+    return os.path.normpath(os.path.join(path, gitdir))
+
+
+def _register_root(common_dir, root):
+    admin_trash = _admin_trash(common_dir)
+    os.makedirs(admin_trash, exist_ok=True)
+    roots = trash_roots(common_dir)
+    if root in roots:
+        return
+    with open(os.path.join(admin_trash, ROOTS_FILE), "a", encoding="utf-8") as f:
+        f.write(root + "\n")
+
+
+def trash_roots(common_dir):
+    """All trash folders known to this repository (admin trash first)."""
+    admin_trash = _admin_trash(common_dir)
+    roots = [admin_trash]
+    try:
+        with open(os.path.join(admin_trash, ROOTS_FILE), "r", encoding="utf-8") as f:
+            roots.extend(line.strip() for line in f if line.strip())
+    except OSError:
+        pass
+    return roots
+
+
+def trash_entries(common_dir):
+    """Lists pending trash entries as paths."""
+    entries = []
+    for root in trash_roots(common_dir):
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.name != ROOTS_FILE:
+                        entries.append(entry.path)
+        except OSError:
+            continue
+    return sorted(entries)
+
+
+def trash_worktree(path, common_dir):
+    """Detaches a linked worktree from git by renaming it into the trash.
+
+    Returns the trashed worktree path, or None when fast removal is not
+    possible (locked worktree, main worktree, rename refused); the caller
+    then falls back to `git worktree remove`.
+    """
+    path = os.path.normpath(os.path.abspath(path))
+    admin_dir = read_worktree_gitdir(path)
+    if not admin_dir or not os.path.isdir(admin_dir):
+        return None
+    if os.path.exists(os.path.join(admin_dir, "locked")):
+        return None
+
+    token = uuid.uuid4().hex[:8]
+    root = os.path.join(os.path.dirname(path), TRASH_DIR_NAME)
+    trashed = os.path.join(root, f"{os.path.basename(path)}-{token}")
+    admin_trashed = os.path.join(_admin_trash(common_dir), f"{os.path.basename(admin_dir)}-{token}")
+    try:
+        os.makedirs(root, exist_ok=True)
+        _register_root(common_dir, root)
+        os.rename(path, trashed)
+    except OSError:
+        return None
+    try:
+        os.rename(admin_dir, admin_trashed)
+    except OSError:
+        # Worktree is gone from disk; `git worktree prune` drops the record.
+        pass
+    return trashed
+
+
+def _scan(path, dirs, files):
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError:
+            continue
+
+
+def _unlink(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except PermissionError:
+        # Read-only files (Windows, git pack files) need write permission first.
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            os.unlink(path)
+        except OSError:
+            pass
+    except OSError:
+        pass
+
+
+def delete_tree_parallel(path, workers=0):
+    """Deletes a directory tree with parallel unlink workers.
+
+    Returns the number of files removed. Missing paths are not an error, so
+    two reapers racing on the same tree are harmless.
+    """
+    if os.path.islink(path) or os.path.isfile(path):
+        _unlink(path)
+        return 1
+    if not os.path.isdir(path):
+        return 0
+
+    dirs, files = [], []
+    _scan(path, dirs, files)
+    workers = workers or min(32, (os.cpu_count() or 4) * 2)
+    if files:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_unlink, files, chunksize=256))
+
+    # Scan order is parent-before-child; reverse it to rmdir leaves first.
+    for d in reversed(dirs):
+        try:
+            os.rmdir(d)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            try:
+                os.chmod(d, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
+                os.rmdir(d)
+            except OSError:
+                pass
+    return len(files)
+
+
+def empty_trash(common_dir, workers=0):
+    """Deletes every pending trash entry. Returns the number of entries left behind."""
+    left = 0
+    for entry in trash_entries(common_dir):
+        delete_tree_parallel(entry, workers)
+        if os.path.lexists(entry):
+            left += 1
+    for root in trash_roots(common_dir)[1:]:
+        try:
+            os.rmdir(root)
+        except OSError:
+            pass
+    return left
+
+
+def tree_size(path):
+    """Returns (files, bytes) under path without following symlinks."""
+    dirs, files = [], []
+    _scan(path, dirs, files)
+    total = 0
+    for f in files:
+        try:
+            total += os.lstat(f).st_size
+        except OSError:
+            pass
+    return len(files), total
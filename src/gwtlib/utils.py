@@ -2,15 +2,19 @@
 """GWT Utility Module
 
 This module provides common utility functions used across the GWT tool:
-- Command execution helpers
+- Command execution helpers (blocking + asyncio fan-out)
 - Git helpers
 - Shell communication
 - Terminal output formatting
 """
+import asyncio
 import os
+import signal
+import stat
 import subprocess
+import sys
 
-from gwtlib.config import GWT_CD_FILE_ENV
+from gwtlib.config import GWT_CD_FD_ENV, GWT_CD_FILE_ENV
 from gwtlib.i18n import t
 
 
@@ -37,15 +41,152 @@ def git_output(args):
     return run_cmd(cmd, capture_output=True)
 
 
+# --- Async execution engine ---
+# Independent git queries (per submodule / worktree / remote) are fanned out
+# through asyncio subprocesses, bounded by a semaphore.
+ASYNC_CMD_LIMIT = max(4, min(16, (os.cpu_count() or 2) * 2))
+
+
+def _new_group_kwargs():
+    """Start each child in its own process group so it can be killed as a whole."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _kill_process_group(proc):
+    if proc.returncode is not None:
+        return
+    try:
+        if os.name == "nt":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+
+
+async def _run_cmd_async(cmd, capture_output, cwd, timeout, ok_codes=(0,)):
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if capture_output else None,
+            stderr=subprocess.PIPE if capture_output else None,
+            **_new_group_kwargs(),
+        )
+    except OSError:
+        return None if capture_output else False
+
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        _kill_process_group(proc)
+        await proc.wait()
+        return None if capture_output else False
+    except asyncio.CancelledError:
+        _kill_process_group(proc)
+        raise
+
+    if capture_output:
+        if proc.returncode not in ok_codes:
+            return None
+        return stdout.decode("utf-8", errors="replace").strip()
+    return proc.returncode in ok_codes
+
+
+async def run_cmd_async(cmd, capture_output=False, cwd=None, timeout=None, semaphore=None, ok_codes=(0,)):
+    """Coroutine version of run_cmd().
+
+    Same return contract (stdout string / None, or bool). A timed out or
+    cancelled command has its whole process group killed. `ok_codes` lists
+    exit codes that count as success (e.g. 1 for `merge-tree` conflicts).
+    """
+    if semaphore is None:
+        return await _run_cmd_async(cmd, capture_output, cwd, timeout, ok_codes)
+    async with semaphore:
+        return await _run_cmd_async(cmd, capture_output, cwd, timeout, ok_codes)
+
+
+async def git_output_async(args, cwd=None, timeout=None, semaphore=None):
+    """Coroutine version of git_output()."""
+    return await run_cmd_async(
+        ["git"] + args, capture_output=True, cwd=cwd, timeout=timeout, semaphore=semaphore
+    )
+
+
+def gather_cmds(cmds, capture_output=True, cwd=None, timeout=None, limit=None, ok_codes=(0,)):
+    """Runs independent commands concurrently; results are returned in input order."""
+    if not cmds:
+        return []
+
+    async def _gather():
+        semaphore = asyncio.Semaphore(limit or ASYNC_CMD_LIMIT)
+        return await asyncio.gather(
+            *(
+                run_cmd_async(
+                    cmd, capture_output=capture_output, cwd=cwd, timeout=timeout, semaphore=semaphore, ok_codes=ok_codes
+                )
+                for cmd in cmds
+            )
+        )
+
+    return list(asyncio.run(_gather()))
+
+
+def git_outputs(arg_lists, cwd=None, timeout=None, limit=None, ok_codes=(0,)):
+    """Sync facade: runs many git queries concurrently and returns their outputs."""
+    return gather_cmds(
+        [["git"] + args for args in arg_lists], cwd=cwd, timeout=timeout, limit=limit, ok_codes=ok_codes
+    )
+
+
+def _write_cd_fd(value, path):
+    """Writes `path` to the wrapper's inherited pipe; False if it is not usable."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+
+            fd = msvcrt.open_osfhandle(int(value), os.O_WRONLY)
+        else:
+            fd = int(value)
+            # Guard against a stale variable pointing at some unrelated descriptor.
+            if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+                return False
+        os.write(fd, (path + "\n").encode("utf-8"))
+        return True
+    except (ValueError, OSError):
+        return False
+
+
 def request_cd(path):
-    """Writes the target directory to the communication file for the shell wrapper."""
+    """Hands the target directory to the shell wrapper.
+
+    Prefers the pipe advertised in GWT_CD_FD (no temp file, read with shell
+    builtins); falls back to the GWT_CD_FILE temp file.
+    """
+    cd_fd = os.environ.get(GWT_CD_FD_ENV)
     cd_file = os.environ.get(GWT_CD_FILE_ENV)
+    if cd_fd and _write_cd_fd(cd_fd, path):
+        cd_file = None
     if cd_file:
         try:
             with open(cd_file, "w", encoding="utf-8") as f:
                 f.write(path)
         except Exception as e:
             print(f"❌ Error writing to CD file: {e}")
+    _record_frecency(path)
+
+
+def _record_frecency(path):
+    """Best effort: a broken index must never block a jump."""
+    try:
+        from gwtlib.frecency import record_visit
+
+        record_visit(path)
+    except Exception:
+        pass
 
 
 def get_main_worktree():
@@ -56,11 +197,153 @@ def get_main_worktree():
     return None
 
 
+def get_git_common_dir(cwd=None):
+    """Returns the absolute path of the repository's common git dir (shared by all worktrees)."""
+    args = ["rev-parse", "--git-common-dir"]
+    if cwd:
+        args = ["-C", cwd] + args
+    out = git_output(args)
+    if not out:
+        return None
+    return os.path.normpath(os.path.join(cwd or os.getcwd(), out))
+
+
+def _read_gitfile(dot_git):
+    try:
+        with open(dot_git, "r", encoding="utf-8") as f:
+            line = f.readline().strip()
+    except OSError:
+        return None
+    if not line.startswith("gitdir:"):
+        return None
+    return os.path.normpath(os.path.join(os.path.dirname(dot_git), line[len("gitdir:"):].strip()))
+
+
+def find_git_dirs(start):
+    """Walks up from `start` to the enclosing worktree without running git.
+
+    Returns (worktree_root, git_dir, common_dir) or None.
+    """
+    current = os.path.normpath(os.path.abspath(start))
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return current, dot_git, dot_git
+        if os.path.isfile(dot_git):
+            git_dir = _read_gitfile(dot_git)
+            if not git_dir:
+                return None
+            common_dir = git_dir
+            try:
+                with open(os.path.join(git_dir, "commondir"), "r", encoding="utf-8") as f:
+                    common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+            except OSError:
+                pass
+            return current, git_dir, common_dir
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def get_worktree_root(repo_root, config, ensure_gitignore=False):
+    """Resolves the configured `worktreeDir` template to an absolute directory."""
+    worktree_dir_template = config.get("worktreeDir", ".worktree")
+
+    # Get repository name for path template
+    repo_name = os.path.basename(repo_root)
+    worktree_dir_name = worktree_dir_template.format(repo_name=repo_name, sep=os.sep)
+
+    # Handle relative paths starting with ../ (place worktree outside repo)
+    if worktree_dir_name.startswith(".." + os.sep) or worktree_dir_name.startswith("../"):
+        return os.path.normpath(os.path.join(repo_root, worktree_dir_name))
+
+    if ensure_gitignore:
+        ensure_worktree_gitignore(repo_root, worktree_dir_name)
+    return os.path.join(repo_root, worktree_dir_name)
+
+
+# Pre-warmed pool slots live here, under the worktree directory.
+POOL_DIR_NAME = ".gwt-pool"
+
+
+def is_pool_worktree(path):
+    """True for worktrees that are idle pool slots (hidden from cd/remove)."""
+    parts = os.path.normpath(path).replace("\\", "/").split("/")
+    return POOL_DIR_NAME in parts
+
+
+def spawn_gwt_background(argv, cwd=None):
+    """Starts `gwt <argv>` detached from the terminal (fire and forget)."""
+    gwt_script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "gwt.py")
+    env = os.environ.copy()
+    # Background jobs must never steer the parent shell.
+    env.pop(GWT_CD_FILE_ENV, None)
+    env.pop(GWT_CD_FD_ENV, None)
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    try:
+        subprocess.Popen(
+            [sys.executable, gwt_script] + list(argv),
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+        return True
+    except OSError:
+        return False
+
+
 def is_inside_worktree():
     """Check if we're inside a git worktree."""
     return git_output(["rev-parse", "--is-inside-work-tree"]) == "true"
 
 
+def list_worktrees():
+    """Parses `git worktree list --porcelain` into a list of dicts.
+
+    Keys: path, head, branch (short name or None), detached, locked, prunable, bare.
+    """
+    output = git_output(["worktree", "list", "--porcelain"])
+    worktrees = []
+    current = None
+    for line in (output or "").splitlines():
+        if line.startswith("worktree "):
+            current = {
+                "path": line[9:],
+                "head": "",
+                "branch": None,
+                "detached": False,
+                "locked": False,
+                "prunable": False,
+                "bare": False,
+            }
+            worktrees.append(current)
+        elif current is None:
+            continue
+        elif line.startswith("HEAD "):
+            current["head"] = line[5:]
+        elif line.startswith("branch "):
+            ref = line[7:]
+            current["branch"] = ref[11:] if ref.startswith("refs/heads/") else ref
+        elif line == "detached":
+            current["detached"] = True
+        elif line == "bare":
+            current["bare"] = True
+        elif line.startswith("locked"):
+            current["locked"] = True
+        elif line.startswith("prunable"):
+            current["prunable"] = True
+    return worktrees
+
+
 def get_branch_worktree(branch_name):
     """检查分支是否已被 worktree 使用，返回使用该分支的 worktree 路径，否则返回 None"""
     output = git_output(["worktree", "list", "--porcelain"])
@@ -81,6 +364,27 @@ def get_branch_worktree(branch_name):
     return None
 
 
+def format_size(num_bytes):
+    """Human readable byte count (1.5 GB)."""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if abs(size) < 1024 or unit == "TB":
+            break
+        size /= 1024
+    if unit == "B":
+        return f"{int(size)} B"
+    return f"{size:.1f} {unit}"
+
+
+def format_age(seconds):
+    """Compact relative age (45s, 12m, 5h, 3d, 7w)."""
+    seconds = max(0, int(seconds))
+    for unit, span in (("w", 604800), ("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= span:
+            return f"{seconds // span}{unit}"
+    return f"{seconds}s"
+
+
 def print_colored(text, color_code, bold=False):
     """Simple ANSI color printer.
     
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""File system change notification for `gwt status --watch`
+
+`RepoWatcher.wait()` blocks until something changed and returns the set of
+repository roots (main worktree and submodules) that need re-querying.
+
+On Linux it uses inotify through a small ctypes binding: every repository's
+git dir is watched for `index` / `HEAD` updates, and each non-ignored
+directory of its working tree for file writes, creates, deletes and renames
+(directories created later are added on the fly). Events are attributed to
+the innermost repository, so a save inside a submodule only re-queries that
+submodule. Ignored paths are neither watched nor reported: new directories
+and changed files are run through `git check-ignore` (once per burst) first.
+While idle the watcher sits in select() and uses no CPU.
+
+Without inotify (other platforms, or when the watch limit
+fs.inotify.max_user_watches is exhausted, at startup or later) it falls back
+to polling each repository's `git status` every POLL_INTERVAL seconds.
+
+Bursts of events (a branch switch, a formatter run) are debounced: after the
+first event, wait() keeps collecting until DEBOUNCE seconds pass quietly or
+MAX_DELAY is reached.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import subprocess
+import time
+
+from gwtlib.utils import git_outputs
+
+DEBOUNCE = 0.1
+MAX_DELAY = 0.4
+POLL_INTERVAL = 2.0
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WORKTREE_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+GIT_DIR_MASK = IN_MOVED_TO | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE
+# Files in a git dir whose change means the status changed (written via *.lock + rename).
+GIT_DIR_FILES = ("index", "HEAD")
+
+_EVENT = struct.Struct("iIII")
+
+
+def parse_events(buf):
+    """[(wd, mask, name)] from a buffer read off an inotify fd."""
+    events = []
+    offset = 0
+    while offset + _EVENT.size <= len(buf):
+        wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+        offset += _EVENT.size
+        name = buf[offset:offset + length].rstrip(b"\0")
+        offset += length
+        events.append((wd, mask, os.fsdecode(name)))
+    return events
+
+
+class Inotify:
+    """Minimal inotify binding (Linux); raises OSError where unavailable."""
+
+    def __init__(self):
+        if not hasattr(os, "uname") or os.uname().sysname != "Linux":
+            raise OSError(errno.ENOSYS, "inotify is Linux only")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        try:
+            self._add_watch = libc.inotify_add_watch
+            init = libc.inotify_init1
+        except AttributeError:
+            raise OSError(errno.ENOSYS, "libc has no inotify")
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = init(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.paths = {}
+
+    def add(self, path, mask):
+        wd = self._add_watch(self.fd, os.fsencode(path), mask | IN_ONLYDIR)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        self.paths[wd] = path
+        return wd
+
+    def read(self):
+        """[(directory, mask, name)] for the pending events; [] if none."""
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        for wd, mask, name in parse_events(buf):
+            if mask & IN_IGNORED:
+                self.paths.pop(wd, None)
+                continue
+            events.append((self.paths.get(wd), mask, name))
+        return events
+
+    def fileno(self):
+        return self.fd
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def _ignored_dirs(root):
+    """Absolute paths of ignored directories in `root` (not worth watching)."""
+    out = git_outputs([["-C", root, "ls-files", "-z", "--others", "--ignored", "--exclude-standard", "--directory"]])[0]
+    return {os.path.normpath(os.path.join(root, p)) for p in (out or "").split("\0") if p.endswith("/")}
+
+
+def _check_ignored(root, paths):
+    """The subset of `paths` (absolute, inside `root`) that git ignores."""
+    if not paths:
+        return set()
+    try:
+        out = subprocess.run(
+            ["git", "-C", root, "check-ignore", "--stdin", "-z"],
+            input="\0".join(paths) + "\0", stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        ).stdout
+    except OSError:
+        return set()
+    return {os.path.normpath(os.path.join(root, p)) for p in out.split("\0") if p}
+
+
+class RepoWatcher:
+    """Watches repositories {root: git_dir}; wait() returns the roots that changed."""
+
+    def __init__(self, repos, use_inotify=True, poll_interval=POLL_INTERVAL):
+        self.repos = {os.path.normpath(root): git_dir for root, git_dir in repos.items()}
+        self.poll_interval = poll_interval
+        self._owner = {}
+        self._git_dirs = {}
+        self._inotify = None
+        self._signatures = None
+        if use_inotify:
+            try:
+                self._inotify = Inotify()
+                self._watch_all()
+            except OSError:
+                if self._inotify:
+                    self._inotify.close()
+                self._inotify = None
+        if self._inotify is None:
+            self._signatures = self._poll_signatures(list(self.repos))
+
+    @property
+    def backend(self):
+        return "inotify" if self._inotify else "polling"
+
+    def close(self):
+        if self._inotify:
+            self._inotify.close()
+
+    # --- inotify ---
+
+    def _watch_all(self):
+        for root, git_dir in self.repos.items():
+            # A git dir already claimed by another repo (e.g. an uninitialized
+            # submodule resolving to the superproject's) stays with the first.
+            if git_dir and os.path.normpath(git_dir) not in self._git_dirs:
+                self._inotify.add(git_dir, GIT_DIR_MASK)
+                self._git_dirs[os.path.normpath(git_dir)] = root
+            self._watch_tree(root, root, _ignored_dirs(root))
+
+    def _watch_tree(self, top, owner, ignored=()):
+        for dirpath, dirnames, _ in os.walk(top):
+            self._inotify.add(dirpath, WORKTREE_MASK)
+            self._owner[dirpath] = owner
+            # Nested repositories (submodules) are watched as their own.
+            dirnames[:] = [
+                d for d in dirnames
+                if d != ".git"
+                and os.path.join(dirpath, d) not in ignored
+                and os.path.join(dirpath, d) not in self.repos
+            ]
+
+    def _changed_inotify(self, events):
+        changed = set()
+        pending = {}
+        for directory, mask, name in events:
+            if mask & IN_Q_OVERFLOW:
+                return set(self.repos)
+            if directory in self._git_dirs:
+                if name in GIT_DIR_FILES:
+                    changed.add(self._git_dirs[directory])
+                continue
+            owner = self._owner.get(directory)
+            if owner is None or name == ".git":
+                continue
+            pending.setdefault(owner, []).append((os.path.join(directory, name), mask))
+
+        for owner, items in pending.items():
+            ignored = _check_ignored(owner, sorted({path for path, _ in items}))
+            for path, mask in items:
+                if path in ignored:
+                    continue
+                changed.add(owner)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and path not in self.repos:
+                    try:
+                        self._watch_tree(path, owner, _ignored_dirs(path))
+                    except OSError as e:
+                        if e.errno == errno.ENOSPC:
+                            # Out of watches: a partial view would miss changes.
+                            self._fall_back_to_polling()
+                            return set(self.repos)
+        return changed
+
+    def _fall_back_to_polling(self):
+        self._inotify.close()
+        self._inotify = None
+        self._signatures = self._poll_signatures(list(self.repos))
+
+    def _wait_inotify(self, timeout):
+        fd = self._inotify.fileno()
+        if not select.select([fd], [], [], timeout)[0]:
+            return set()
+        changed = set()
+        deadline = time.monotonic() + MAX_DELAY
+        while True:
+            changed |= self._changed_inotify(self._inotify.read())
+            if self._inotify is None:
+                return changed
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], min(DEBOUNCE, remaining))[0]:
+                return changed
+
+    # --- polling ---
+
+    def _poll_signatures(self, roots):
+        queries = []
+        for root in roots:
+            queries.append(["-C", root, "rev-parse", "HEAD"])
+            queries.append(["-C", root, "status", "--porcelain", "-z", "--ignore-submodules=dirty"])
+        out = git_outputs(queries)
+        return {root: (out[2 * i], out[2 * i + 1]) for i, root in enumerate(roots)}
+
+    def _wait_polling(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            pause = self.poll_interval if deadline is None else min(self.poll_interval, deadline - time.monotonic())
+            if pause > 0:
+                time.sleep(pause)
+            current = self._poll_signatures(list(self.repos))
+            changed = {root for root, sig in current.items() if sig != self._signatures.get(root)}
+            self._signatures = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def wait(self, timeout=None):
+        """Blocks until a change (or `timeout` seconds); returns the changed roots."""
+        if self._inotify:
+            return self._wait_inotify(timeout)
+        return self._wait_polling(timeout)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Review watermarks for `gwt review --since-last`
+
+After each successful review the reviewed state is recorded in
+`<worktree>/.gwt/review_watermarks.json`, keyed by branch and review mode:
+
+- uncommitted: tree of the working tree (`git stash create`, HEAD's tree if clean)
+- staged: tree of the index (`git write-tree`)
+- branch: tree of HEAD (plus the oid of the branch compared against)
+
+together with HEAD and a hash of the diff that was sent. The next review
+with `--since-last` diffs the recorded tree against the current one, i.e.
+only what changed since. When HEAD is no longer a descendant of the recorded
+HEAD (rebase, amend, reset), the branch compared against moved (merging it
+in would make all of its changes look new) or the recorded tree was
+garbage-collected, the interdiff would be noise and the full diff is used
+instead.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from gwtlib.config import GWT_CONFIG_DIR
+from gwtlib.utils import git_output
+
+WATERMARK_FILE = "review_watermarks.json"
+# Modes whose reviewed state can be captured as a tree.
+WATERMARK_MODES = ("uncommitted", "staged", "branch")
+
+
+def get_watermark_path(root):
+    return os.path.join(root, GWT_CONFIG_DIR, WATERMARK_FILE)
+
+
+def watermark_key(branch, mode, base=None):
+    return f"{branch or 'HEAD'}|{mode}|{base or ''}"
+
+
+def snapshot(mode, base=None):
+    """Captures the state a review of `mode` looks at; None if it cannot be read."""
+    head = git_output(["rev-parse", "--verify", "--quiet", "HEAD"])
+    if not head:
+        return None
+    snap = {"head": head, "base": None}
+    if mode == "uncommitted":
+        # A stash commit without touching the stash ref or the working tree.
+        stash = git_output(["stash", "create"])
+        snap["tree"] = git_output(["rev-parse", f"{stash or head}^{{tree}}"])
+    elif mode == "staged":
+        snap["tree"] = git_output(["write-tree"])
+    elif mode == "branch":
+        snap["base"] = git_output(["rev-parse", "--verify", "--quiet", f"{base}^{{commit}}"])
+        snap["tree"] = git_output(["rev-parse", f"{head}^{{tree}}"])
+    else:
+        return None
+    return snap if snap["tree"] else None
+
+
+def load(root):
+    try:
+        with open(get_watermark_path(root), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def record(root, key, snap, diff_hash, now=None):
+    data = load(root)
+    data[key] = dict(snap, diff_hash=diff_hash, at=now or time.time())
+    path = get_watermark_path(root)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def interdiff_base(mark, current):
+    """Tree to diff `current` against, or (None, reason) when the full diff is needed.
+
+    reason: "none" (no watermark), "gone" (objects pruned), "rewritten"
+    (HEAD no longer descends from the recorded HEAD), "base_moved" (branch
+    mode: the compared branch points elsewhere).
+    """
+    if not mark or not mark.get("tree") or not mark.get("head"):
+        return None, "none"
+    if git_output(["cat-file", "-e", f"{mark['tree']}^{{tree}}"]) is None:
+        return None, "gone"
+    if git_output(["merge-base", "--is-ancestor", mark["head"], current["head"]]) is None:
+        return None, "rewritten"
+    if mark.get("base") != current.get("base"):
+        return None, "base_moved"
+    return mark["tree"], None
+
+
+def diff_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Worktree metadata index
+
+A small SQLite file in the repository's common git dir
+(`.git/gwt-index.sqlite`) records, per worktree: branch, base, fork point
+(where the branch met main when it was created), creation time, last use,
+cached size and dirty flag. `gwt new/remove/cd/prune` update it;
+`reconcile()` repairs it from `git worktree list --porcelain` so worktrees
+created or removed outside gwt still show up correctly.
+"""
+
+import os
+import sqlite3
+import time
+
+INDEX_FILE = "gwt-index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS worktrees (
+    path TEXT PRIMARY KEY,
+    branch TEXT,
+    head TEXT,
+    base TEXT,
+    created_at REAL,
+    last_used REAL,
+    size_bytes INTEGER,
+    size_at REAL,
+    dirty INTEGER,
+    dirty_at REAL,
+    fork_point TEXT
+);
+"""
+
+COLUMNS = (
+    "path", "branch", "head", "base", "created_at", "last_used", "size_bytes", "size_at", "dirty", "dirty_at", "fork_point",
+)
+
+
+def get_index_path(common_dir):
+    return os.path.join(common_dir, INDEX_FILE)
+
+
+def connect(common_dir):
+    conn = sqlite3.connect(get_index_path(common_dir), timeout=5)
+    conn.executescript(_SCHEMA)
+    # Indexes written before the fork_point column existed.
+    if "fork_point" not in {row[1] for row in conn.execute("PRAGMA table_info(worktrees)")}:
+        with conn:
+            conn.execute("ALTER TABLE worktrees ADD COLUMN fork_point TEXT")
+    return conn
+
+
+def _norm(path):
+    return os.path.normpath(os.path.abspath(path))
+
+
+def _update(common_dir, sql, params):
+    conn = connect(common_dir)
+    try:
+        with conn:
+            conn.execute(sql, params)
+    finally:
+        conn.close()
+
+
+def record_created(common_dir, path, branch, base=None, fork_point=None, now=None):
+    now = now or time.time()
+    _update(
+        common_dir,
+        "INSERT OR REPLACE INTO worktrees (path, branch, base, fork_point, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+        (_norm(path), branch, base, fork_point, now, now),
+    )
+
+
+def record_removed(common_dir, path):
+    _update(common_dir, "DELETE FROM worktrees WHERE path = ?", (_norm(path),))
+
+
+def record_used(common_dir, path, now=None):
+    _update(common_dir, "UPDATE worktrees SET last_used = ? WHERE path = ?", (now or time.time(), _norm(path)))
+
+
+def record_dirty(common_dir, states, now=None):
+    """states: {path: bool}"""
+    now = now or time.time()
+    conn = connect(common_dir)
+    try:
+        with conn:
+            conn.executemany(
+                "UPDATE worktrees SET dirty = ?, dirty_at = ? WHERE path = ?",
+                [(int(dirty), now, _norm(path)) for path, dirty in states.items()],
+            )
+    finally:
+        conn.close()
+
+
+def record_size(common_dir, path, size_bytes, now=None):
+    _update(
+        common_dir,
+        "UPDATE worktrees SET size_bytes = ?, size_at = ? WHERE path = ?",
+        (int(size_bytes), now or time.time(), _norm(path)),
+    )
+
+
+def fork_points(common_dir):
+    """{path: oid} recorded by record_created(); worktrees gwt did not create are missing."""
+    conn = connect(common_dir)
+    try:
+        return dict(conn.execute("SELECT path, fork_point FROM worktrees WHERE fork_point IS NOT NULL"))
+    finally:
+        conn.close()
+
+
+def _guess_created(path):
+    """Creation time for linked worktrees gwt did not create: mtime of its `.git` file."""
+    dot_git = os.path.join(path, ".git")
+    if not os.path.isfile(dot_git):
+        return None
+    try:
+        return os.stat(dot_git).st_mtime
+    except OSError:
+        return None
+
+
+def reconcile(common_dir, worktrees):
+    """Makes the index match `worktrees` (dicts from list_worktrees()).
+
+    Missing worktrees are added, vanished ones dropped, branch/head refreshed.
+    Returns {path: row dict} for the current worktrees in the given order.
+    """
+    conn = connect(common_dir)
+    try:
+        with conn:
+            rows = {row[0]: dict(zip(COLUMNS, row)) for row in conn.execute(f"SELECT {', '.join(COLUMNS)} FROM worktrees")}
+            current = []
+            for wt in worktrees:
+                path = _norm(wt["path"])
+                current.append(path)
+                if path in rows:
+                    row = rows[path]
+                    if row["branch"] != wt.get("branch"):
+                        # Another branch checked out: the recorded fork point was the old one's.
+                        conn.execute("UPDATE worktrees SET fork_point = NULL WHERE path = ?", (path,))
+                        row["fork_point"] = None
+                    if row["branch"] != wt.get("branch") or row["head"] != wt.get("head"):
+                        conn.execute(
+                            "UPDATE worktrees SET branch = ?, head = ? WHERE path = ?",
+                            (wt.get("branch"), wt.get("head"), path),
+                        )
+                        row["branch"], row["head"] = wt.get("branch"), wt.get("head")
+                else:
+                    row = dict.fromkeys(COLUMNS)
+                    row.update(path=path, branch=wt.get("branch"), head=wt.get("head"), created_at=_guess_created(path))
+                    conn.execute(
+                        "INSERT INTO worktrees (path, branch, head, created_at) VALUES (?, ?, ?, ?)",
+                        (path, row["branch"], row["head"], row["created_at"]),
+                    )
+                    rows[path] = row
+            for path in set(rows) - set(current):
+                conn.execute("DELETE FROM worktrees WHERE path = ?", (path,))
+    finally:
+        conn.close()
+    return {path: rows[path] for path in current}